@@ -11,6 +11,7 @@ Ce module fournit:
 
 import numpy as np
 import pandas as pd
+from functools import cached_property
 from typing import Dict, List
 from scipy import stats
 from monitoring.logger import setup_logger
@@ -41,6 +42,28 @@ class SymbolAnalyzer:
 
         logger.info(f"SymbolAnalyzer initialisé avec {len(self.symbols)} symboles")
 
+    def _column(self, key: str, dtype) -> np.ndarray:
+        """
+        Extrait une métrique de tous les symboles dans un tableau typé
+
+        Args:
+            key: Clé de la métrique dans les résultats
+            dtype: Type numpy de la colonne
+
+        Returns:
+            ndarray (même ordre que self.symbols)
+        """
+        return np.fromiter(
+            (self.symbol_results[s][key] for s in self.symbols),
+            dtype=dtype,
+            count=len(self.symbols),
+        )
+
+    @cached_property
+    def _pnls(self) -> np.ndarray:
+        """P&L absolu par symbole (même ordre que self.symbols)"""
+        return self._column("absolute_pnl", np.float64)
+
     def get_metrics_dataframe(self) -> pd.DataFrame:
         """
         Retourne un DataFrame avec toutes les métriques par symbole
@@ -48,24 +71,20 @@ class SymbolAnalyzer:
         Returns:
             DataFrame avec une ligne par symbole et colonnes de métriques
         """
-        rows = []
-
-        for symbol, results in self.symbol_results.items():
-            row = {
-                "symbol": symbol,
-                "allocated_capital": results["allocated_capital"],
-                "weight": results["weight"],
-                "return_pct": results["total_return"],
-                "sharpe_ratio": results["sharpe_ratio"],
-                "max_drawdown": results["max_drawdown"],
-                "total_trades": results["total_trades"],
-                "win_rate": results["win_rate"],
-                "absolute_pnl": results["absolute_pnl"],
-                "final_value": results["final_value"],
+        df = pd.DataFrame(
+            {
+                "symbol": np.asarray(self.symbols, dtype=object),
+                "allocated_capital": self._column("allocated_capital", np.float64),
+                "weight": self._column("weight", np.float32),
+                "return_pct": self._column("total_return", np.float64),
+                "sharpe_ratio": self._column("sharpe_ratio", np.float64),
+                "max_drawdown": self._column("max_drawdown", np.float64),
+                "total_trades": self._column("total_trades", np.int32),
+                "win_rate": self._column("win_rate", np.float32),
+                "absolute_pnl": self._column("absolute_pnl", np.float64),
+                "final_value": self._column("final_value", np.float64),
             }
-            rows.append(row)
-
-        df = pd.DataFrame(rows)
+        )
 
         # Trier par return décroissant
         df = df.sort_values("return_pct", ascending=False).reset_index(drop=True)
@@ -265,30 +284,26 @@ class SymbolAnalyzer:
         Returns:
             DataFrame avec métriques de risque ajusté
         """
-        rows = []
+        ret = self._column("total_return", np.float64)
+        dd = np.abs(self._column("max_drawdown", np.float64))
 
-        for symbol, results in self.symbol_results.items():
-            ret = results["total_return"]
-            dd = abs(results["max_drawdown"])
-            sharpe = results["sharpe_ratio"]
-
-            # Calmar Ratio = Return / Max Drawdown
-            calmar = ret / dd if dd > 0 else 0
+        # Calmar Ratio = Return / Max Drawdown
+        safe_dd = np.where(dd > 0, dd, 1.0)
+        calmar = np.where(dd > 0, ret / safe_dd, 0.0)
 
-            # Return-to-Drawdown ratio
-            ret_to_dd = ret / dd if dd > 0 else 0
+        # Return-to-Drawdown ratio
+        ret_to_dd = np.where(dd > 0, ret / safe_dd, 0.0)
 
-            row = {
-                "symbol": symbol,
+        df = pd.DataFrame(
+            {
+                "symbol": np.asarray(self.symbols, dtype=object),
                 "return": ret,
-                "sharpe_ratio": sharpe,
+                "sharpe_ratio": self._column("sharpe_ratio", np.float64),
                 "calmar_ratio": calmar,
                 "return_to_dd": ret_to_dd,
                 "max_drawdown": dd,
             }
-            rows.append(row)
-
-        df = pd.DataFrame(rows)
+        )
         df = df.sort_values("sharpe_ratio", ascending=False).reset_index(drop=True)
 
         return df
@@ -300,29 +315,28 @@ class SymbolAnalyzer:
         Returns:
             DataFrame avec métriques d'efficacité
         """
-        rows = []
-
-        for symbol, results in self.symbol_results.items():
-            trades = results["total_trades"]
-            win_rate = results["win_rate"]
-            pnl = results["absolute_pnl"]
-
-            # P&L moyen par trade
-            avg_pnl_per_trade = pnl / trades if trades > 0 else 0
+        trades = self._column("total_trades", np.int32)
+        win_rate = self._column("win_rate", np.float32)
+        pnl = self._column("absolute_pnl", np.float64)
+
+        # P&L moyen par trade
+        has_trades = trades > 0
+        avg_pnl_per_trade = np.where(
+            has_trades, pnl / np.where(has_trades, trades, 1), 0.0
+        )
 
-            # Efficacité = (Win Rate / 100) * avg_pnl_per_trade
-            efficiency = (win_rate / 100) * avg_pnl_per_trade if trades > 0 else 0
+        # Efficacité = (Win Rate / 100) * avg_pnl_per_trade
+        efficiency = np.where(has_trades, (win_rate / 100) * avg_pnl_per_trade, 0.0)
 
-            row = {
-                "symbol": symbol,
+        df = pd.DataFrame(
+            {
+                "symbol": np.asarray(self.symbols, dtype=object),
                 "total_trades": trades,
                 "win_rate": win_rate,
                 "avg_pnl_per_trade": avg_pnl_per_trade,
                 "efficiency_score": efficiency,
             }
-            rows.append(row)
-
-        df = pd.DataFrame(rows)
+        )
         df = df.sort_values("efficiency_score", ascending=False).reset_index(drop=True)
 
         return df
@@ -392,15 +406,11 @@ class SymbolAnalyzer:
         # Contributions P&L
         logger.info("\n💰 CONTRIBUTIONS AU P&L")
         logger.info("-" * 80)
-        contributions = self.calculate_pnl_contributions()
-        for symbol in sorted(
-            self.symbols, key=lambda s: contributions[s]["percentage"], reverse=True
-        ):
-            contrib = contributions[symbol]
-            logger.info(
-                f"{symbol:6s}: {contrib['percentage']:>6.1f}%  "
-                f"(${contrib['absolute']:>10,.2f})"
-            )
+        pnls = self._pnls
+        total_pnl = pnls.sum()
+        pct = pnls / total_pnl * 100.0 if total_pnl != 0 else np.zeros_like(pnls)
+        for i in np.argsort(-pct, kind="stable"):
+            logger.info(f"{self.symbols[i]:6s}: {pct[i]:>6.1f}%  (${pnls[i]:>10,.2f})")
 
         # Statistiques résumées
         logger.info("\n📈 STATISTIQUES RÉSUMÉES")
@@ -176,7 +176,7 @@ def validate_config():
             "Au moins une stratégie doit être activée avec du capital alloué"
         )
 
-    # Créer les dossiers nécessaires
-    config["portfolio_state"]["backup_dir"].mkdir(parents=True, exist_ok=True)
+    # Le dossier de sauvegarde est créé à la première sauvegarde
+    # (PortfolioStateManager.save_state), inutile en mode backtest
 
     return True
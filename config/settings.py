@@ -3,6 +3,7 @@ Configuration globale du système de trading
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -15,9 +16,17 @@ DATA_DIR = BASE_DIR / "data_cache"
 LOGS_DIR = BASE_DIR / "logs"
 RESULTS_DIR = BASE_DIR / "results" / "rapports_backtest"
 
+
+@lru_cache(maxsize=None)
+def ensure_dir(directory: Path) -> Path:
+    """Crée un dossier (une seule fois par processus) et le retourne"""
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
 # Créer les dossiers s'ils n'existent pas
-for directory in [DATA_DIR, LOGS_DIR, RESULTS_DIR]:
-    directory.mkdir(exist_ok=True)
+for directory in (DATA_DIR, LOGS_DIR, RESULTS_DIR):
+    ensure_dir(directory)
 
 # Mode de trading
 TRADING_MODE = os.getenv("TRADING_MODE", "backtest")  # backtest, paper, live
@@ -7,7 +7,9 @@ import pandas as pd
 import yfinance as yf
 from pathlib import Path
 from datetime import datetime
+from collections import OrderedDict
 import pickle
+import threading
 
 from config import settings
 from monitoring.logger import setup_logger
@@ -18,6 +20,17 @@ logger = setup_logger("data_handler")
 class DataHandler:
     """Gère le téléchargement et le stockage des données de marché"""
 
+    # Cache mémoire partagé entre instances, devant le cache disque:
+    # {fichier cache: (mtime du fichier, DataFrame)}. Évite de relire le même
+    # pickle quand plusieurs backtests d'un même processus demandent les mêmes
+    # données. Une entrée n'est servie que si le fichier n'a pas été réécrit
+    # ou supprimé depuis (mtime comparé à chaque lecture).
+    # LRU borné à MEMORY_CACHE_MAX_ENTRIES: les longues sessions (optimiseur,
+    # dashboard) ne gardent pas en mémoire tout ce qui a été lu.
+    MEMORY_CACHE_MAX_ENTRIES = 32
+    _memory_cache = OrderedDict()
+    _memory_cache_lock = threading.Lock()
+
     def __init__(self, data_source="yfinance", cache_enabled=True):
         self.data_source = data_source
         self.cache_enabled = cache_enabled and settings.DATA_CACHE_ENABLED
@@ -110,20 +123,59 @@ class DataHandler:
             )
             with open(cache_file, "wb") as f:
                 pickle.dump(data, f)
+            self._remember(cache_file, data.copy())
             logger.debug(f"Cache sauvegardé: {cache_file.name}")
         except Exception as e:
             logger.warning(f"Impossible de sauvegarder le cache: {e}")
 
+    @staticmethod
+    def _cache_mtime(cache_file):
+        """mtime du fichier cache (ns), None s'il n'existe pas"""
+        try:
+            return cache_file.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @classmethod
+    def _remember(cls, cache_file, data, mtime=None):
+        """Ajoute au cache mémoire, en évinçant l'entrée la moins récemment lue"""
+        if mtime is None:
+            mtime = cls._cache_mtime(cache_file)
+            if mtime is None:
+                return
+        with cls._memory_cache_lock:
+            cls._memory_cache[cache_file] = (mtime, data)
+            cls._memory_cache.move_to_end(cache_file)
+            while len(cls._memory_cache) > cls.MEMORY_CACHE_MAX_ENTRIES:
+                cls._memory_cache.popitem(last=False)
+
     def _load_from_cache(self, symbol, start_date, end_date, interval):
         """Charge les données depuis le cache"""
         try:
             cache_file = self._get_cache_filename(
                 symbol, start_date, end_date, interval
             )
-            if cache_file.exists():
+            mtime = self._cache_mtime(cache_file)
+
+            cached = None
+            with DataHandler._memory_cache_lock:
+                entry = DataHandler._memory_cache.get(cache_file)
+                if entry is not None and entry[0] == mtime:
+                    DataHandler._memory_cache.move_to_end(cache_file)
+                    cached = entry[1]
+                elif entry is not None:
+                    # Fichier réécrit ou supprimé: l'entrée est périmée
+                    del DataHandler._memory_cache[cache_file]
+            if cached is not None:
+                return cached.copy()
+
+            if mtime is not None:
                 with open(cache_file, "rb") as f:
                     data = pickle.load(f)
-                return data
+                # mtime lu avant le chargement: une réécriture concurrente
+                # invalide l'entrée à la lecture suivante
+                self._remember(cache_file, data, mtime)
+                return data.copy()
         except Exception as e:
             logger.debug(f"Cache non disponible: {e}")
 
@@ -5,177 +5,495 @@ Diagnostic RSI Strategy - Pourquoi Si Peu de Trades?
 """
 
 import sys
+from functools import lru_cache
+from multiprocessing import Pool
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-import backtrader as bt
-import pandas as pd
-import matplotlib.pyplot as plt
+import numpy as np
+from numba import njit
 
-from data.data_handler import DataHandler
-from data.data_fetcher import create_data_feed
 from monitoring.logger import setup_logger
 
 logger = setup_logger("rsi_diagnostic")
 
+# Bornes de l'histogramme RSI (intervalles fermés à droite, comme pd.cut)
+RSI_BINS = np.array([0, 20, 30, 40, 50, 60, 70, 80, 100], dtype=np.float64)
 
-class RSIDiagnostic(bt.Strategy):
-    """Stratégie RSI avec diagnostic détaillé"""
 
-    params = (
-        ("rsi_period", 10),
-        ("rsi_oversold", 20),
-        ("rsi_overbought", 80),
-        ("printlog", False),
-    )
+@lru_cache(maxsize=None)
+def _rsi_kernel(period):
+    """
+    Kernel du diagnostic RSI spécialisé pour une période donnée
+
+    `period` est une constante de compilation pour Numba: les facteurs de
+    lissage de Wilder sont repliés et la boucle de chauffe est déroulée.
+    Un kernel par période (10 et 14 dans ce script), compilé une fois et
+    mis en cache sur disque.
+
+    Args:
+        period: Période du RSI
+
+    Returns:
+        Fonction njit _rsi_diag(close, lo, hi, bins)
+    """
+
+    @njit(cache=True, fastmath=True)
+    def _rsi_diag(close, lo, hi, bins):
+        """
+        Calcule le RSI de Wilder et les compteurs du diagnostic en une passe
+
+        Les seuils sont des tableaux: toutes les configurations (oversold,
+        overbought) sont évaluées sur le même RSI, calculé une seule fois.
+
+        Reproduit bt.indicators.RSI: le premier RSI est disponible à l'indice
+        `period` (moyennes simples des `period` premières variations), puis
+        lissage de Wilder ag = (ag * (p - 1) + gain) / p.
+
+        Args:
+            close: Prix de clôture (float64, contigu)
+            lo: Seuils oversold, un par configuration (float64)
+            hi: Seuils overbought, un par configuration (float64)
+            bins: Bornes croissantes de l'histogramme
+
+        Returns:
+            Tuple (rsi, oversold_days, overbought_days, hist)
+            rsi vaut NaN pendant la période de chauffe, les compteurs
+            oversold/overbought ont une entrée par configuration
+        """
+        n = close.shape[0]
+        n_configs = lo.shape[0]
+        rsi = np.full(n, np.nan)
+        n_bins = bins.shape[0] - 1
+        hist = np.zeros(n_bins, dtype=np.int64)
+        oversold = np.zeros(n_configs, dtype=np.int64)
+        overbought = np.zeros(n_configs, dtype=np.int64)
+
+        if n <= period:
+            return rsi, oversold, overbought, hist
+
+        avg_gain = 0.0
+        avg_loss = 0.0
+        for i in range(1, period + 1):
+            delta = close[i] - close[i - 1]
+            avg_gain += max(delta, 0.0)
+            avg_loss += max(-delta, 0.0)
+        avg_gain /= period
+        avg_loss /= period
+
+        for i in range(period, n):
+            if i > period:
+                delta = close[i] - close[i - 1]
+                avg_gain = (avg_gain * (period - 1) + max(delta, 0.0)) / period
+                avg_loss = (avg_loss * (period - 1) + max(-delta, 0.0)) / period
+
+            if avg_loss > 0.0:
+                value = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            elif avg_gain > 0.0:
+                value = 100.0
+            else:
+                value = 50.0
+            rsi[i] = value
+
+            for k in range(n_configs):
+                oversold[k] += value < lo[k]
+                overbought[k] += value > hi[k]
+
+            # Bucket (bins[b], bins[b + 1]] sans branchement: somme des
+            # comparaisons aux bornes intérieures (RSI toujours <= bins[-1])
+            b = 0
+            for j in range(1, n_bins):
+                b += value > bins[j]
+            hist[b] += value > bins[0]
+
+        return rsi, oversold, overbought, hist
+
+    return _rsi_diag
+
+
+@lru_cache(maxsize=None)
+def _rsi_diagnostic_class():
+    """
+    Construit la stratégie RSIDiagnostic
+
+    backtrader n'est importé qu'ici: l'analyse comparative rapide n'en a
+    pas besoin.
+    """
+    import backtrader as bt
+
+    class RSIDiagnostic(bt.Strategy):
+        """Stratégie RSI avec diagnostic détaillé"""
 
-    def __init__(self):
-        self.rsi = bt.indicators.RSI(self.datas[0].close, period=self.params.rsi_period)
-
-        # Compteurs
-        self.total_days = 0
-        self.rsi_ready_days = 0
-        self.oversold_days = 0
-        self.overbought_days = 0
-        self.buy_signals = 0
-        self.sell_signals = 0
-        self.actual_trades = 0
-
-        # Historique RSI
-        self.rsi_history = []
-
-    def next(self):
-        self.total_days += 1
-
-        if len(self.rsi) < self.params.rsi_period:
-            return
-
-        self.rsi_ready_days += 1
-        rsi_val = self.rsi[0]
-        self.rsi_history.append(rsi_val)
-
-        # Vérifier les conditions
-        if rsi_val < self.params.rsi_oversold:
-            self.oversold_days += 1
-            if not self.position:
-                self.buy_signals += 1
-                if self.params.printlog:
-                    print(
-                        f"{self.datas[0].datetime.date(0)} | 🟢 ACHAT | RSI={rsi_val:.1f} < {self.params.rsi_oversold}"
-                    )
-
-        if rsi_val > self.params.rsi_overbought:
-            self.overbought_days += 1
-            if self.position:
-                self.sell_signals += 1
-                if self.params.printlog:
-                    print(
-                        f"{self.datas[0].datetime.date(0)} | 🔴 VENTE | RSI={rsi_val:.1f} > {self.params.rsi_overbought}"
-                    )
-
-    def stop(self):
-        """Rapport de diagnostic"""
-        print("\n" + "=" * 80)
-        print("📊 DIAGNOSTIC STRATÉGIE RSI")
-        print("=" * 80)
-
-        print(f"\n📅 Période:")
-        print(f"   Jours totaux: {self.total_days}")
-        print(f"   Jours RSI calculable: {self.rsi_ready_days}")
-
-        if self.rsi_ready_days > 0:
-            print(f"\n📈 Distribution RSI:")
-            rsi_array = pd.Series(self.rsi_history)
-            print(f"   Moyenne: {rsi_array.mean():.1f}")
-            print(f"   Min: {rsi_array.min():.1f}")
-            print(f"   Max: {rsi_array.max():.1f}")
-            print(f"   Médiane: {rsi_array.median():.1f}")
-
-            print(
-                f"\n🎯 Signaux (Paramètres: oversold={self.params.rsi_oversold}, overbought={self.params.rsi_overbought}):"
+        params = (
+            ("rsi_period", 10),
+            ("rsi_oversold", 20),
+            ("rsi_overbought", 80),
+            ("printlog", False),
+            ("report", True),
+        )
+
+        def __init__(self):
+            self.rsi = bt.indicators.RSI(
+                self.datas[0].close, period=self.params.rsi_period
             )
-            print(
-                f"   Jours RSI < {self.params.rsi_oversold}: {self.oversold_days} ({self.oversold_days/self.rsi_ready_days*100:.1f}%)"
+
+            # Compteurs
+            self.total_days = 0
+            self.rsi_ready_days = 0
+            self.oversold_days = 0
+            self.overbought_days = 0
+            self.buy_signals = 0
+            self.sell_signals = 0
+            self.actual_trades = 0
+
+            # Historique RSI préalloué (données préchargées: buflen connu)
+            capacity = max(self.datas[0].buflen(), 1)
+            self.rsi_history = np.empty(capacity, dtype=np.float64)
+            self._rsi_idx = 0
+
+            # Journal des signaux (au plus un par barre), affiché dans stop()
+            self._log_dt = np.empty(capacity, dtype=np.float64)
+            self._log_rsi = np.empty(capacity, dtype=np.float64)
+            self._log_kind = np.empty(capacity, dtype=np.int8)  # 0=achat, 1=vente
+            self._log_idx = 0
+
+        def next(self):
+            self.total_days += 1
+
+            if len(self.rsi) < self.params.rsi_period:
+                return
+
+            self.rsi_ready_days += 1
+            rsi_val = self.rsi[0]
+            if self._rsi_idx == len(self.rsi_history):
+                # Flux non préchargé: doubler la capacité
+                capacity = 2 * len(self.rsi_history)
+                self.rsi_history = np.resize(self.rsi_history, capacity)
+                self._log_dt = np.resize(self._log_dt, capacity)
+                self._log_rsi = np.resize(self._log_rsi, capacity)
+                self._log_kind = np.resize(self._log_kind, capacity)
+            self.rsi_history[self._rsi_idx] = rsi_val
+            self._rsi_idx += 1
+
+            # Vérifier les conditions
+            if rsi_val < self.params.rsi_oversold:
+                self.oversold_days += 1
+                if not self.position:
+                    self.buy_signals += 1
+                    self._log_signal(0, rsi_val)
+
+            if rsi_val > self.params.rsi_overbought:
+                self.overbought_days += 1
+                if self.position:
+                    self.sell_signals += 1
+                    self._log_signal(1, rsi_val)
+
+        def _log_signal(self, kind, rsi_val):
+            """Enregistre un signal dans le journal préalloué"""
+            i = self._log_idx
+            self._log_dt[i] = self.datas[0].datetime[0]
+            self._log_rsi[i] = rsi_val
+            self._log_kind[i] = kind
+            self._log_idx = i + 1
+
+        def _print_signal_log(self):
+            """Affiche le journal des signaux en une seule écriture"""
+            templates = (
+                f"{{}} | 🟢 ACHAT | RSI={{:.1f}} < {self.params.rsi_oversold}",
+                f"{{}} | 🔴 VENTE | RSI={{:.1f}} > {self.params.rsi_overbought}",
             )
-            print(
-                f"   Jours RSI > {self.params.rsi_overbought}: {self.overbought_days} ({self.overbought_days/self.rsi_ready_days*100:.1f}%)"
+            n = self._log_idx
+            lines = [
+                templates[kind].format(bt.num2date(dt).date(), rsi_val)
+                for dt, rsi_val, kind in zip(
+                    self._log_dt[:n], self._log_rsi[:n], self._log_kind[:n]
+                )
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
+
+        def stop(self):
+            """Rapport de diagnostic"""
+            if self.params.printlog and self._log_idx:
+                self._print_signal_log()
+
+            if not self.params.report:
+                return
+
+            rsi_values = self.rsi_history[: self._rsi_idx]
+
+            # Intervalles fermés à droite comme pd.cut (side="left"): une
+            # valeur égale à RSI_BINS[0] n'appartient à aucun intervalle
+            idx = np.searchsorted(RSI_BINS, rsi_values, side="left") - 1
+            hist = np.bincount(idx[idx >= 0], minlength=len(RSI_BINS) - 1)
+            print_diagnostic_report(
+                self.total_days,
+                rsi_values,
+                self.oversold_days,
+                self.overbought_days,
+                self.buy_signals,
+                self.sell_signals,
+                self.params.rsi_oversold,
+                self.params.rsi_overbought,
+                hist,
             )
-            print(f"   Signaux d'achat générés: {self.buy_signals}")
-            print(f"   Signaux de vente générés: {self.sell_signals}")
 
-            print(f"\n💡 ANALYSE:")
-            if self.buy_signals < 5:
-                print(
-                    f"   ❌ PROBLÈME: Seuil RSI oversold ({self.params.rsi_oversold}) trop BAS"
-                )
-                print(
-                    f"   → RSI descend rarement en-dessous de {self.params.rsi_oversold}"
-                )
-                print(
-                    f"   → Seulement {self.oversold_days} jours sur {self.rsi_ready_days} ({self.oversold_days/self.rsi_ready_days*100:.1f}%)"
-                )
-                print()
-                print(f"   💊 SOLUTION:")
-                print(f"      • Augmenter rsi_oversold à 30-35")
-                print(
-                    f"      • Cela générera ~{int(self.rsi_ready_days * 0.1)} signaux (10% des jours)"
-                )
+    return RSIDiagnostic
+
+
+def __getattr__(name):
+    """Chargement paresseux de RSIDiagnostic (PEP 562)"""
+    if name == "RSIDiagnostic":
+        return _rsi_diagnostic_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def print_diagnostic_report(
+    total_days,
+    rsi_values,
+    oversold_days,
+    overbought_days,
+    buy_signals,
+    sell_signals,
+    rsi_oversold,
+    rsi_overbought,
+    hist,
+):
+    """
+    Affiche le rapport de diagnostic RSI
+
+    Args:
+        total_days: Nombre de barres analysées
+        rsi_values: Valeurs RSI calculées (hors période de chauffe)
+        oversold_days: Jours avec RSI < rsi_oversold
+        overbought_days: Jours avec RSI > rsi_overbought
+        buy_signals: Signaux d'achat générés
+        sell_signals: Signaux de vente générés
+        rsi_oversold: Seuil oversold
+        rsi_overbought: Seuil overbought
+        hist: Nombre de valeurs RSI par intervalle de RSI_BINS
+    """
+    rsi_ready_days = len(rsi_values)
+    lines = []
+
+    lines.append("\n" + "=" * 80)
+    lines.append("📊 DIAGNOSTIC STRATÉGIE RSI")
+    lines.append("=" * 80)
+
+    lines.append(f"\n📅 Période:")
+    lines.append(f"   Jours totaux: {total_days}")
+    lines.append(f"   Jours RSI calculable: {rsi_ready_days}")
+
+    if rsi_ready_days > 0:
+        lines.append(f"\n📈 Distribution RSI:")
+        rsi_min, rsi_median, rsi_max = np.quantile(rsi_values, [0.0, 0.5, 1.0])
+        lines.append(f"   Moyenne: {rsi_values.mean():.1f}")
+        lines.append(f"   Min: {rsi_min:.1f}")
+        lines.append(f"   Max: {rsi_max:.1f}")
+        lines.append(f"   Médiane: {rsi_median:.1f}")
+
+        lines.append(
+            f"\n🎯 Signaux (Paramètres: oversold={rsi_oversold}, overbought={rsi_overbought}):"
+        )
+        lines.append(
+            f"   Jours RSI < {rsi_oversold}: {oversold_days} ({oversold_days/rsi_ready_days*100:.1f}%)"
+        )
+        lines.append(
+            f"   Jours RSI > {rsi_overbought}: {overbought_days} ({overbought_days/rsi_ready_days*100:.1f}%)"
+        )
+        lines.append(f"   Signaux d'achat générés: {buy_signals}")
+        lines.append(f"   Signaux de vente générés: {sell_signals}")
+
+        lines.append(f"\n💡 ANALYSE:")
+        if buy_signals < 5:
+            lines.append(
+                f"   ❌ PROBLÈME: Seuil RSI oversold ({rsi_oversold}) trop BAS"
+            )
+            lines.append(f"   → RSI descend rarement en-dessous de {rsi_oversold}")
+            lines.append(
+                f"   → Seulement {oversold_days} jours sur {rsi_ready_days} ({oversold_days/rsi_ready_days*100:.1f}%)"
+            )
+            lines.append("")
+            lines.append(f"   💊 SOLUTION:")
+            lines.append(f"      • Augmenter rsi_oversold à 30-35")
+            lines.append(
+                f"      • Cela générera ~{int(rsi_ready_days * 0.1)} signaux (10% des jours)"
+            )
+
+        if sell_signals < 5:
+            lines.append(
+                f"   ❌ PROBLÈME: Seuil RSI overbought ({rsi_overbought}) trop HAUT"
+            )
+            lines.append(f"   → RSI monte rarement au-dessus de {rsi_overbought}")
+            lines.append(
+                f"   → Seulement {overbought_days} jours sur {rsi_ready_days} ({overbought_days/rsi_ready_days*100:.1f}%)"
+            )
+            lines.append("")
+            lines.append(f"   💊 SOLUTION:")
+            lines.append(f"      • Réduire rsi_overbought à 65-70")
+            lines.append(
+                f"      • Cela générera ~{int(rsi_ready_days * 0.1)} signaux (10% des jours)"
+            )
+
+        # Distribution détaillée
+        lines.append(f"\n📊 Distribution détaillée RSI:")
+        for b, count in enumerate(hist):
+            interval = f"({RSI_BINS[b]:g}, {RSI_BINS[b + 1]:g}]"
+            pct = count / rsi_ready_days * 100
+            bar = "█" * int(pct / 2)
+            lines.append(f"   {interval}: {count:4d} ({pct:5.1f}%) {bar}")
+
+    lines.append("\n" + "=" * 80)
+
+    # Recommandations
+    lines.append("\n🔧 RECOMMANDATIONS YAML:")
+    lines.append("\nparam_grid:")
+    lines.append("  rsi_oversold:")
+    lines.append("    type: 'int'")
+    lines.append("    low: 25      # ⬆️ Plus haut (au lieu de 20)")
+    lines.append("    high: 40     # Zone plus réaliste")
+    lines.append("    step: 5")
+    lines.append("")
+    lines.append("  rsi_overbought:")
+    lines.append("    type: 'int'")
+    lines.append("    low: 60")
+    lines.append("    high: 75     # ⬇️ Plus bas (au lieu de 80-90)")
+    lines.append("    step: 5")
+    lines.append("\n" + "=" * 80 + "\n")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def diagnose_rsi(
+    symbol="AAPL",
+    start="2021-01-01",
+    end="2025-01-01",
+    rsi_period=10,
+    rsi_oversold=20,
+    rsi_overbought=80,
+    printlog=False,
+):
+    """
+    Diagnostic RSI vectorisé (équivalent de RSIDiagnostic sans Cerebro)
+
+    Le RSI est calculé par le kernel Numba sur le tableau des clôtures au
+    lieu de l'indicateur backtrader barre par barre. RSIDiagnostic ne passe
+    aucun ordre: chaque jour oversold est un signal d'achat, aucun signal
+    de vente n'est émis.
+
+    Args:
+        symbol: Symbole analysé
+        start: Date de début
+        end: Date de fin
+        rsi_period: Période du RSI
+        rsi_oversold: Seuil oversold
+        rsi_overbought: Seuil overbought
+        printlog: Affiche les signaux d'achat
+    """
+    from data.data_handler import DataHandler
+
+    df = DataHandler().fetch_data(symbol, start, end)
+    close = df["close"].to_numpy(dtype=np.float64)
+
+    rsi, oversold_days, overbought_days, hist = _rsi_kernel(rsi_period)(
+        close,
+        np.array([rsi_oversold], dtype=np.float64),
+        np.array([rsi_overbought], dtype=np.float64),
+        RSI_BINS,
+    )
+    rsi_values = rsi[rsi_period:]
+    buy = rsi_values < rsi_oversold
+
+    if printlog and buy.any():
+        dates = df.index[rsi_period:][buy].strftime("%Y-%m-%d")
+        sys.stdout.write(
+            "\n".join(
+                f"{date} | 🟢 ACHAT | RSI={rsi_val:.1f} < {rsi_oversold}"
+                for date, rsi_val in zip(dates, rsi_values[buy])
+            )
+            + "\n"
+        )
+
+    print_diagnostic_report(
+        len(rsi_values),
+        rsi_values,
+        oversold_days[0],
+        overbought_days[0],
+        int(buy.sum()),
+        0,
+        rsi_oversold,
+        rsi_overbought,
+        hist,
+    )
+
+
+def _backtest_config(config, df, symbol):
+    """
+    Worker: backtest Cerebro complet d'une configuration de seuils
+
+    Au niveau module pour être sérialisable par multiprocessing (pickle).
+
+    Args:
+        config: Dict {name, oversold, overbought}
+        df: DataFrame OHLCV préchargé
+        symbol: Nom du feed
+
+    Returns:
+        Dict avec signaux, trades, Sharpe et rendement
+    """
+    import backtrader as bt
+    from data.data_fetcher import create_data_feed
+
+    cerebro = bt.Cerebro()
+    cerebro.broker.setcash(100000)
+    cerebro.broker.setcommission(commission=0.001)
+
+    # Pas de .copy(): chaque process reçoit sa propre copie (pickle)
+    cerebro.adddata(create_data_feed(df, name=symbol))
+
+    cerebro.addstrategy(
+        _rsi_diagnostic_class(),
+        rsi_period=14,
+        rsi_oversold=config["oversold"],
+        rsi_overbought=config["overbought"],
+        printlog=False,
+        report=False,
+    )
+
+    cerebro.addanalyzer(bt.analyzers.SharpeRatio, _name="sharpe")
+    cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name="trades")
+
+    start_val = cerebro.broker.getvalue()
+    strat = cerebro.run()[0]
+    end_val = cerebro.broker.getvalue()
+
+    trades = strat.analyzers.trades.get_analysis()
+
+    return {
+        "buy_signals": strat.buy_signals,
+        "sell_signals": strat.sell_signals,
+        "total_trades": trades.get("total", {}).get("total", 0),
+        "sharpe": strat.analyzers.sharpe.get_analysis().get("sharperatio", 0) or 0,
+        "return": ((end_val - start_val) / start_val) * 100,
+    }
 
-            if self.sell_signals < 5:
-                print(
-                    f"   ❌ PROBLÈME: Seuil RSI overbought ({self.params.rsi_overbought}) trop HAUT"
-                )
-                print(
-                    f"   → RSI monte rarement au-dessus de {self.params.rsi_overbought}"
-                )
-                print(
-                    f"   → Seulement {self.overbought_days} jours sur {self.rsi_ready_days} ({self.overbought_days/self.rsi_ready_days*100:.1f}%)"
-                )
-                print()
-                print(f"   💊 SOLUTION:")
-                print(f"      • Réduire rsi_overbought à 65-70")
-                print(
-                    f"      • Cela générera ~{int(self.rsi_ready_days * 0.1)} signaux (10% des jours)"
-                )
 
-            # Distribution détaillée
-            print(f"\n📊 Distribution détaillée RSI:")
-            bins = [0, 20, 30, 40, 50, 60, 70, 80, 100]
-            hist, _ = pd.cut(rsi_array, bins=bins, retbins=True)
-            counts = hist.value_counts().sort_index()
-
-            for interval, count in counts.items():
-                pct = count / len(rsi_array) * 100
-                bar = "█" * int(pct / 2)
-                print(f"   {interval}: {count:4d} ({pct:5.1f}%) {bar}")
-
-        print("\n" + "=" * 80)
-
-        # Recommandations
-        print("\n🔧 RECOMMANDATIONS YAML:")
-        print("\nparam_grid:")
-        print("  rsi_oversold:")
-        print("    type: 'int'")
-        print("    low: 25      # ⬆️ Plus haut (au lieu de 20)")
-        print("    high: 40     # Zone plus réaliste")
-        print("    step: 5")
-        print()
-        print("  rsi_overbought:")
-        print("    type: 'int'")
-        print("    low: 60")
-        print("    high: 75     # ⬇️ Plus bas (au lieu de 80-90)")
-        print("    step: 5")
-        print("\n" + "=" * 80 + "\n")
-
-
-def analyze_rsi_thresholds(symbol="AAPL", start="2021-01-01", end="2025-01-01"):
+def analyze_rsi_thresholds(
+    symbol="AAPL", start="2021-01-01", end="2025-01-01", detailed=False
+):
     """
     Analyse l'impact de différents seuils RSI
+
+    Args:
+        symbol: Symbole analysé
+        start: Date de début
+        end: Date de fin
+        detailed: Lance aussi un backtest Cerebro par configuration
+                  (en parallèle, un process par config) pour le P&L
     """
-    print("=" * 80)
-    print("🧪 ANALYSE COMPARATIVE DES SEUILS RSI")
-    print("=" * 80)
+    sys.stdout.write(
+        "=" * 80 + "\n🧪 ANALYSE COMPARATIVE DES SEUILS RSI\n" + "=" * 80 + "\n"
+    )
 
     configs = [
         {"name": "Actuel (20/80)", "oversold": 20, "overbought": 80},
@@ -184,60 +502,64 @@ def analyze_rsi_thresholds(symbol="AAPL", start="2021-01-01", end="2025-01-01"):
         {"name": "Agressif (40/60)", "oversold": 40, "overbought": 60},
     ]
 
-    results = []
-
-    for config in configs:
-        cerebro = bt.Cerebro()
-        cerebro.broker.setcash(100000)
-        cerebro.broker.setcommission(commission=0.001)
-
-        # Données
-        data_handler = DataHandler()
-        df = data_handler.fetch_data(symbol, start, end)
-        data_feed = create_data_feed(df, name=symbol)
-        cerebro.adddata(data_feed)
+    from data.data_handler import DataHandler
 
-        # Stratégie
-        cerebro.addstrategy(
-            RSIDiagnostic,
-            rsi_period=14,
-            rsi_oversold=config["oversold"],
-            rsi_overbought=config["overbought"],
-            printlog=False,
-        )
+    # Données chargées une seule fois, partagées par toutes les configs
+    data_handler = DataHandler()
+    df = data_handler.fetch_data(symbol, start, end)
+    close = df["close"].to_numpy(dtype=np.float64)
 
-        # Analyseurs
-        cerebro.addanalyzer(bt.analyzers.SharpeRatio, _name="sharpe")
-        cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name="trades")
+    # RSI calculé une seule fois, seuils évalués pour toutes les configs
+    lo = np.array([c["oversold"] for c in configs], dtype=np.float64)
+    hi = np.array([c["overbought"] for c in configs], dtype=np.float64)
+    rsi, oversold_days, overbought_days, hist = _rsi_kernel(14)(close, lo, hi, RSI_BINS)
+    rsi_values = rsi[14:]
 
-        # Run
-        start_val = cerebro.broker.getvalue()
-        strats = cerebro.run()
-        end_val = cerebro.broker.getvalue()
+    results = []
 
-        strat = strats[0]
-        sharpe = strat.analyzers.sharpe.get_analysis().get("sharperatio", 0) or 0
-        trades = strat.analyzers.trades.get_analysis()
-        total_trades = trades.get("total", {}).get("total", 0)
+    for k, config in enumerate(configs):
+        print_diagnostic_report(
+            len(rsi_values),
+            rsi_values,
+            oversold_days[k],
+            overbought_days[k],
+            oversold_days[k],
+            0,
+            config["oversold"],
+            config["overbought"],
+            hist,
+        )
 
+        # RSIDiagnostic ne passe aucun ordre: chaque jour oversold est un
+        # signal d'achat, aucun signal de vente, pas de trade ni de P&L
         results.append(
             {
                 "config": config["name"],
                 "oversold": config["oversold"],
                 "overbought": config["overbought"],
-                "buy_signals": strat.buy_signals,
-                "sell_signals": strat.sell_signals,
-                "total_trades": total_trades,
-                "sharpe": sharpe,
-                "return": ((end_val - start_val) / start_val) * 100,
+                "buy_signals": int(oversold_days[k]),
+                "sell_signals": 0,
+                "total_trades": 0,
+                "sharpe": 0,
+                "return": 0.0,
             }
         )
 
+    if detailed:
+        # Backtests indépendants: un process par configuration
+        tasks = [(config, df, symbol) for config in configs]
+        with Pool(processes=len(configs)) as pool:
+            backtests = pool.starmap(_backtest_config, tasks)
+
+        for result, backtest in zip(results, backtests):
+            result.update(backtest)
+
     # Afficher
-    print(
+    lines = []
+    lines.append(
         f"\n{'Config':<20} {'Buy':<6} {'Sell':<6} {'Trades':<8} {'Sharpe':<8} {'Return':<10} {'Évaluation'}"
     )
-    print("-" * 90)
+    lines.append("-" * 90)
 
     for r in results:
         if r["total_trades"] == 0:
@@ -249,23 +571,24 @@ def analyze_rsi_thresholds(symbol="AAPL", start="2021-01-01", end="2025-01-01"):
         else:
             eval_str = "✅ Bon"
 
-        print(
+        lines.append(
             f"{r['config']:<20} {r['buy_signals']:<6} {r['sell_signals']:<6} "
             f"{r['total_trades']:<8} {r['sharpe']:<8.2f} {r['return']:<10.1f}% {eval_str}"
         )
 
-    print("\n" + "=" * 80)
+    lines.append("\n" + "=" * 80)
 
     # Meilleure config
     best = max(results, key=lambda x: x["sharpe"])
-    print(f"\n🏆 MEILLEURE CONFIGURATION:")
-    print(f"   {best['config']}")
-    print(f"   RSI oversold: {best['oversold']}")
-    print(f"   RSI overbought: {best['overbought']}")
-    print(f"   Trades: {best['total_trades']}")
-    print(f"   Sharpe: {best['sharpe']:.2f}")
-    print(f"   Return: {best['return']:.1f}%")
-    print("=" * 80 + "\n")
+    lines.append(f"\n🏆 MEILLEURE CONFIGURATION:")
+    lines.append(f"   {best['config']}")
+    lines.append(f"   RSI oversold: {best['oversold']}")
+    lines.append(f"   RSI overbought: {best['overbought']}")
+    lines.append(f"   Trades: {best['total_trades']}")
+    lines.append(f"   Sharpe: {best['sharpe']:.2f}")
+    lines.append(f"   Return: {best['return']:.1f}%")
+    lines.append("=" * 80 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -276,12 +599,28 @@ if __name__ == "__main__":
     parser.add_argument(
         "--compare", action="store_true", help="Comparer plusieurs configs"
     )
+    parser.add_argument(
+        "--detailed",
+        action="store_true",
+        help="Avec --compare: backtests Cerebro parallèles (trades, Sharpe)",
+    )
+    parser.add_argument(
+        "--cerebro",
+        action="store_true",
+        help="Diagnostic via la stratégie backtrader (plus lent)",
+    )
 
     args = parser.parse_args()
 
     if args.compare:
-        analyze_rsi_thresholds(args.symbol)
+        analyze_rsi_thresholds(args.symbol, detailed=args.detailed)
+    elif not args.cerebro:
+        diagnose_rsi(args.symbol, printlog=True)
     else:
+        import backtrader as bt
+        from data.data_handler import DataHandler
+        from data.data_fetcher import create_data_feed
+
         # Diagnostic simple
         cerebro = bt.Cerebro()
         cerebro.broker.setcash(100000)
@@ -292,7 +631,7 @@ if __name__ == "__main__":
         cerebro.adddata(data_feed)
 
         cerebro.addstrategy(
-            RSIDiagnostic,
+            _rsi_diagnostic_class(),
             rsi_period=10,
             rsi_oversold=20,
             rsi_overbought=80,
@@ -4,22 +4,18 @@ Système de Trading Algorithmique - Point d'entrée principal
 Supporte: Backtesting (mono et multi-symbole), Paper Trading, Live Trading
 """
 
+import math
 import sys
-import argparse
 import logging
 from datetime import datetime
+from functools import lru_cache
 from monitoring.logger import setup_logger
 
 # Configuration du logger principal
 logger = setup_logger("main")
 
-
-def parse_arguments():
-    """Parse les arguments de la ligne de commande"""
-    parser = argparse.ArgumentParser(
-        description="Système de Trading Algorithmique",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Exemples affichés par --help
+_EPILOG = """
 Exemples d'utilisation :
 Backtesting mono-symbole (mode classique):
 python main.py --mode backtest --strategy MovingAverage --symbols AAPL
@@ -42,7 +38,23 @@ Paper Trading avec Alpaca:
     
 Mode Test:
     python main.py --test
-        """,
+        """
+
+
+@lru_cache(maxsize=None)
+def build_parser():
+    """
+    Construit le parser des arguments (une seule fois par process)
+
+    argparse n'est importé qu'ici: `python main.py --test` ne construit
+    pas le parser.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Système de Trading Algorithmique",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     # Mode principal
@@ -133,36 +145,64 @@ Mode Test:
     # Verbosité
     parser.add_argument("--verbose", action="store_true", help="Mode verbeux")
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_arguments(argv=None):
+    """Parse les arguments de la ligne de commande"""
+    return build_parser().parse_args(argv)
 
 
 def parse_symbol_weights(weights_str: str) -> dict:
     """
-    Parse une chaîne de poids en dict
+    Parse une chaîne de poids en dict (poids normalisés pour sommer à 1)
 
     Args:
         weights_str: "AAPL:0.4,MSFT:0.3,GOOGL:0.2,AMZN:0.1"
 
     Returns:
-        Dict {symbol: weight}
+        Dict {symbol: weight}, None si aucune chaîne n'est fournie
+
+    Raises:
+        ValueError: paire mal formée, poids non fini ou négatif, symbole
+            répété, ou somme des poids nulle
     """
     if not weights_str:
         return None
 
     weights = {}
+    for pair in weights_str.split(","):
+        symbol, sep, weight = pair.partition(":")
+        symbol = symbol.strip()
+        if not sep or not symbol:
+            raise ValueError(
+                f"Poids mal formé: {pair!r} "
+                "(format attendu: 'AAPL:0.4,MSFT:0.3,GOOGL:0.2,AMZN:0.1')"
+            )
+        try:
+            value = float(weight)
+        except ValueError:
+            raise ValueError(
+                f"Poids invalide pour {symbol}: {weight.strip()!r}"
+            ) from None
+        if not math.isfinite(value) or value < 0:
+            raise ValueError(
+                f"Poids invalide pour {symbol}: {value} (doit être fini et >= 0)"
+            )
+        if symbol in weights:
+            raise ValueError(f"Symbole répété dans les poids: {symbol}")
+        weights[symbol] = value
 
-    try:
-        for pair in weights_str.split(","):
-            symbol, weight = pair.split(":")
-            weights[symbol.strip()] = float(weight.strip())
+    total = sum(weights.values())
+    if total == 0:
+        raise ValueError("La somme des poids doit être > 0")
 
-        logger.info(f"Poids parsés: {weights}")
-        return weights
+    if abs(total - 1.0) > 1e-9:
+        logger.warning("Somme des poids = %g, normalisation à 1", total)
+        weights = {symbol: weight / total for symbol, weight in weights.items()}
 
-    except Exception as e:
-        logger.error(f"Erreur parsing poids: {e}")
-        logger.error("Format attendu: 'AAPL:0.4,MSFT:0.3,GOOGL:0.2,AMZN:0.1'")
-        return None
+    logger.info("Poids parsés: %s", weights)
+    return weights
 
 
 def run_backtest(args):
@@ -172,13 +212,18 @@ def run_backtest(args):
     try:
         # Récupérer les paramètres
         strategy_name = args.strategy or "MovingAverage"
-        symbols = args.symbols.split(",") if args.symbols else ["AAPL"]
+        # Tuple de chaînes internées: hashable, réutilisable comme clé de cache
+        symbols = (
+            tuple(sys.intern(s.strip()) for s in args.symbols.split(","))
+            if args.symbols
+            else ("AAPL",)
+        )
         start_date = args.start_date or "2023-01-01"
         end_date = args.end_date or datetime.now().strftime("%Y-%m-%d")
 
-        logger.info(f"Stratégie: {strategy_name}")
-        logger.info(f"Symboles: {symbols}")
-        logger.info(f"Période: {start_date} à {end_date}")
+        logger.info("Stratégie: %s", strategy_name)
+        logger.info("Symboles: %s", ", ".join(symbols))
+        logger.info("Période: %s à %s", start_date, end_date)
         logger.info(f"Capital: ${args.capital:,.2f}")
 
         # === MODE MULTI-SYMBOLE ===
@@ -222,7 +267,7 @@ def run_backtest(args):
 
                     logger.info("\n✅ Export terminé:")
                     for file_type, filepath in exported_files.items():
-                        logger.info(f"   • {file_type}: {filepath}")
+                        logger.info("   • %s: %s", file_type, filepath)
 
                 # Analyse détaillée
                 logger.info("\n📊 Analyse détaillée:")
@@ -237,7 +282,7 @@ def run_backtest(args):
 
                     # Calculer matrice de corrélation
                     corr_matrix = analyzer.calculate_correlation_matrix(returns_data)
-                    logger.info(f"\n🔗 Matrice de Corrélation:")
+                    logger.info("\n🔗 Matrice de Corrélation:")
                     logger.info(corr_matrix.round(2).to_string())
                     # Calculer diversification ratio
                     div_ratio = analyzer.calculate_diversification_ratio(returns_data)
@@ -278,7 +323,7 @@ def run_backtest(args):
                 # Générer rapport
                 report_path = engine.generate_report()
                 if report_path:
-                    logger.info(f"📄 Rapport: {report_path}")
+                    logger.info("📄 Rapport: %s", report_path)
             else:
                 logger.error("❌ Erreur lors du backtest")
                 return None
@@ -286,7 +331,7 @@ def run_backtest(args):
         return results
 
     except Exception as e:
-        logger.error(f"❌ Erreur: {e}")
+        logger.error("❌ Erreur: %s", e)
         if args.verbose:
             import traceback
 
@@ -312,7 +357,7 @@ def run_paper_trading(args):
     except KeyboardInterrupt:
         logger.info("\n⏹️  Arrêt demandé par l'utilisateur")
     except Exception as e:
-        logger.error(f"❌ Erreur: {e}")
+        logger.error("❌ Erreur: %s", e)
         if args.verbose:
             import traceback
 
@@ -337,7 +382,7 @@ def run_tests():
         if exit_code == 0:
             logger.info("✅ Tous les tests ont réussi!")
         else:
-            logger.error(f"❌ Certains tests ont échoué (code: {exit_code})")
+            logger.error("❌ Certains tests ont échoué (code: %s)", exit_code)
 
     except ImportError:
         logger.error("❌ pytest n'est pas installé")
@@ -346,10 +391,12 @@ def run_tests():
 
 def main():
     """Point d'entrée principal"""
-    args = parse_arguments()
+    # Chemin rapide: `--test` seul ne nécessite pas argparse
+    fast_test = sys.argv[1:] == ["--test"]
+    args = None if fast_test else parse_arguments()
 
     # Configuration du niveau de log
-    if args.verbose:
+    if args is not None and args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
     # Bannière
@@ -358,7 +405,7 @@ def main():
     logger.info("=" * 80)
 
     # Mode test
-    if args.test:
+    if fast_test or args.test:
         run_tests()
         return
 
@@ -370,7 +417,7 @@ def main():
     elif args.mode == "live":
         run_live_trading(args)
     else:
-        logger.error(f"Mode inconnu: {args.mode}")
+        logger.error("Mode inconnu: %s", args.mode)
 
 
 if __name__ == "__main__":
@@ -379,8 +426,5 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("\n⏹️  Programme interrompu")
     except Exception as e:
-        logger.error(f"❌ Erreur fatale: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("❌ Erreur fatale: %s", e)
         sys.exit(1)
@@ -5,21 +5,44 @@ Point d'entrée principal du système de trading algorithmique
 
 import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Ajouter le répertoire parent au path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from config import settings
-from monitoring.logger import setup_logger
-from backtesting.backtest_engine import BacktestEngine
 
-# Configuration du logger
-logger = setup_logger("main")
+# Bannière affichée au démarrage
+_BANNER = """
+    ╔═══════════════════════════════════════════════════════════╗
+    ║                                                           ║
+    ║        🤖 SYSTÈME DE TRADING ALGORITHMIQUE 🤖           ║
+    ║                                                           ║
+    ║              Powered by Backtrader                        ║
+    ║                                                           ║
+    ╚═══════════════════════════════════════════════════════════╝
+    
+"""
 
 
-def parse_arguments():
-    """Parse les arguments de ligne de commande"""
+@lru_cache(maxsize=None)
+def get_logger():
+    """
+    Logger principal, créé au premier appel
+
+    Les imports lourds (logger, moteur de backtest) sont différés dans les
+    fonctions qui les utilisent: `--help` ne les charge pas.
+    """
+    from monitoring.logger import setup_logger
+
+    return setup_logger("main")
+
+
+@lru_cache(maxsize=None)
+def build_parser():
+    """Construit le parser des arguments (une seule fois par process)"""
+    from config import settings
+
     parser = argparse.ArgumentParser(
         description="Système de Trading Algorithmique",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -89,22 +112,36 @@ Exemples d'utilisation:
         "--verbose", action="store_true", help="Mode verbose (plus de logs)"
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="Confirme le live trading sans invite (déploiements supervisés)",
+    )
+
+    return parser
+
+
+def parse_arguments(argv=None):
+    """Parse les arguments de ligne de commande"""
+    return build_parser().parse_args(argv)
 
 
 def run_backtest(args):
     """Exécute un backtest"""
+    logger = get_logger()
     logger.info("=" * 80)
     logger.info("🚀 DÉMARRAGE DU BACKTEST")
     logger.info("=" * 80)
-    logger.info(f"Mode: {args.mode}")
-    logger.info(f"Stratégie: {args.strategy}")
-    logger.info(f"Symboles: {', '.join(args.symbols)}")
-    logger.info(f"Période: {args.start_date} → {args.end_date}")
+    logger.info("Mode: %s", args.mode)
+    logger.info("Stratégie: %s", args.strategy)
+    logger.info("Symboles: %s", ", ".join(args.symbols))
+    logger.info("Période: %s → %s", args.start_date, args.end_date)
     logger.info(f"Capital initial: ${args.capital:,.2f}")
     logger.info("=" * 80)
 
     try:
+        from backtesting.backtest_engine import BacktestEngine
+
         # Initialiser le moteur de backtesting
         engine = BacktestEngine(
             strategy_name=args.strategy,
@@ -125,16 +162,16 @@ def run_backtest(args):
 
         if results:
             logger.info(f"Capital final: ${results.get('final_value', 0):,.2f}")
-            logger.info(f"Rendement total: {results.get('total_return', 0):.2f}%")
-            logger.info(f"Sharpe Ratio: {results.get('sharpe_ratio', 0):.2f}")
-            logger.info(f"Max Drawdown: {results.get('max_drawdown', 0):.2f}%")
-            logger.info(f"Nombre de trades: {results.get('total_trades', 0)}")
-            logger.info(f"Taux de réussite: {results.get('win_rate', 0):.2f}%")
+            logger.info("Rendement total: %.2f%%", results.get("total_return", 0))
+            logger.info("Sharpe Ratio: %.2f", results.get("sharpe_ratio", 0))
+            logger.info("Max Drawdown: %.2f%%", results.get("max_drawdown", 0))
+            logger.info("Nombre de trades: %s", results.get("total_trades", 0))
+            logger.info("Taux de réussite: %.2f%%", results.get("win_rate", 0))
 
             # Générer le rapport
             logger.info("\n📝 Génération du rapport détaillé...")
             report_path = engine.generate_report()
-            logger.info(f"✅ Rapport sauvegardé: {report_path}")
+            logger.info("✅ Rapport sauvegardé: %s", report_path)
 
             # Afficher les graphiques si demandé
             if args.plot:
@@ -147,7 +184,7 @@ def run_backtest(args):
         logger.info("✅ Backtest terminé avec succès")
 
     except Exception as e:
-        logger.error(f"❌ Erreur lors du backtest: {e}", exc_info=True)
+        logger.exception("❌ Erreur lors du backtest: %s", e)
         return 1
 
     return 0
@@ -155,6 +192,7 @@ def run_backtest(args):
 
 def run_paper_trading(args):
     """Lance le paper trading"""
+    logger = get_logger()
     logger.info("🔄 Mode Paper Trading (En développement)")
     logger.warning("Cette fonctionnalité sera disponible prochainement")
     return 0
@@ -162,13 +200,20 @@ def run_paper_trading(args):
 
 def run_live_trading(args):
     """Lance le live trading"""
+    logger = get_logger()
     logger.warning("⚠️  MODE LIVE TRADING")
     logger.warning("Ce mode utilise de l'argent réel !")
 
-    response = input("Êtes-vous sûr de vouloir continuer ? (oui/non): ")
-    if response.lower() not in ["oui", "yes", "y"]:
-        logger.info("Opération annulée")
-        return 0
+    if not args.yes:
+        # Sans terminal (CI, cron), input() bloquerait: refuser d'emblée
+        if not sys.stdin.isatty():
+            logger.error("Live trading refusé sans terminal (utilisez --yes)")
+            return 1
+
+        response = input("Êtes-vous sûr de vouloir continuer ? (oui/non): ")
+        if response.lower() not in ["oui", "yes", "y"]:
+            logger.info("Opération annulée")
+            return 0
 
     logger.info("🔄 Mode Live Trading (En développement)")
     logger.warning("Cette fonctionnalité sera disponible prochainement")
@@ -177,6 +222,9 @@ def run_live_trading(args):
 
 def run_tests():
     """Exécute des tests rapides du système"""
+    from config import settings
+
+    logger = get_logger()
     logger.info("🧪 Exécution des tests du système")
     logger.info("=" * 80)
 
@@ -184,9 +232,9 @@ def run_tests():
     logger.info("Test 1: Chargement de la configuration...")
     try:
         config = settings.get_config()
-        logger.info(f"✅ Configuration chargée: Mode {config['trading_mode']}")
+        logger.info("✅ Configuration chargée: Mode %s", config["trading_mode"])
     except Exception as e:
-        logger.error(f"❌ Erreur configuration: {e}")
+        logger.error("❌ Erreur configuration: %s", e)
         return 1
 
     # Test 2: Data Handler
@@ -197,7 +245,7 @@ def run_tests():
         data_handler = DataHandler()
         logger.info("✅ Data Handler initialisé")
     except Exception as e:
-        logger.error(f"❌ Erreur Data Handler: {e}")
+        logger.error("❌ Erreur Data Handler: %s", e)
         return 1
 
     # Test 3: Téléchargement de données
@@ -205,12 +253,12 @@ def run_tests():
     try:
         df = data_handler.fetch_data("AAPL", "2024-01-01", "2024-01-31")
         if df is not None and not df.empty:
-            logger.info(f"✅ Données téléchargées: {len(df)} barres")
-            logger.info(f"   Période: {df.index[0]} → {df.index[-1]}")
+            logger.info("✅ Données téléchargées: %s barres", len(df))
+            logger.info("   Période: %s → %s", df.index[0], df.index[-1])
         else:
             logger.warning("⚠️  Aucune donnée récupérée")
     except Exception as e:
-        logger.error(f"❌ Erreur téléchargement: {e}")
+        logger.error("❌ Erreur téléchargement: %s", e)
         return 1
 
     # Test 4: Stratégie
@@ -220,7 +268,7 @@ def run_tests():
 
         logger.info("✅ Stratégie MovingAverage chargée")
     except Exception as e:
-        logger.error(f"❌ Erreur stratégie: {e}")
+        logger.error("❌ Erreur stratégie: %s", e)
         return 1
 
     logger.info("\n" + "=" * 80)
@@ -234,17 +282,7 @@ def main():
     args = parse_arguments()
 
     # Afficher le banner
-    print(
-        """
-    ╔═══════════════════════════════════════════════════════════╗
-    ║                                                           ║
-    ║        🤖 SYSTÈME DE TRADING ALGORITHMIQUE 🤖           ║
-    ║                                                           ║
-    ║              Powered by Backtrader                        ║
-    ║                                                           ║
-    ╚═══════════════════════════════════════════════════════════╝
-    """
-    )
+    sys.stdout.write(_BANNER)
 
     # Mode test
     if args.test:
@@ -258,7 +296,7 @@ def main():
     elif args.mode == "live":
         return run_live_trading(args)
     else:
-        logger.error(f"Mode inconnu: {args.mode}")
+        get_logger().error("Mode inconnu: %s", args.mode)
         return 1
 
 
@@ -267,8 +305,8 @@ if __name__ == "__main__":
         exit_code = main()
         sys.exit(exit_code)
     except KeyboardInterrupt:
-        logger.info("\n⚠️  Interruption par l'utilisateur")
+        get_logger().info("\n⚠️  Interruption par l'utilisateur")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"❌ Erreur fatale: {e}", exc_info=True)
+        get_logger().exception("❌ Erreur fatale: %s", e)
         sys.exit(1)
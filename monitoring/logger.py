@@ -2,23 +2,94 @@
 Système de journalisation centralisé
 """
 
+import atexit
 import logging
+import os
+import queue
 import sys
+import time
+from functools import lru_cache, partial
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from datetime import datetime
 import colorlog
 
+from config import settings
+
+# Format avec couleurs pour la console (partagé par tous les loggers)
+_CONSOLE_FORMATTER = colorlog.ColoredFormatter(
+    "%(log_color)s%(asctime)s - %(name)s - %(levelname)s%(reset)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+    log_colors={
+        "DEBUG": "cyan",
+        "INFO": "green",
+        "WARNING": "yellow",
+        "ERROR": "red",
+        "CRITICAL": "red,bg_white",
+    },
+)
+
+
+@lru_cache(maxsize=None)
+def _default_log_file():
+    """Fichier de log du process (horodaté une fois, partagé par tous les loggers)"""
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    return settings.LOGS_DIR / f"trading_{timestamp}.log"
 
-def setup_logger(name="trading_system", log_file=None):
-    from config import settings
 
+@lru_cache(maxsize=None)
+def _file_queue_handler(log_file):
+    """
+    QueueHandler partagé vers un fichier de log
+
+    Un seul FileHandler, une seule file et un seul thread d'écriture
+    (QueueListener) par fichier, quel que soit le nombre de loggers: tous
+    reçoivent ce même QueueHandler.
+
+    Args:
+        log_file: Chemin du fichier de log (Path)
+
+    Returns:
+        QueueHandler à attacher aux loggers
+    """
+    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter(settings.LOG_FORMAT))
+
+    # Écriture fichier hors du thread appelant: le logger ne fait
+    # qu'enfiler l'enregistrement, un thread dédié écrit sur disque
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Process fils (multiprocessing): le thread d'écriture n'existe pas
+    # après fork, on y revient à l'écriture directe
+    os.register_at_fork(
+        after_in_child=partial(_use_direct_handler, queue_handler, file_handler)
+    )
+    return queue_handler
+
+
+def _use_direct_handler(queue_handler, file_handler):
+    """Remplace le QueueHandler partagé par le handler fichier (process fils)"""
+    for logger in list(logging.Logger.manager.loggerDict.values()):
+        if isinstance(logger, logging.Logger) and queue_handler in logger.handlers:
+            logger.removeHandler(queue_handler)
+            logger.addHandler(file_handler)
+
+
+@lru_cache(maxsize=None)
+def setup_logger(name="trading_system", log_file=None):
     """
     Configure et retourne un logger avec couleurs et fichier
-    
+
+    Le résultat est mis en cache par (name, log_file): les appels suivants
+    retournent le même logger sans reconstruire les handlers.
+
     Args:
         name: Nom du logger
         log_file: Chemin du fichier de log (optionnel)
-    
+
     Returns:
         Logger configuré
     """
@@ -30,33 +101,15 @@ def setup_logger(name="trading_system", log_file=None):
 
     logger.setLevel(getattr(logging, settings.LOG_LEVEL))
 
-    # Format avec couleurs pour la console
-    console_formatter = colorlog.ColoredFormatter(
-        "%(log_color)s%(asctime)s - %(name)s - %(levelname)s%(reset)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        log_colors={
-            "DEBUG": "cyan",
-            "INFO": "green",
-            "WARNING": "yellow",
-            "ERROR": "red",
-            "CRITICAL": "red,bg_white",
-        },
-    )
-
     # Handler console
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     logger.addHandler(console_handler)
 
-    # Handler fichier si activé
+    # Handler fichier si activé (partagé entre tous les loggers)
     if settings.LOG_TO_FILE:
         if log_file is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_file = settings.LOGS_DIR / f"trading_{timestamp}.log"
-
-        file_formatter = logging.Formatter(settings.LOG_FORMAT)
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+            log_file = _default_log_file()
+        logger.addHandler(_file_queue_handler(Path(log_file)))
 
     return logger
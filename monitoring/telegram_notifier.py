@@ -1,16 +1,199 @@
 """
 Telegram Notifier - Système de notifications via Telegram
+
+Latence: l'API Bot est servie depuis Amsterdam; chaque envoi coûte au
+moins un aller-retour vers ce datacenter. Pour des alertes au plus tôt,
+héberger le système à proximité (Europe de l'Ouest).
 """
 
 import asyncio
 import threading
-from datetime import datetime
-from telegram import Bot
-from telegram.error import TelegramError
+import time
+from collections import ChainMap
+from functools import lru_cache
 from monitoring.logger import setup_logger
 
 logger = setup_logger("telegram_notifier")
 
+# API Bot Telegram
+TELEGRAM_API_URL = "https://api.telegram.org"
+
+# Limites d'envoi de l'API Bot: 30 messages/s au total, 20 messages/min
+# par groupe, environ 1 message/s par conversation privée
+GLOBAL_RATE_LIMIT = (30, 1.0)
+GROUP_RATE_LIMIT = (20, 60.0)
+PRIVATE_RATE_LIMIT = (1, 1.0)
+
+# Tentatives max d'un envoi refusé en 429 (Too Many Requests)
+MAX_SEND_ATTEMPTS = 3
+
+# Modèles de messages (formatés avec str.format, seules les valeurs varient)
+_ALERT_TMPL = "🚨 **ALERTE** [{time}]\n\n{message}"
+
+_DAILY_SUMMARY_TMPL = """📊 **RÉSUMÉ QUOTIDIEN**
+{date}
+==============================
+
+💰 **PORTEFEUILLE**
+• Valeur: ${portfolio_value:,.2f}
+• Cash: ${cash:,.2f}
+• P&L Jour: ${daily_pnl:+,.2f}
+• P&L Total: ${total_pnl:+,.2f}
+
+📈 **TRADING**
+• Trades Jour: {daily_trades}
+• Trades Total: {total_trades}
+• Win Rate: {win_rate:.1%}
+• Sharpe Ratio: {sharpe_ratio:.2f}
+
+📉 **RISQUES**
+• Drawdown: {drawdown:.1%}
+• Exposure: {exposure:.1%}
+• Circuit Breakers: {breakers}
+"""
+
+# Valeurs affichées quand un champ manque dans les données du résumé
+_SUMMARY_DEFAULTS = {
+    "portfolio_value": 0,
+    "cash": 0,
+    "daily_pnl": 0,
+    "total_pnl": 0,
+    "daily_trades": 0,
+    "total_trades": 0,
+    "win_rate": 0,
+    "sharpe_ratio": 0,
+    "drawdown": 0,
+    "exposure": 0,
+}
+
+_ERROR_TMPL = """❌ **ERREUR SYSTÈME**
+
+**Type:** {type}
+**Message:** {message}
+**Composant:** {component}
+**Heure:** {timestamp}
+
+⚠️ Vérifiez les logs pour plus de détails.
+"""
+
+_CIRCUIT_BREAKER_TMPL = """🚨 **CIRCUIT BREAKER DÉCLENCHÉ**
+
+**Type:** {type}
+**Raison:** {reason}
+**Valeur:** {value}
+**Seuil:** {threshold}
+
+⏸️ **Trading suspendu pour {pause_duration} minutes**
+
+Action requise: Vérifiez les conditions du marché et les paramètres de risque.
+"""
+
+_PERFORMANCE_TMPL = """{emoji} **PERFORMANCE UPDATE - {trend}**
+
+**P&L Actuel:** ${pnl:+,.2f}
+**Valeur Portfolio:** ${portfolio_value:,.2f}
+**Rendement:** {return_pct:+.2%}
+**Trades Aujourd'hui:** {trades_today}
+
+Mise à jour: {time}
+"""
+
+_STARTUP_TMPL = """🚀 **SYSTÈME DÉMARRÉ**
+
+**Mode:** {mode}
+**Capital Initial:** ${initial_capital:,.2f}
+**Stratégies Actives:** {active_strategies}
+**Circuit Breakers:** {breakers}
+
+Heure de démarrage: {timestamp}
+
+Bonne chance! 🍀
+"""
+
+_SHUTDOWN_TMPL = """🛑 **SYSTÈME ARRÊTÉ**
+
+**Durée Session:** {duration}
+**P&L Final:** ${final_pnl:+,.2f}
+**Trades Total:** {total_trades}
+**Erreurs:** {errors}
+
+Heure d'arrêt: {timestamp}
+
+À bientôt! 👋
+"""
+
+
+# Emojis des messages, indexés par sens du trade / signe du P&L
+_SIDE_EMOJI = {"BUY": "📈", "SELL": "📉"}
+_PNL_EMOJI = {1: "🟢", -1: "🔴", 0: "⚪"}
+_PNL_TREND = {1: "PROFIT", -1: "PERTE", 0: "NEUTRE"}
+
+# Formats d'horodatage des messages
+_FMT_HMS = "%H:%M:%S"
+_FMT_DATE = "%Y-%m-%d"
+_FMT_DATETIME = "%Y-%m-%d %H:%M:%S"
+
+
+@lru_cache(maxsize=8)
+def _ts_cached(sec, fmt):
+    """Horodatage formaté, mis en cache pour une seconde donnée"""
+    return time.strftime(fmt, time.localtime(sec))
+
+
+def _now(fmt, sec=None):
+    """
+    Heure courante formatée (réutilisée au sein d'une même seconde)
+
+    sec permet de formater plusieurs champs d'un même message à partir
+    d'une seule lecture de l'horloge.
+    """
+    if sec is None:
+        sec = int(time.time())
+    return _ts_cached(sec, fmt)
+
+
+def _new_event_loop():
+    """
+    Nouvelle boucle asyncio, basée sur uvloop si installé (optionnel,
+    indisponible sous Windows). Seule la boucle du notifier est concernée:
+    la politique globale du process n'est pas modifiée.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+class RateLimiter:
+    """
+    Seau de jetons asyncio: au plus max_rate acquisitions par période
+
+    Utilisé uniquement depuis la boucle du notifier (pas de verrou).
+    """
+
+    def __init__(self, max_rate, period):
+        self.max_rate = max_rate
+        self.period = period
+        self._tokens = float(max_rate)
+        self._last = time.monotonic()
+
+    async def __aenter__(self):
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self.max_rate,
+                self._tokens + (now - self._last) * self.max_rate / self.period,
+            )
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return self
+            await asyncio.sleep((1 - self._tokens) * self.period / self.max_rate)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
 
 class TelegramNotifier:
     """
@@ -18,77 +201,243 @@ class TelegramNotifier:
     Envoie des alertes et rapports via bot Telegram
     """
 
-    def __init__(self, bot_token, chat_id):
+    def __init__(self, bot_token, chat_id, max_pending=1000):
         """
         Initialise le notifier Telegram
 
         Args:
             bot_token: Token du bot Telegram
             chat_id: ID du chat/canal de destination
+            max_pending: Taille max de la file (les plus anciens sont
+                         abandonnés au-delà)
         """
         self.bot_token = bot_token
         self.chat_id = chat_id
-        self.bot = None
+        self.max_pending = max_pending
+        self._api_url = None
+        self._session = None
         self._loop = None
         self._thread = None
+        self._queue = None
+        self._worker = None
+        self._loop_ready = threading.Event()
+
+        # Limiteurs d'envoi (global au bot, puis par conversation)
+        self._global_limiter = RateLimiter(*GLOBAL_RATE_LIMIT)
+        self._chat_limiter = RateLimiter(
+            *(GROUP_RATE_LIMIT if str(chat_id).startswith("-") else PRIVATE_RATE_LIMIT)
+        )
+
+        # Sans token, le notifier reste désactivé (send_* ne font rien)
+        if not bot_token:
+            logger.warning("Token Telegram absent: notifications désactivées")
+            return
 
         # Initialiser le bot
         try:
-            self.bot = Bot(token=bot_token)
+            self._api_url = f"{TELEGRAM_API_URL}/bot{bot_token}/sendMessage"
             self._start_async_loop()
             logger.info("TelegramNotifier initialisé")
         except Exception as e:
             logger.error(f"Erreur initialisation Telegram: {e}")
-            self.bot = None
+            self._api_url = None
+
+    @property
+    def enabled(self):
+        """True si le bot est configuré (token présent, boucle démarrée)"""
+        return self._api_url is not None
+
+    def _start_async_loop(self, timeout=2):
+        """
+        Démarre une boucle asyncio dans un thread séparé
 
-    def _start_async_loop(self):
-        """Démarre une boucle asyncio dans un thread séparé"""
+        Attend que la boucle tourne (session et file créées) avant de rendre
+        la main: les premiers send_message ne trouvent jamais _loop à None.
+
+        Args:
+            timeout: Délai max d'attente du démarrage (secondes)
+        """
 
         def run_loop():
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
-            self._loop.run_forever()
+            loop = _new_event_loop()
+            asyncio.set_event_loop(loop)
+            loop.set_exception_handler(self._on_loop_exception)
+            self._session = loop.run_until_complete(self._create_session())
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._start_worker(loop)
+            self._loop = loop
+            # Signalé depuis la boucle elle-même: run_forever a démarré
+            loop.call_soon(self._loop_ready.set)
+            # Une exception qui remonte de run_forever ne doit pas tuer le
+            # thread: on la journalise et on relance la même boucle
+            while True:
+                try:
+                    loop.run_forever()
+                    break
+                except Exception:
+                    logger.exception("Boucle Telegram interrompue, redémarrage")
+            loop.close()
 
         self._thread = threading.Thread(target=run_loop, daemon=True)
         self._thread.start()
+        if not self._loop_ready.wait(timeout=timeout):
+            raise RuntimeError("boucle asyncio Telegram non démarrée")
+
+    def _start_worker(self, loop):
+        """Lance le worker de la file, relancé s'il s'arrête sur une erreur"""
+        self._worker = loop.create_task(self._flush_worker())
+        self._worker.add_done_callback(self._on_worker_done)
+
+    def _on_worker_done(self, task):
+        """Relance le worker arrêté par une exception (hors annulation)"""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error(f"Worker Telegram arrêté ({exc!r}), redémarrage")
+            self._start_worker(task.get_loop())
+
+    @staticmethod
+    def _on_loop_exception(loop, context):
+        """Journalise les erreurs non gérées de la boucle sans l'arrêter"""
+        logger.error(
+            f"Erreur boucle Telegram: {context.get('message')}",
+            exc_info=context.get("exception"),
+        )
+
+    @staticmethod
+    async def _create_session():
+        """
+        Session HTTP persistante (créée sur la boucle du notifier)
+
+        Les connexions keep-alive sont réutilisées d'un envoi à l'autre:
+        pas de nouvelle poignée de main TLS par message. aiohttp active
+        TCP_NODELAY sur chaque socket (pas de délai de Nagle sur les petites
+        requêtes), il n'y a donc pas d'option socket à ajouter ici.
+        """
+        # Import paresseux: aiohttp n'est chargé que si Telegram est activé
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(
+            limit=4, keepalive_timeout=75, ttl_dns_cache=300
+        )
+        return aiohttp.ClientSession(
+            connector=connector, timeout=aiohttp.ClientTimeout(total=10)
+        )
 
     def send_message(self, message, parse_mode="Markdown"):
         """
-        Envoie un message simple
+        Met un message en file d'envoi (fire-and-forget)
+
+        Le worker de la boucle asyncio (voir _flush_worker) envoie chaque
+        message par sa propre requête sur la session partagée, sans bloquer
+        l'appelant.
 
         Args:
             message: Message à envoyer
             parse_mode: Format du message (Markdown ou HTML)
+
+        Returns:
+            True si le message a été mis en file (l'envoi lui-même est
+            asynchrone: voir flush_now pour l'attendre), False sinon
         """
-        if not self.bot:
+        if not self.enabled:
             logger.warning("Bot Telegram non initialisé")
             return False
 
         try:
-            future = asyncio.run_coroutine_threadsafe(
-                self._send_message_async(message, parse_mode), self._loop
-            )
-            result = future.result(timeout=10)
-            return result
+            self._loop.call_soon_threadsafe(self._enqueue, (message, parse_mode))
+            return True
         except Exception as e:
             logger.error(f"Erreur envoi message: {e}")
             return False
 
-    async def _send_message_async(self, message, parse_mode):
-        """Envoie un message de manière asynchrone"""
+    def _enqueue(self, item):
+        """Ajoute un message à la file, en abandonnant le plus ancien si pleine"""
+        if self._queue.full():
+            self._queue.get_nowait()
+            self._queue.task_done()
+            logger.warning("File Telegram pleine: message le plus ancien abandonné")
+        self._queue.put_nowait(item)
+
+    def flush_now(self, timeout=10):
+        """
+        Attend l'envoi de tous les messages en file
+
+        Args:
+            timeout: Délai max d'attente (secondes)
+
+        Returns:
+            True si la file a été vidée
+        """
+        if not self.enabled or not self._loop:
+            return False
+
         try:
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode=parse_mode,
-                disable_web_page_preview=True,
-            )
-            logger.debug(f"Message envoyé: {message[:50]}...")
+            future = asyncio.run_coroutine_threadsafe(self._queue.join(), self._loop)
+            future.result(timeout=timeout)
             return True
-        except TelegramError as e:
-            logger.error(f"Erreur Telegram: {e}")
+        except Exception as e:
+            logger.error(f"Erreur vidage file Telegram: {e}")
             return False
 
+    async def _flush_worker(self):
+        """
+        Vide la file dans l'ordre d'arrivée: une requête par message sur la
+        session keep-alive (un message refusé n'affecte pas les suivants)
+        """
+        while True:
+            message, parse_mode = await self._queue.get()
+            try:
+                await self._send_message_async(message, parse_mode)
+            except Exception as e:
+                logger.error(f"Erreur envoi message Telegram: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _send_message_async(self, message, parse_mode):
+        """
+        Envoie un message de manière asynchrone (API Bot sendMessage)
+
+        Les envois sont cadencés par les limiteurs pour ne pas dépasser
+        les limites de Telegram; un refus 429 est réessayé après le délai
+        retry_after indiqué par l'API.
+        """
+        import aiohttp
+
+        payload = {
+            "chat_id": self.chat_id,
+            "text": message,
+            "parse_mode": parse_mode,
+            "disable_web_page_preview": True,
+        }
+        for _ in range(MAX_SEND_ATTEMPTS):
+            try:
+                async with self._global_limiter, self._chat_limiter:
+                    async with self._session.post(
+                        self._api_url, json=payload
+                    ) as response:
+                        result = await response.json(content_type=None)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                logger.error(f"Erreur Telegram: {e}")
+                return False
+
+            if result.get("ok"):
+                logger.debug(f"Message envoyé: {message[:50]}...")
+                return True
+
+            retry_after = result.get("parameters", {}).get("retry_after")
+            if result.get("error_code") != 429 or retry_after is None:
+                break
+
+            logger.warning(
+                f"Limite Telegram atteinte, nouvel essai dans {retry_after}s"
+            )
+            await asyncio.sleep(retry_after)
+
+        logger.error(f"Erreur Telegram: {result.get('description')}")
+        return False
+
     def send_alert(self, alert_message):
         """
         Envoie une alerte urgente
@@ -96,10 +445,15 @@ class TelegramNotifier:
         Args:
             alert_message: Message d'alerte
         """
-        # Ajouter emoji et timestamp
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"🚨 **ALERTE** [{timestamp}]\n\n{alert_message}"
-        return self.send_message(formatted_message)
+        if not self.enabled:
+            return False
+
+        return self.send_message(self._format_alert(alert_message))
+
+    @staticmethod
+    def _format_alert(alert_message, sec=None):
+        """Ajoute emoji et timestamp à une alerte"""
+        return _ALERT_TMPL.format(time=_now(_FMT_HMS, sec), message=alert_message)
 
     def send_trade_notification(self, trade_info):
         """
@@ -108,6 +462,9 @@ class TelegramNotifier:
         Args:
             trade_info: Dictionnaire avec les infos du trade
         """
+        if not self.enabled:
+            return False
+
         try:
             # Formater le message
             side = trade_info.get("side", "").upper()
@@ -116,26 +473,33 @@ class TelegramNotifier:
             price = trade_info.get("price", 0)
             strategy = trade_info.get("strategy", "Unknown")
 
-            # Choisir l'emoji
-            emoji = "📈" if side == "BUY" else "📉"
-
-            message = f"""{emoji} **TRADE EXÉCUTÉ**
-
-**Stratégie:** {strategy}
-**Action:** {side}
-**Symbole:** {symbol}
-**Quantité:** {quantity}
-**Prix:** ${price:.2f}
-**Valeur:** ${quantity * price:.2f}
-**Heure:** {datetime.now().strftime('%H:%M:%S')}
-"""
+            # Choisir l'emoji (📉 pour tout ce qui n'est pas un achat)
+            emoji = _SIDE_EMOJI.get(side, "📉")
+
+            value = quantity * price
+
+            # Lignes assemblées en un seul join (la ligne vide finale
+            # termine le bloc par un saut de ligne)
+            lines = [
+                f"{emoji} **TRADE EXÉCUTÉ**",
+                "",
+                f"**Stratégie:** {strategy}",
+                f"**Action:** {side}",
+                f"**Symbole:** {symbol}",
+                f"**Quantité:** {quantity}",
+                f"**Prix:** ${price:.2f}",
+                f"**Valeur:** ${value:.2f}",
+                f"**Heure:** {_now(_FMT_HMS)}",
+                "",
+            ]
 
             # Ajouter le P&L si c'est une vente
             if side == "SELL" and "pnl" in trade_info:
                 pnl = trade_info["pnl"]
                 pnl_emoji = "✅" if pnl > 0 else "❌"
-                message += f"\n**P&L:** {pnl_emoji} ${pnl:+.2f}"
+                lines.append(f"**P&L:** {pnl_emoji} ${pnl:+.2f}")
 
+            message = "\n".join(lines)
             return self.send_message(message)
 
         except Exception as e:
@@ -149,43 +513,46 @@ class TelegramNotifier:
         Args:
             summary_data: Données du résumé
         """
-        try:
-            message = f"""📊 **RÉSUMÉ QUOTIDIEN**
-{datetime.now().strftime('%Y-%m-%d')}
-{'='*30}
-
-💰 **PORTEFEUILLE**
-• Valeur: ${summary_data.get('portfolio_value', 0):,.2f}
-• Cash: ${summary_data.get('cash', 0):,.2f}
-• P&L Jour: ${summary_data.get('daily_pnl', 0):+,.2f}
-• P&L Total: ${summary_data.get('total_pnl', 0):+,.2f}
+        if not self.enabled:
+            return False
 
-📈 **TRADING**
-• Trades Jour: {summary_data.get('daily_trades', 0)}
-• Trades Total: {summary_data.get('total_trades', 0)}
-• Win Rate: {summary_data.get('win_rate', 0):.1%}
-• Sharpe Ratio: {summary_data.get('sharpe_ratio', 0):.2f}
+        try:
+            # Valeurs calculées > données reçues > valeurs par défaut
+            fields = ChainMap(
+                {
+                    "date": _now(_FMT_DATE),
+                    "breakers": (
+                        "🔴 DÉCLENCHÉ"
+                        if summary_data.get("breakers_triggered")
+                        else "🟢 OK"
+                    ),
+                },
+                summary_data,
+                _SUMMARY_DEFAULTS,
+            )
+            message = _DAILY_SUMMARY_TMPL.format_map(fields)
 
-📉 **RISQUES**
-• Drawdown: {summary_data.get('drawdown', 0):.1%}
-• Exposure: {summary_data.get('exposure', 0):.1%}
-• Circuit Breakers: {"🟢 OK" if not summary_data.get('breakers_triggered') else "🔴 DÉCLENCHÉ"}
-"""
+            # Morceaux assemblés en une seule fois (pas de += en boucle)
+            parts = [message]
 
             # Ajouter les performances par stratégie
             if "strategies" in summary_data:
-                message += "\n🎯 **STRATÉGIES**\n"
+                parts.append("\n🎯 **STRATÉGIES**\n")
                 for name, perf in summary_data["strategies"].items():
                     status = "✅" if perf.get("active") else "⏸️"
-                    message += f"• {name}: {status} ${perf.get('pnl', 0):+,.2f} ({perf.get('trades', 0)} trades)\n"
+                    parts.append(
+                        f"• {name}: {status} ${perf.get('pnl', 0):+,.2f} ({perf.get('trades', 0)} trades)\n"
+                    )
 
             # Ajouter les positions ouvertes
             if "positions" in summary_data and summary_data["positions"]:
-                message += "\n📦 **POSITIONS OUVERTES**\n"
+                parts.append("\n📦 **POSITIONS OUVERTES**\n")
                 for pos in summary_data["positions"][:5]:  # Max 5 positions
-                    message += f"• {pos['symbol']}: {pos['quantity']} @ ${pos['entry_price']:.2f} (P&L: ${pos.get('unrealized_pnl', 0):+.2f})\n"
+                    parts.append(
+                        f"• {pos['symbol']}: {pos['quantity']} @ ${pos['entry_price']:.2f} (P&L: ${pos.get('unrealized_pnl', 0):+.2f})\n"
+                    )
 
-            return self.send_message(message)
+            return self.send_message("".join(parts))
 
         except Exception as e:
             logger.error(f"Erreur résumé quotidien: {e}")
@@ -198,16 +565,18 @@ class TelegramNotifier:
         Args:
             error_info: Information sur l'erreur
         """
-        message = f"""❌ **ERREUR SYSTÈME**
-
-**Type:** {error_info.get('type', 'Unknown')}
-**Message:** {error_info.get('message', 'No details')}
-**Composant:** {error_info.get('component', 'Unknown')}
-**Heure:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        if not self.enabled:
+            return False
 
-⚠️ Vérifiez les logs pour plus de détails.
-"""
-        return self.send_alert(message)
+        # Une seule lecture de l'horloge pour le message et l'en-tête d'alerte
+        sec = int(time.time())
+        message = _ERROR_TMPL.format(
+            type=error_info.get("type", "Unknown"),
+            message=error_info.get("message", "No details"),
+            component=error_info.get("component", "Unknown"),
+            timestamp=_now(_FMT_DATETIME, sec),
+        )
+        return self.send_message(self._format_alert(message, sec))
 
     def send_circuit_breaker_alert(self, breaker_info):
         """
@@ -216,17 +585,16 @@ class TelegramNotifier:
         Args:
             breaker_info: Information sur le circuit breaker déclenché
         """
-        message = f"""🚨 **CIRCUIT BREAKER DÉCLENCHÉ**
-
-**Type:** {breaker_info.get('type', 'Unknown').upper()}
-**Raison:** {breaker_info.get('reason', 'No details')}
-**Valeur:** {breaker_info.get('value', 'N/A')}
-**Seuil:** {breaker_info.get('threshold', 'N/A')}
-
-⏸️ **Trading suspendu pour {breaker_info.get('pause_duration', 60)} minutes**
+        if not self.enabled:
+            return False
 
-Action requise: Vérifiez les conditions du marché et les paramètres de risque.
-"""
+        message = _CIRCUIT_BREAKER_TMPL.format(
+            type=breaker_info.get("type", "Unknown").upper(),
+            reason=breaker_info.get("reason", "No details"),
+            value=breaker_info.get("value", "N/A"),
+            threshold=breaker_info.get("threshold", "N/A"),
+            pause_duration=breaker_info.get("pause_duration", 60),
+        )
         return self.send_alert(message)
 
     def send_performance_update(self, perf_data):
@@ -236,27 +604,22 @@ Action requise: Vérifiez les conditions du marché et les paramètres de risque
         Args:
             perf_data: Données de performance
         """
-        # Déterminer l'emoji basé sur la performance
-        pnl = perf_data.get("pnl", 0)
-        if pnl > 0:
-            emoji = "🟢"
-            trend = "PROFIT"
-        elif pnl < 0:
-            emoji = "🔴"
-            trend = "PERTE"
-        else:
-            emoji = "⚪"
-            trend = "NEUTRE"
-
-        message = f"""{emoji} **PERFORMANCE UPDATE - {trend}**
-
-**P&L Actuel:** ${pnl:+,.2f}
-**Valeur Portfolio:** ${perf_data.get('portfolio_value', 0):,.2f}
-**Rendement:** {perf_data.get('return_pct', 0):+.2%}
-**Trades Aujourd'hui:** {perf_data.get('trades_today', 0)}
+        if not self.enabled:
+            return False
 
-Mise à jour: {datetime.now().strftime('%H:%M:%S')}
-"""
+        # Emoji et tendance selon le signe du P&L
+        pnl = perf_data.get("pnl", 0)
+        sign = (pnl > 0) - (pnl < 0)
+
+        message = _PERFORMANCE_TMPL.format(
+            emoji=_PNL_EMOJI[sign],
+            trend=_PNL_TREND[sign],
+            pnl=pnl,
+            portfolio_value=perf_data.get("portfolio_value", 0),
+            return_pct=perf_data.get("return_pct", 0),
+            trades_today=perf_data.get("trades_today", 0),
+            time=_now(_FMT_HMS),
+        )
         return self.send_message(message)
 
     def send_startup_message(self, config_info):
@@ -266,17 +629,20 @@ Mise à jour: {datetime.now().strftime('%H:%M:%S')}
         Args:
             config_info: Information de configuration
         """
-        message = f"""🚀 **SYSTÈME DÉMARRÉ**
-
-**Mode:** {config_info.get('mode', 'Unknown').upper()}
-**Capital Initial:** ${config_info.get('initial_capital', 0):,.2f}
-**Stratégies Actives:** {config_info.get('active_strategies', 0)}
-**Circuit Breakers:** {"✅ Activés" if config_info.get('circuit_breakers_enabled') else "⚠️ Désactivés"}
-
-Heure de démarrage: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        if not self.enabled:
+            return False
 
-Bonne chance! 🍀
-"""
+        message = _STARTUP_TMPL.format(
+            mode=config_info.get("mode", "Unknown").upper(),
+            initial_capital=config_info.get("initial_capital", 0),
+            active_strategies=config_info.get("active_strategies", 0),
+            breakers=(
+                "✅ Activés"
+                if config_info.get("circuit_breakers_enabled")
+                else "⚠️ Désactivés"
+            ),
+            timestamp=_now(_FMT_DATETIME),
+        )
         return self.send_message(message)
 
     def send_shutdown_message(self, final_stats):
@@ -286,34 +652,69 @@ Bonne chance! 🍀
         Args:
             final_stats: Statistiques finales
         """
-        message = f"""🛑 **SYSTÈME ARRÊTÉ**
-
-**Durée Session:** {final_stats.get('duration', 'N/A')}
-**P&L Final:** ${final_stats.get('final_pnl', 0):+,.2f}
-**Trades Total:** {final_stats.get('total_trades', 0)}
-**Erreurs:** {final_stats.get('errors', 0)}
-
-Heure d'arrêt: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+        if not self.enabled:
+            return False
 
-À bientôt! 👋
-"""
+        message = _SHUTDOWN_TMPL.format(
+            duration=final_stats.get("duration", "N/A"),
+            final_pnl=final_stats.get("final_pnl", 0),
+            total_trades=final_stats.get("total_trades", 0),
+            errors=final_stats.get("errors", 0),
+            timestamp=_now(_FMT_DATETIME),
+        )
         return self.send_message(message)
 
     def test_connection(self):
-        """Teste la connexion Telegram"""
+        """Teste la connexion Telegram (envoi direct, attend la réponse)"""
+        if not self.enabled:
+            logger.warning("Bot Telegram non initialisé")
+            return False
+
         try:
             test_message = "✅ Connexion Telegram établie avec succès!"
-            return self.send_message(test_message)
+            future = asyncio.run_coroutine_threadsafe(
+                self._send_message_async(test_message, "Markdown"), self._loop
+            )
+            return future.result(timeout=10)
         except Exception as e:
             logger.error(f"Test connexion échoué: {e}")
             return False
 
-    def close(self):
-        """Ferme les connexions"""
-        if self._loop:
-            self._loop.call_soon_threadsafe(self._loop.stop)
+    async def _shutdown(self, timeout):
+        """
+        Arrêt propre sur la boucle du notifier: vide la file, arrête le
+        worker puis ferme la session HTTP
+        """
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Arrêt Telegram: {self._queue.qsize()} message(s) non envoyé(s)"
+            )
+        self._worker.cancel()
+        await asyncio.gather(self._worker, return_exceptions=True)
+        await self._session.close()
+
+    def close(self, timeout=10):
+        """
+        Ferme les connexions (après envoi des messages en file)
+
+        Args:
+            timeout: Délai max pour vider la file (secondes)
+        """
+        loop = self._loop
+        if loop:
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(timeout), loop).result(
+                    timeout=timeout + 2
+                )
+            except Exception as e:
+                logger.error(f"Erreur fermeture Telegram: {e}")
+            loop.call_soon_threadsafe(loop.stop)
         if self._thread:
             self._thread.join(timeout=2)
+        self._api_url = None
+        self._loop = None
         logger.info("TelegramNotifier fermé")
 
 
@@ -14,7 +14,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 import streamlit as st
-from optimization.results_storage import ResultsStorage
+from dashboard.components.results_table import load_runs, load_statistics
 
 # Configuration de la page
 st.set_page_config(
@@ -76,8 +76,7 @@ def main():
     # Statistiques globales
     st.markdown("## 📊 Vue d'ensemble")
 
-    storage = ResultsStorage()
-    stats = storage.get_statistics()
+    stats = load_statistics()
 
     col1, col2, col3, col4 = st.columns(4)
 
@@ -169,7 +168,7 @@ def main():
     # Dernières optimisations
     st.markdown("## 🕒 Dernières Optimisations")
 
-    recent_runs = storage.list_runs()[-5:][::-1]  # 5 derniers, ordre inverse
+    recent_runs = load_runs(limit=5, order="desc")
 
     if recent_runs:
         for run in recent_runs:
@@ -2,43 +2,46 @@
 Composants du dashboard Streamlit
 """
 
-from .charts import (
-    create_equity_curve,
-    create_drawdown_chart,
-    create_comparison_chart,
-    create_heatmap,
-    create_walk_forward_analysis,
-    create_distribution_chart,
-    create_scatter_plot,
-    create_parameter_impact_chart,
-)
+import importlib
 
-from .metrics import (
-    display_metric_cards,
-    display_detailed_metrics,
-    display_parameters_card,
-    display_copy_button,
-    display_performance_badge,
-    display_walk_forward_metrics,
-)
-
-from .results_table import (
-    display_runs_table,
-    display_comparison_table,
-    display_parameters_comparison,
-    display_detailed_results_table,
-    create_filterable_table,
-)
-
-from .optimizer_form import (
-    get_available_strategies,
-    display_strategy_selector,
-    display_preset_selector,
-    display_optimization_type_selector,
-    display_config_customization,
-    display_optimization_summary,
-    create_optimization_form,
-)
+# Nom exporté -> sous-module: les sous-modules (Plotly, Streamlit) ne sont
+# importés qu'au premier accès à l'un de leurs noms (PEP 562)
+_LAZY_EXPORTS = {
+    # Charts
+    "create_equity_curve": "charts",
+    "create_drawdown_chart": "charts",
+    "create_comparison_chart": "charts",
+    "create_heatmap": "charts",
+    "create_walk_forward_analysis": "charts",
+    "create_distribution_chart": "charts",
+    "create_scatter_plot": "charts",
+    "create_parameter_impact_chart": "charts",
+    # Metrics
+    "display_metric_cards": "metrics",
+    "display_detailed_metrics": "metrics",
+    "display_parameters_card": "metrics",
+    "display_copy_button": "metrics",
+    "display_performance_badge": "metrics",
+    "display_walk_forward_metrics": "metrics",
+    # Tables
+    "display_runs_table": "results_table",
+    "display_comparison_table": "results_table",
+    "display_parameters_comparison": "results_table",
+    "display_detailed_results_table": "results_table",
+    "create_filterable_table": "results_table",
+    "get_results_storage": "results_table",
+    "load_runs": "results_table",
+    "load_statistics": "results_table",
+    "clear_runs_cache": "results_table",
+    # Forms
+    "get_available_strategies": "optimizer_form",
+    "display_strategy_selector": "optimizer_form",
+    "display_preset_selector": "optimizer_form",
+    "display_optimization_type_selector": "optimizer_form",
+    "display_config_customization": "optimizer_form",
+    "display_optimization_summary": "optimizer_form",
+    "create_optimization_form": "optimizer_form",
+}
 
 __all__ = [
     # Charts
@@ -63,6 +66,10 @@ __all__ = [
     "display_parameters_comparison",
     "display_detailed_results_table",
     "create_filterable_table",
+    "get_results_storage",
+    "load_runs",
+    "load_statistics",
+    "clear_runs_cache",
     # Forms
     "get_available_strategies",
     "display_strategy_selector",
@@ -72,3 +79,18 @@ __all__ = [
     "display_optimization_summary",
     "create_optimization_form",
 ]
+
+
+def __getattr__(name):
+    """Import paresseux des composants exportés (PEP 562)"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Noms exportés (y compris ceux pas encore importés)"""
+    return sorted(set(globals()) | set(__all__))
@@ -4,13 +4,112 @@ Graphiques Plotly pour le dashboard
 """
 
 import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
+import streamlit as st
 from typing import List, Dict, Optional
 
+# Les courbes et nuages de points utilisent go.Scattergl (rendu WebGL):
+# le navigateur ne crée pas un nœud SVG par point.
+# Sérialisation: le moteur JSON 'auto' de plotly.io (défaut, utilisé par
+# st.plotly_chart) passe par orjson dès qu'il est installé.
 
+# Mise en page commune à toutes les figures (courbes: survol unifié sur x)
+_BASE_LAYOUT = {"template": "plotly_dark"}
+_LINE_LAYOUT = {**_BASE_LAYOUT, "hovermode": "x unified"}
+_TOP_LEGEND = dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+
+# Nombre max de points envoyés au navigateur par courbe (equity, drawdown)
+MAX_CURVE_POINTS = 2000
+
+
+def _frame_fingerprint(df: pd.DataFrame):
+    """Empreinte du contenu d'un DataFrame (clé de cache des figures)"""
+    return (
+        df.shape,
+        tuple(df.columns),
+        int(pd.util.hash_pandas_object(df, index=True).sum()),
+    )
+
+
+# Figures mises en cache entre les reruns Streamlit: reconstruites
+# seulement quand les données ou les paramètres changent
+_cache_figure = st.cache_data(
+    hash_funcs={pd.DataFrame: _frame_fingerprint}, max_entries=64, show_spinner=False
+)
+
+
+def _equity_values(df: pd.DataFrame) -> np.ndarray:
+    """
+    Colonne 'equity' (à défaut la première colonne) en ndarray float64
+
+    Seule la colonne retenue est convertie (pas de df.values, qui copierait
+    tout le DataFrame en dtype object si les colonnes sont hétérogènes).
+    """
+    column = df["equity"] if "equity" in df.columns else df.iloc[:, 0]
+    return column.to_numpy(dtype=np.float64)
+
+
+def _equity_from_pnl(pnl: pd.Series, initial_capital: float = 100000.0) -> np.ndarray:
+    """
+    Equity cumulée à partir des P&L de trades (ndarray float64)
+
+    Les P&L manquants restent NaN sans interrompre le cumul, comme
+    Series.cumsum.
+    """
+    values = pnl.to_numpy(dtype=np.float64)
+    equity = np.nancumsum(values)
+    np.add(equity, initial_capital, out=equity)
+    equity[np.isnan(values)] = np.nan
+    return equity
+
+
+def _downsample(y, x=None, max_points: int = MAX_CURVE_POINTS):
+    """
+    Réduit une courbe à ~max_points points avant de l'ajouter à la figure
+
+    Enveloppe min/max par tranche: chaque tranche garde son minimum et son
+    maximum (pics et creux de drawdown conservés), plus le premier et le
+    dernier point. En dessous de max_points, tous les points sont gardés.
+
+    y est renvoyé en float32: précision suffisante pour l'affichage et
+    tableau binaire deux fois plus léger dans la figure sérialisée.
+
+    Args:
+        y: Valeurs de la courbe
+        x: Abscisses (None = position implicite 0..n-1)
+        max_points: Nombre max de points conservés
+
+    Returns:
+        Tuple (x, y) éventuellement réduits
+    """
+    values = np.asarray(y, dtype=np.float64)
+    n = len(values)
+    if n <= max_points:
+        return x, values.astype(np.float32)
+
+    size = -(-n // (max_points // 2))  # taille des tranches (arrondi haut)
+    n_buckets = -(-n // size)
+    pad = n_buckets * size - n
+
+    def _bucket_arg(fill, arg):
+        padded = np.concatenate([values, np.full(pad, fill)]).reshape(n_buckets, -1)
+        return arg(padded, axis=1) + np.arange(n_buckets) * size
+
+    idx = np.unique(
+        np.concatenate(
+            [
+                [0, n - 1],
+                _bucket_arg(np.inf, np.argmin),
+                _bucket_arg(-np.inf, np.argmax),
+            ]
+        )
+    )
+    x_out = idx if x is None else np.asarray(x)[idx]
+    return x_out, values[idx].astype(np.float32)
+
+
+@_cache_figure
 def create_equity_curve(results_df: pd.DataFrame, run_id: str = None) -> go.Figure:
     """
     Crée une equity curve
@@ -26,10 +125,12 @@ def create_equity_curve(results_df: pd.DataFrame, run_id: str = None) -> go.Figu
 
     # Si c'est une série de trades, calculer l'equity curve
     if "pnl" in results_df.columns:
-        equity = results_df["pnl"].cumsum() + 100000  # Supposer capital initial 100k
+        equity = _equity_from_pnl(results_df["pnl"])  # Capital initial 100k supposé
+        x, y = _downsample(equity)
         fig.add_trace(
-            go.Scatter(
-                y=equity,
+            go.Scattergl(
+                x=x,
+                y=y,
                 mode="lines",
                 name="Equity",
                 line=dict(color="#667eea", width=2),
@@ -38,14 +139,14 @@ def create_equity_curve(results_df: pd.DataFrame, run_id: str = None) -> go.Figu
             )
         )
     else:
+        x, y = _downsample(
+            _equity_values(results_df),
+            results_df.index if results_df.index.name else np.arange(len(results_df)),
+        )
         fig.add_trace(
-            go.Scatter(
-                x=results_df.index if results_df.index.name else range(len(results_df)),
-                y=(
-                    results_df["equity"]
-                    if "equity" in results_df
-                    else results_df.iloc[:, 0]
-                ),
+            go.Scattergl(
+                x=x,
+                y=y,
                 mode="lines",
                 name="Equity",
                 line=dict(color="#667eea", width=2),
@@ -55,17 +156,17 @@ def create_equity_curve(results_df: pd.DataFrame, run_id: str = None) -> go.Figu
         )
 
     fig.update_layout(
+        **_LINE_LAYOUT,
         title=f'Equity Curve {f"- {run_id}" if run_id else ""}',
         xaxis_title="Date/Trade",
         yaxis_title="Capital ($)",
-        template="plotly_dark",
-        hovermode="x unified",
         height=400,
     )
 
     return fig
 
 
+@_cache_figure
 def create_drawdown_chart(results_df: pd.DataFrame, run_id: str = None) -> go.Figure:
     """
     Crée un graphique de drawdown
@@ -78,20 +179,19 @@ def create_drawdown_chart(results_df: pd.DataFrame, run_id: str = None) -> go.Fi
         Figure Plotly
     """
     # Calculer le drawdown
-    if "equity" in results_df.columns:
-        equity = results_df["equity"]
-    else:
-        equity = results_df.iloc[:, 0]
+    values = _equity_values(results_df)
 
-    running_max = equity.expanding().max()
-    drawdown = (equity - running_max) / running_max * 100
+    # Plus haut courant (fmax ignore les NaN comme expanding().max())
+    running_max = np.fmax.accumulate(values)
+    drawdown = (values - running_max) / running_max * 100.0
 
     fig = go.Figure()
 
+    x, y = _downsample(drawdown, results_df.index)
     fig.add_trace(
-        go.Scatter(
-            x=drawdown.index if hasattr(drawdown, "index") else range(len(drawdown)),
-            y=drawdown,
+        go.Scattergl(
+            x=x,
+            y=y,
             mode="lines",
             name="Drawdown",
             line=dict(color="#f87171", width=2),
@@ -101,17 +201,17 @@ def create_drawdown_chart(results_df: pd.DataFrame, run_id: str = None) -> go.Fi
     )
 
     fig.update_layout(
+        **_LINE_LAYOUT,
         title=f'Drawdown {f"- {run_id}" if run_id else ""}',
         xaxis_title="Date/Trade",
         yaxis_title="Drawdown (%)",
-        template="plotly_dark",
-        hovermode="x unified",
         height=300,
     )
 
     return fig
 
 
+@_cache_figure
 def create_comparison_chart(runs_data: Dict[str, pd.DataFrame]) -> go.Figure:
     """
     Compare plusieurs equity curves
@@ -127,16 +227,16 @@ def create_comparison_chart(runs_data: Dict[str, pd.DataFrame]) -> go.Figure:
     colors = ["#667eea", "#f87171", "#34d399", "#fbbf24", "#a78bfa"]
 
     for i, (run_id, df) in enumerate(runs_data.items()):
-        if "equity" in df.columns:
-            equity = df["equity"]
-        elif "pnl" in df.columns:
-            equity = df["pnl"].cumsum() + 100000
+        if "pnl" in df.columns and "equity" not in df.columns:
+            equity = _equity_from_pnl(df["pnl"])
         else:
-            equity = df.iloc[:, 0]
+            equity = _equity_values(df)
 
+        x, y = _downsample(equity)
         fig.add_trace(
-            go.Scatter(
-                y=equity,
+            go.Scattergl(
+                x=x,
+                y=y,
                 mode="lines",
                 name=run_id[:20],  # Limiter la longueur
                 line=dict(color=colors[i % len(colors)], width=2),
@@ -144,18 +244,18 @@ def create_comparison_chart(runs_data: Dict[str, pd.DataFrame]) -> go.Figure:
         )
 
     fig.update_layout(
+        **_LINE_LAYOUT,
         title="Comparaison des Equity Curves",
         xaxis_title="Trade/Période",
         yaxis_title="Capital ($)",
-        template="plotly_dark",
-        hovermode="x unified",
         height=500,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        legend=_TOP_LEGEND,
     )
 
     return fig
 
 
+@_cache_figure
 def create_heatmap(
     results_df: pd.DataFrame, x_param: str, y_param: str, metric: str = "sharpe"
 ) -> go.Figure:
@@ -171,18 +271,24 @@ def create_heatmap(
     Returns:
         Figure Plotly
     """
-    # Créer un pivot table
-    pivot = results_df.pivot_table(
-        values=metric, index=y_param, columns=x_param, aggfunc="mean"
+    # Moyenne par couple (y, x) en un seul groupby, puis mise en grille
+    # (lignes/colonnes sans valeur écartées, comme avec pivot_table)
+    pivot = (
+        results_df.groupby([y_param, x_param], sort=True, observed=True)[metric]
+        .mean()
+        .unstack(x_param)
+        .dropna(how="all")
+        .dropna(axis=1, how="all")
     )
+    z = pivot.to_numpy(dtype=np.float32)
 
     fig = go.Figure(
         data=go.Heatmap(
-            z=pivot.values,
-            x=pivot.columns,
-            y=pivot.index,
+            z=z,
+            x=pivot.columns.to_numpy(),
+            y=pivot.index.to_numpy(),
             colorscale="RdYlGn",
-            text=pivot.values,
+            text=z,
             texttemplate="%{text:.2f}",
             textfont={"size": 10},
             colorbar=dict(title=metric.capitalize()),
@@ -190,10 +296,10 @@ def create_heatmap(
     )
 
     fig.update_layout(
+        **_BASE_LAYOUT,
         title=f"Heatmap: {x_param} vs {y_param} ({metric})",
         xaxis_title=x_param,
         yaxis_title=y_param,
-        template="plotly_dark",
         height=500,
     )
 
@@ -210,18 +316,22 @@ def create_walk_forward_analysis(wf_results: List[Dict]) -> go.Figure:
     Returns:
         Figure Plotly avec In-Sample vs Out-Sample
     """
-    df = pd.DataFrame(wf_results)
+    # Colonnes extraites en un seul passage (pas de DataFrame intermédiaire)
+    count = len(wf_results)
+    periods = np.fromiter((r["period"] for r in wf_results), dtype=object, count=count)
+    in_sharpe = np.array([r["in_sharpe"] for r in wf_results], dtype=np.float64)
+    out_sharpe = np.array([r["out_sharpe"] for r in wf_results], dtype=np.float64)
 
     fig = go.Figure()
 
     # In-Sample
     fig.add_trace(
         go.Bar(
-            x=df["period"],
-            y=df["in_sharpe"],
+            x=periods,
+            y=in_sharpe,
             name="In-Sample",
             marker_color="#667eea",
-            text=df["in_sharpe"].round(2),
+            text=np.round(in_sharpe, 2),
             textposition="outside",
         )
     )
@@ -229,28 +339,29 @@ def create_walk_forward_analysis(wf_results: List[Dict]) -> go.Figure:
     # Out-Sample
     fig.add_trace(
         go.Bar(
-            x=df["period"],
-            y=df["out_sharpe"],
+            x=periods,
+            y=out_sharpe,
             name="Out-Sample",
             marker_color="#f87171",
-            text=df["out_sharpe"].round(2),
+            text=np.round(out_sharpe, 2),
             textposition="outside",
         )
     )
 
     fig.update_layout(
+        **_BASE_LAYOUT,
         title="Walk-Forward Analysis: In-Sample vs Out-Sample",
         xaxis_title="Période",
         yaxis_title="Sharpe Ratio",
-        template="plotly_dark",
         barmode="group",
         height=400,
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        legend=_TOP_LEGEND,
     )
 
     return fig
 
 
+@_cache_figure
 def create_distribution_chart(
     results_df: pd.DataFrame, metric: str = "sharpe"
 ) -> go.Figure:
@@ -264,12 +375,19 @@ def create_distribution_chart(
     Returns:
         Figure Plotly
     """
+    values = results_df[metric].to_numpy(dtype=np.float64)
+    values = values[np.isfinite(values)]
+
+    # Classes calculées ici: le navigateur reçoit 30 barres, pas N valeurs
+    counts, edges = np.histogram(values, bins=30)
+
     fig = go.Figure()
 
     fig.add_trace(
-        go.Histogram(
-            x=results_df[metric],
-            nbinsx=30,
+        go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
             name=metric.capitalize(),
             marker_color="#667eea",
             opacity=0.7,
@@ -277,7 +395,7 @@ def create_distribution_chart(
     )
 
     # Ajouter une ligne verticale pour la médiane
-    median_value = results_df[metric].median()
+    median_value = float(np.median(values)) if values.size else float("nan")
     fig.add_vline(
         x=median_value,
         line_dash="dash",
@@ -287,11 +405,12 @@ def create_distribution_chart(
     )
 
     fig.update_layout(
+        **_BASE_LAYOUT,
         title=f"Distribution de {metric.capitalize()}",
         xaxis_title=metric.capitalize(),
         yaxis_title="Fréquence",
-        template="plotly_dark",
         height=400,
+        bargap=0,
     )
 
     return fig
@@ -302,6 +421,7 @@ def create_scatter_plot(
     x_metric: str = "return",
     y_metric: str = "sharpe",
     color_by: Optional[str] = None,
+    hover_cols: Optional[List[str]] = None,
 ) -> go.Figure:
     """
     Crée un scatter plot
@@ -311,35 +431,49 @@ def create_scatter_plot(
         x_metric: Métrique pour axe X
         y_metric: Métrique pour axe Y
         color_by: Paramètre pour colorer les points
+        hover_cols: Colonnes supplémentaires affichées au survol (les axes
+                    et color_by sont toujours inclus)
 
     Returns:
         Figure Plotly
     """
     if color_by and color_by in results_df.columns:
+        # Import paresseux: plotly.express n'est chargé que pour ce cas
+        import plotly.express as px
+
+        # Seules les colonnes affichées sont envoyées au navigateur
+        hover_data = list(
+            dict.fromkeys([x_metric, y_metric, color_by, *(hover_cols or [])])
+        )
         fig = px.scatter(
-            results_df,
+            results_df[hover_data],
             x=x_metric,
             y=y_metric,
             color=color_by,
-            template="plotly_dark",
+            template=_BASE_LAYOUT["template"],
             height=500,
-            hover_data=results_df.columns,
+            hover_data=hover_data,
+            render_mode="webgl",
         )
     else:
+        # Colonnes converties une seule fois (y sert aussi à la couleur)
+        x_values = results_df[x_metric].to_numpy(dtype=np.float32)
+        y_values = results_df[y_metric].to_numpy(dtype=np.float32)
+
         fig = go.Figure()
         fig.add_trace(
-            go.Scatter(
-                x=results_df[x_metric],
-                y=results_df[y_metric],
+            go.Scattergl(
+                x=x_values,
+                y=y_values,
                 mode="markers",
                 marker=dict(
                     size=8,
-                    color=results_df[y_metric],
+                    color=y_values,
                     colorscale="RdYlGn",
                     showscale=True,
                     colorbar=dict(title=y_metric.capitalize()),
                 ),
-                text=results_df.index,
+                text=results_df.index.astype(str).to_numpy(),
                 hovertemplate="<b>%{text}</b><br>"
                 + f"{x_metric}: %{{x:.2f}}<br>"
                 + f"{y_metric}: %{{y:.2f}}<extra></extra>",
@@ -347,10 +481,10 @@ def create_scatter_plot(
         )
 
     fig.update_layout(
+        **_BASE_LAYOUT,
         title=f"{y_metric.capitalize()} vs {x_metric.capitalize()}",
         xaxis_title=x_metric.capitalize(),
         yaxis_title=y_metric.capitalize(),
-        template="plotly_dark",
         height=500,
     )
 
@@ -371,24 +505,30 @@ def create_parameter_impact_chart(
     Returns:
         Figure Plotly
     """
-    # Grouper par paramètre et calculer la moyenne
+    # Grouper par paramètre et calculer la moyenne (observed=True: une colonne
+    # déjà catégorielle ne produit pas de groupes vides)
     grouped = (
-        results_df.groupby(param)[metric].agg(["mean", "std", "count"]).reset_index()
+        results_df.groupby(param, observed=True)[metric]
+        .agg(["mean", "std", "count"])
+        .reset_index()
     )
+    x = grouped[param].to_numpy()
+    mean = grouped["mean"].to_numpy()
+    std = grouped["std"].to_numpy()
 
     fig = go.Figure()
 
     fig.add_trace(
-        go.Scatter(
-            x=grouped[param],
-            y=grouped["mean"],
+        go.Scattergl(
+            x=x,
+            y=mean,
             mode="lines+markers",
             name="Moyenne",
             line=dict(color="#667eea", width=3),
             marker=dict(size=10),
             error_y=dict(
                 type="data",
-                array=grouped["std"],
+                array=std,
                 visible=True,
                 color="rgba(102, 126, 234, 0.3)",
             ),
@@ -396,12 +536,11 @@ def create_parameter_impact_chart(
     )
 
     fig.update_layout(
+        **_LINE_LAYOUT,
         title=f"Impact de {param} sur {metric.capitalize()}",
         xaxis_title=param,
         yaxis_title=f"{metric.capitalize()} (moyenne ± std)",
-        template="plotly_dark",
         height=400,
-        hovermode="x unified",
     )
 
     return fig
@@ -6,6 +6,11 @@ Composants de métriques pour le dashboard
 import streamlit as st
 from typing import Dict, Optional
 
+# Clés de résultats (métriques) à ne pas afficher comme paramètres
+_METRIC_KEYS = frozenset(
+    ["sharpe", "return", "drawdown", "trades", "win_rate", "avg_win", "avg_loss"]
+)
+
 
 def display_metric_cards(results: Dict):
     """
@@ -90,28 +95,16 @@ def display_parameters_card(params: Dict):
     st.markdown("### 🎯 Meilleurs Paramètres")
 
     # Filtrer les paramètres (enlever les métriques)
-    exclude_keys = [
-        "sharpe",
-        "return",
-        "drawdown",
-        "trades",
-        "win_rate",
-        "avg_win",
-        "avg_loss",
-    ]
-    clean_params = {k: v for k, v in params.items() if k not in exclude_keys}
+    clean_params = {k: v for k, v in params.items() if k not in _METRIC_KEYS}
 
     if clean_params:
-        # Afficher en colonnes
-        num_cols = min(3, len(clean_params))
-        cols = st.columns(num_cols)
-
-        for i, (key, value) in enumerate(clean_params.items()):
-            with cols[i % num_cols]:
-                # Formater le nom du paramètre
-                display_name = key.replace("_", " ").title()
-                st.markdown(f"**{display_name}**")
-                st.code(str(value))
+        # Un seul tableau markdown (un seul élément Streamlit pour N paramètres)
+        pipe = r"\|"  # '|' échappé pour ne pas couper la cellule
+        rows = "\n".join(
+            f"| {key.replace('_', ' ').title()} | `{str(value).replace('|', pipe)}` |"
+            for key, value in clean_params.items()
+        )
+        st.markdown(f"| Paramètre | Valeur |\n|---|---|\n{rows}")
     else:
         st.info("Aucun paramètre à afficher")
 
@@ -124,26 +117,19 @@ def display_copy_button(params: Dict):
         params: Dictionnaire de paramètres
     """
     # Filtrer les paramètres
-    exclude_keys = [
-        "sharpe",
-        "return",
-        "drawdown",
-        "trades",
-        "win_rate",
-        "avg_win",
-        "avg_loss",
-    ]
-    clean_params = {k: v for k, v in params.items() if k not in exclude_keys}
+    clean_params = {k: v for k, v in params.items() if k not in _METRIC_KEYS}
 
     if clean_params:
         # Créer le code Python à copier
-        params_str = "params = {\n"
-        for key, value in clean_params.items():
-            if isinstance(value, str):
-                params_str += f"    '{key}': '{value}',\n"
-            else:
-                params_str += f"    '{key}': {value},\n"
-        params_str += "}"
+        lines = [
+            (
+                f"    '{key}': '{value}',"
+                if isinstance(value, str)
+                else f"    '{key}': {value},"
+            )
+            for key, value in clean_params.items()
+        ]
+        params_str = "\n".join(["params = {", *lines, "}"])
 
         col1, col2 = st.columns([3, 1])
 
@@ -181,6 +167,12 @@ def display_performance_badge(sharpe: float) -> str:
     return badge
 
 
+def _mean_field(rows: list, key: str) -> float:
+    """Moyenne d'un champ sur une liste de dicts (None/NaN ignorés)"""
+    values = [r[key] for r in rows if r[key] is not None and r[key] == r[key]]
+    return sum(values) / len(values) if values else float("nan")
+
+
 def display_walk_forward_metrics(wf_results: list):
     """
     Affiche les métriques Walk-Forward
@@ -191,24 +183,20 @@ def display_walk_forward_metrics(wf_results: list):
     if not wf_results:
         return
 
-    import pandas as pd
-
-    df = pd.DataFrame(wf_results)
-
     st.markdown("### 📊 Analyse Walk-Forward")
 
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        avg_in = df["in_sharpe"].mean()
+        avg_in = _mean_field(wf_results, "in_sharpe")
         st.metric("📈 Avg In-Sample Sharpe", f"{avg_in:.2f}")
 
     with col2:
-        avg_out = df["out_sharpe"].mean()
+        avg_out = _mean_field(wf_results, "out_sharpe")
         st.metric("📉 Avg Out-Sample Sharpe", f"{avg_out:.2f}")
 
     with col3:
-        avg_deg = df["degradation"].mean()
+        avg_deg = _mean_field(wf_results, "degradation")
         color = "normal" if avg_deg < 0.3 else "inverse"
         st.metric("⚠️ Dégradation Moyenne", f"{avg_deg:.2f}", delta_color=color)
 
@@ -4,15 +4,24 @@ Formulaire pour lancer une optimisation
 """
 
 import streamlit as st
-from typing import Dict, Tuple, Optional
+from functools import lru_cache
+from math import prod
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple, Optional
 from optimization.optimization_config import OptimizationConfig
 import importlib
 from datetime import datetime
 from components.optuna_components import display_optuna_config_section
 
 
-def get_available_strategies() -> Dict[str, type]:
-    """Récupère les stratégies disponibles"""
+@lru_cache(maxsize=1)
+def get_available_strategies() -> Mapping[str, type]:
+    """
+    Récupère les stratégies disponibles
+
+    Le sondage des imports n'est fait qu'une fois par process; le résultat
+    (partagé entre les reruns) est en lecture seule.
+    """
     strategies = {}
 
     # Import des stratégies de base
@@ -64,7 +73,13 @@ def get_available_strategies() -> Dict[str, type]:
     except:
         pass
 
-    return strategies
+    return MappingProxyType(strategies)
+
+
+@st.cache_resource
+def _config_manager() -> OptimizationConfig:
+    """Gestionnaire de presets partagé (fichier JSON lu une fois par process)"""
+    return OptimizationConfig()
 
 
 def display_strategy_selector() -> Tuple[str, Optional[type]]:
@@ -105,7 +120,7 @@ def display_preset_selector(strategy_name: str = None) -> Tuple[str, Dict]:
     Returns:
         (preset_name, config)
     """
-    config_manager = OptimizationConfig()
+    config_manager = _config_manager()
     presets = config_manager.list_presets()
 
     # Sélection du preset
@@ -143,11 +158,7 @@ def display_preset_selector(strategy_name: str = None) -> Tuple[str, Dict]:
                 st.write(f"  • **{param}**: {values} ({len(values)} valeurs)")
 
             # Calculer combinaisons
-            from itertools import product
-
-            total_combos = 1
-            for values in param_grid.values():
-                total_combos *= len(values)
+            total_combos = prod(len(v) for v in param_grid.values())
 
             st.metric("💎 Combinaisons Totales", f"{total_combos:,}")
         else:
@@ -280,11 +291,7 @@ def display_optimization_summary(strategy_name: str, config: Dict, opt_type: str
         st.markdown(f"**💰 Capital:** ${config.get('capital', 100000):,}")
 
         # Calculer le nombre de combinaisons
-        from itertools import product
-
-        total_combos = 1
-        for values in config["param_grid"].values():
-            total_combos *= len(values)
+        total_combos = prod(len(v) for v in config["param_grid"].values())
 
         st.markdown(f"**🎲 Combinaisons:** {total_combos:,}")
 
@@ -333,8 +340,15 @@ def create_optimization_form() -> Tuple[Optional[type], Optional[Dict], Optional
     # Étape 4: Personnalisation (optionnel)
     config = display_config_customization(config)
 
+    # Réglages Optuna saisis dans le formulaire (trials, workers, storage...)
+    if opt_type == "optuna":
+        config["optuna"] = {
+            **config.get("optuna", {}),
+            **st.session_state.get("optuna_config", {}),
+        }
+
     # 🔥 NOUVELLE VALIDATION : Vérifier cohérence param_grid
-    config_manager = OptimizationConfig()
+    config_manager = _config_manager()
     is_valid, warnings = config_manager.validate_strategy_params(
         strategy_class, config.get("param_grid", {})
     )
@@ -5,9 +5,38 @@ Composants Streamlit pour l'optimisation Optuna
 À intégrer dans dashboard/components/optimizer_form.py
 """
 
+import os
+
 import streamlit as st
 from typing import Dict, Optional
 
+# Libellés des options (constants, pas réalloués à chaque rerun)
+_SAMPLER_LABELS = {
+    "tpe": "🌳 TPE - Tree-structured Parzen Estimator (recommandé)",
+    "random": "🎲 Random - Échantillonnage aléatoire",
+}
+
+_PRUNER_LABELS = {
+    "median": "📊 Median - Arrête les trials sous-performants",
+    "successive_halving": "🔪 Successive Halving - Très agressif",
+    "none": "🚫 Aucun - Tous les trials jusqu'au bout",
+}
+
+_PRUNER_OPTIONS = list(_PRUNER_LABELS)
+
+_N_CPUS = os.cpu_count() or 1
+
+
+@st.cache_data(show_spinner=False)
+def _importance_df(items: tuple):
+    """Importance des paramètres triée, mise en cache entre les reruns"""
+    import pandas as pd
+
+    # Tri croissant: la barre horizontale la plus importante est en haut
+    return pd.DataFrame(
+        sorted(items, key=lambda x: x[1]), columns=["Paramètre", "Importance"]
+    )
+
 
 def display_optuna_config_section() -> Dict:
     """
@@ -32,11 +61,8 @@ def display_optuna_config_section() -> Dict:
 
         sampler = st.selectbox(
             "🧠 Algorithme de sampling",
-            options=["tpe", "random"],
-            format_func=lambda x: {
-                "tpe": "🌳 TPE - Tree-structured Parzen Estimator (recommandé)",
-                "random": "🎲 Random - Échantillonnage aléatoire",
-            }[x],
+            options=list(_SAMPLER_LABELS),
+            format_func=_SAMPLER_LABELS.get,
             help="TPE est intelligent et apprend des essais précédents",
         )
 
@@ -53,13 +79,14 @@ def display_optuna_config_section() -> Dict:
 
         pruner = st.selectbox(
             "✂️ Stratégie de pruning",
-            options=["median", "successive_halving", "none"],
-            format_func=lambda x: {
-                "median": "📊 Median - Arrête les trials sous-performants",
-                "successive_halving": "🔪 Successive Halving - Très agressif",
-                "none": "🚫 Aucun - Tous les trials jusqu'au bout",
-            }[x],
-            help="Le pruning accélère l'optimisation en arrêtant les mauvais essais",
+            options=_PRUNER_OPTIONS,
+            index=_PRUNER_OPTIONS.index("median"),
+            format_func=_PRUNER_LABELS.get,
+            help=(
+                "Le pruning arrête les mauvais essais à partir de valeurs "
+                "intermédiaires. Un backtest ne rapporte qu'un score final: "
+                "sans effet sur les optimisations lancées ici"
+            ),
         )
 
     save_plots = st.checkbox(
@@ -76,10 +103,20 @@ def display_optuna_config_section() -> Dict:
             help="Quelle métrique Optuna doit-il maximiser ?",
         )
 
-        parallel = st.checkbox(
-            "⚡ Parallélisation",
-            value=True,
-            help="Utilise tous les CPUs disponibles (plus rapide)",
+        n_workers = st.slider(
+            "⚡ Workers parallèles",
+            min_value=1,
+            # st.slider exige min < max, même sur une machine mono-cœur
+            max_value=max(2, _N_CPUS),
+            value=_N_CPUS,
+            key="optuna_n_workers",
+            help="Nombre de process qui partagent l'étude (1 = séquentiel)",
+        )
+
+        storage_url = st.text_input(
+            "🗄️ Storage URL",
+            value="sqlite:///results/optuna_studies/optuna.db",
+            help="Base partagée par les workers (SQLite ou PostgreSQL/MySQL)",
         )
 
     # Estimation du temps
@@ -99,7 +136,8 @@ def display_optuna_config_section() -> Dict:
         "pruner": pruner,
         "save_plots": save_plots,
         "optimize_metric": optimize_metric,
-        "use_parallel": parallel,
+        "n_workers": n_workers,
+        "storage": storage_url,
     }
 
 
@@ -134,26 +172,22 @@ def display_optuna_results(results: Dict):
 
         importance = results["param_importance"]
 
-        # Créer un DataFrame pour l'affichage
-        import pandas as pd
+        # Un seul graphique plutôt que trois widgets par paramètre
+        import plotly.express as px
 
-        df_importance = pd.DataFrame(
-            [
-                {"Paramètre": param, "Importance": imp}
-                for param, imp in sorted(
-                    importance.items(), key=lambda x: x[1], reverse=True
-                )
-            ]
-        )
+        df_importance = _importance_df(tuple(importance.items()))
 
-        # Afficher avec barre de progression
-        for _, row in df_importance.iterrows():
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                st.progress(row["Importance"])
-                st.caption(row["Paramètre"])
-            with col2:
-                st.metric("", f"{row['Importance']:.3f}")
+        fig = px.bar(
+            df_importance,
+            x="Importance",
+            y="Paramètre",
+            orientation="h",
+            text="Importance",
+            template="plotly_dark",
+        )
+        fig.update_traces(texttemplate="%{text:.3f}")
+        fig.update_layout(height=max(250, 40 * len(df_importance)))
+        st.plotly_chart(fig, use_container_width=True)
 
     # Lien vers les visualisations
     if results.get("optuna_storage"):
@@ -204,16 +238,24 @@ def display_optuna_comparison(results_list: list):
     # Afficher le tableau
     st.dataframe(df, use_container_width=True)
 
-    # Graphiques de comparaison
-    col1, col2 = st.columns(2)
-
-    with col1:
-        fig = px.bar(df, x="Run", y="Sharpe", title="Sharpe Ratio Comparison")
-        st.plotly_chart(fig, use_container_width=True)
-
-    with col2:
-        fig = px.bar(df, x="Run", y="Return", title="Return Comparison")
-        st.plotly_chart(fig, use_container_width=True)
+    # Graphiques de comparaison: une seule figure à deux facettes
+    df_long = df.melt(
+        id_vars="Run",
+        value_vars=["Sharpe", "Return"],
+        var_name="Metric",
+        value_name="Value",
+    )
+    fig = px.bar(
+        df_long,
+        x="Run",
+        y="Value",
+        facet_col="Metric",
+        title="Sharpe Ratio / Return Comparison",
+    )
+    # Échelles indépendantes (Sharpe et Return n'ont pas le même ordre de grandeur)
+    fig.update_yaxes(matches=None, showticklabels=True)
+    fig.for_each_annotation(lambda a: a.update(text=a.text.split("=")[-1]))
+    st.plotly_chart(fig, use_container_width=True)
 
 
 # MODIFICATION À FAIRE DANS optimizer_form.py
@@ -9,26 +9,73 @@ from typing import List, Dict, Optional
 from optimization.results_storage import ResultsStorage
 
 
-def display_runs_table(
-    runs: List[Dict], selectable: bool = False, show_actions: bool = True
-) -> List[str]:
+@st.cache_resource
+def get_results_storage() -> ResultsStorage:
+    """Instance unique de ResultsStorage partagée entre les reruns et les pages"""
+    return ResultsStorage()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_runs(limit: Optional[int] = None, order: str = "asc") -> List[Dict]:
+    """Liste des runs, mise en cache entre les reruns (voir clear_runs_cache)"""
+    return get_results_storage().list_runs(limit=limit, order=order)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_statistics() -> Dict:
+    """Statistiques globales, mises en cache comme la liste des runs"""
+    return get_results_storage().get_statistics()
+
+
+def clear_runs_cache():
     """
-    Affiche un tableau de runs avec filtres
+    Invalide la liste des runs et les statistiques mises en cache
 
-    Args:
-        runs: Liste de runs
-        selectable: Permettre la sélection multiple
-        show_actions: Afficher les boutons d'action
+    À appeler après un ajout (fin d'optimisation) ou une suppression de
+    run; les autres caches (figures, tableaux) sont conservés.
+    """
+    load_runs.clear()
+    load_statistics.clear()
 
-    Returns:
-        Liste des run_ids sélectionnés (si selectable=True)
+
+# Formats d'affichage du tableau des runs (appliqués par le frontend)
+_RUNS_COLUMN_CONFIG = {
+    "Sharpe": st.column_config.NumberColumn(format="%.2f"),
+    "Return (%)": st.column_config.NumberColumn(format="%.2f"),
+    "Date": st.column_config.DatetimeColumn(format="YYYY-MM-DD HH:mm"),
+}
+
+
+def _join_symbols(symbols: pd.Series) -> pd.Series:
+    """Joint les listes de symboles ("A, B"), en vectorisé si possible"""
+    if all(isinstance(x, list) for x in symbols.dropna().to_numpy()):
+        return symbols.str.join(", ")
+    return symbols.apply(lambda x: ", ".join(x) if isinstance(x, list) else x)
+
+
+def _shrink(df: pd.DataFrame) -> pd.DataFrame:
     """
-    if not runs:
-        st.info("Aucun run disponible")
-        return []
+    Réduit les colonnes numériques (float32, plus petit entier possible)
+    avant l'envoi au frontend: moins d'octets sérialisés en Arrow
+    """
+    floats = df.select_dtypes("float").columns
+    integers = df.select_dtypes("integer").columns
+    return df.assign(
+        **{col: pd.to_numeric(df[col], downcast="float") for col in floats},
+        **{col: pd.to_numeric(df[col], downcast="integer") for col in integers},
+    )
+
 
-    # Convertir en DataFrame
-    df = pd.DataFrame(runs)
+@st.cache_data(show_spinner=False)
+def _runs_frame(runs: List[Dict]) -> pd.DataFrame:
+    """DataFrame brut des runs, mis en cache entre les reruns"""
+    return pd.DataFrame(runs)
+
+
+@st.cache_data(show_spinner=False)
+def _format_runs_df(runs: List[Dict]) -> pd.DataFrame:
+    """Tableau des runs formaté pour l'affichage, mis en cache entre les reruns"""
+    df = _runs_frame(runs)
 
     # Colonnes à afficher
     display_cols = [
@@ -44,21 +91,17 @@ def display_runs_table(
 
     # Vérifier les colonnes disponibles
     available_cols = [col for col in display_cols if col in df.columns]
-    df_display = df[available_cols].copy()
 
-    # Formater
-    if "best_sharpe" in df_display.columns:
-        df_display["best_sharpe"] = df_display["best_sharpe"].round(2)
-    if "best_return" in df_display.columns:
-        df_display["best_return"] = df_display["best_return"].round(2)
-    if "timestamp" in df_display.columns:
-        df_display["timestamp"] = pd.to_datetime(df_display["timestamp"]).dt.strftime(
-            "%Y-%m-%d %H:%M"
-        )
-    if "symbols" in df_display.columns:
-        df_display["symbols"] = df_display["symbols"].apply(
-            lambda x: ", ".join(x) if isinstance(x, list) else x
-        )
+    # Types natifs (float, datetime): l'arrondi et le format de date sont
+    # appliqués côté frontend via _RUNS_COLUMN_CONFIG, les colonnes restent
+    # triables. Une seule nouvelle frame (sélection + assign).
+    formatters = {
+        "timestamp": lambda d: pd.to_datetime(d["timestamp"]),
+        "symbols": lambda d: _join_symbols(d["symbols"]),
+    }
+    df_display = df.loc[:, available_cols].assign(
+        **{col: fmt for col, fmt in formatters.items() if col in available_cols}
+    )
 
     # Renommer colonnes
     rename_map = {
@@ -71,7 +114,36 @@ def display_runs_table(
         "symbols": "Symboles",
         "timestamp": "Date",
     }
-    df_display = df_display.rename(columns=rename_map)
+
+    return df_display.rename(columns=rename_map)
+
+
+def _on_run_selected():
+    """Run choisi dans le tableau: devient le run actif pour l'analyse"""
+    st.session_state["active_run"] = st.session_state["action_run_select"]
+
+
+def display_runs_table(
+    runs: List[Dict], selectable: bool = False, show_actions: bool = True
+) -> List[str]:
+    """
+    Affiche un tableau de runs avec filtres
+
+    Args:
+        runs: Liste de runs
+        selectable: Permettre la sélection multiple
+        show_actions: Afficher les boutons d'action
+
+    Returns:
+        Liste des run_ids sélectionnés (si selectable=True)
+    """
+    if not runs:
+        st.info("Aucun run disponible")
+        return []
+
+    # Transformations mises en cache (inchangées d'un rerun à l'autre)
+    df = _runs_frame(runs)
+    df_display = _shrink(_format_runs_df(runs))
 
     # Mode sélection
     selected_runs = []
@@ -84,11 +156,12 @@ def display_runs_table(
             use_container_width=True,
             disabled=[col for col in df_display.columns],
             column_config={
+                **_RUNS_COLUMN_CONFIG,
                 "_selected": st.column_config.CheckboxColumn(
                     "Sélectionner",
                     help="Sélectionner pour comparaison",
                     default=False,
-                )
+                ),
             },
         )
 
@@ -97,7 +170,13 @@ def display_runs_table(
 
     else:
         # Simple affichage
-        st.dataframe(df_display, hide_index=True, use_container_width=True, height=400)
+        st.dataframe(
+            df_display,
+            hide_index=True,
+            use_container_width=True,
+            height=400,
+            column_config=_RUNS_COLUMN_CONFIG,
+        )
 
     # Actions
     if show_actions and not df_display.empty:
@@ -106,22 +185,35 @@ def display_runs_table(
         cols = st.columns([1, 1, 1, 2])
 
         with cols[0]:
+            run_ids = df["run_id"].tolist()
+            active_run = st.session_state.get("active_run")
             selected_run = st.selectbox(
                 "Sélectionner un run",
-                options=df["run_id"].tolist(),
+                options=run_ids,
+                index=run_ids.index(active_run) if active_run in run_ids else 0,
                 format_func=lambda x: x[:30] + "..." if len(x) > 30 else x,
                 key="action_run_select",
+                on_change=_on_run_selected,
             )
+            # Run repris par la page d'analyse: uniquement s'il n'y en a pas
+            # (un choix explicite passe par _on_run_selected)
+            if not active_run:
+                st.session_state["active_run"] = selected_run
 
         with cols[1]:
-            if st.button("🔬 Analyser", use_container_width=True):
-                st.session_state["active_run"] = selected_run
-                st.switch_page("pages/4_🔬_Analyze_Strategy.py")
+            # Lien de navigation: pas de switch_page depuis un bouton
+            st.page_link(
+                "pages/4_Analyze_Strategy.py",
+                label="Analyser",
+                icon="🔬",
+                use_container_width=True,
+            )
 
         with cols[2]:
             if st.button("🗑️ Supprimer", use_container_width=True):
-                storage = ResultsStorage()
+                storage = get_results_storage()
                 if storage.delete_run(selected_run):
+                    clear_runs_cache()
                     st.success(f"✅ Run supprimé: {selected_run[:20]}...")
                     st.rerun()
                 else:
@@ -141,41 +233,39 @@ def display_comparison_table(runs_data: Dict[str, Dict]):
         st.warning("Aucun run à comparer")
         return
 
-    # Créer le DataFrame comparatif
-    comparison_data = []
-
-    for run_id, data in runs_data.items():
-        summary = data.get("summary", {})
-        best = summary.get("best_params", {})
-
-        row = {
-            "Run ID": run_id[:30] + "..." if len(run_id) > 30 else run_id,
-            "Stratégie": summary.get("strategy", "N/A"),
-            "Sharpe": best.get("sharpe", 0),
-            "Return (%)": best.get("return", 0),
-            "Drawdown (%)": abs(best.get("drawdown", 0)),
-            "Trades": best.get("trades", 0),
-            "Win Rate (%)": best.get("win_rate", 0),
-            "Symboles": ", ".join(summary.get("symbols", [])),
-        }
-
-        # Ajouter les paramètres
-        for key, value in best.items():
-            if key not in ["sharpe", "return", "drawdown", "trades", "win_rate"]:
-                row[key] = value
-
-        comparison_data.append(row)
+    # Construire le DataFrame colonne par colonne (une seule passe sur les runs)
+    metric_keys = ("sharpe", "return", "drawdown", "trades", "win_rate")
+    summaries = [data.get("summary", {}) for data in runs_data.values()]
+    bests = [summary.get("best_params", {}) for summary in summaries]
+
+    columns = {
+        "Run ID": [
+            run_id[:30] + "..." if len(run_id) > 30 else run_id for run_id in runs_data
+        ],
+        "Stratégie": [summary.get("strategy", "N/A") for summary in summaries],
+        "Sharpe": [best.get("sharpe", 0) for best in bests],
+        "Return (%)": [best.get("return", 0) for best in bests],
+        "Drawdown (%)": [abs(best.get("drawdown", 0)) for best in bests],
+        "Trades": [best.get("trades", 0) for best in bests],
+        "Win Rate (%)": [best.get("win_rate", 0) for best in bests],
+        "Symboles": [", ".join(summary.get("symbols", [])) for summary in summaries],
+    }
 
-    df = pd.DataFrame(comparison_data)
+    # Ajouter les paramètres (ordre de première apparition)
+    param_keys = dict.fromkeys(
+        key for best in bests for key in best if key not in metric_keys
+    )
+    for key in param_keys:
+        columns[key] = [best.get(key) for best in bests]
 
-    # Formater
-    for col in ["Sharpe", "Return (%)", "Drawdown (%)", "Win Rate (%)"]:
-        if col in df.columns:
-            df[col] = df[col].round(2)
+    # Formater en une seule opération
+    df = pd.DataFrame(columns).round(
+        {"Sharpe": 2, "Return (%)": 2, "Drawdown (%)": 2, "Win Rate (%)": 2}
+    )
 
     # Afficher avec mise en forme conditionnelle
     st.dataframe(
-        df,
+        _shrink(df),
         hide_index=True,
         use_container_width=True,
         column_config={
@@ -202,8 +292,7 @@ def display_parameters_comparison(runs_data: Dict[str, Dict]):
     st.markdown("### 🎯 Comparaison des Paramètres")
 
     # Extraire tous les paramètres uniques
-    all_params = set()
-    exclude_keys = [
+    exclude_keys = {
         "sharpe",
         "return",
         "drawdown",
@@ -211,33 +300,25 @@ def display_parameters_comparison(runs_data: Dict[str, Dict]):
         "win_rate",
         "avg_win",
         "avg_loss",
-    ]
-
-    for run_id, data in runs_data.items():
-        best = data.get("summary", {}).get("best_params", {})
-        params = {k: v for k, v in best.items() if k not in exclude_keys}
-        all_params.update(params.keys())
+    }
+    bests = {
+        run_id: data.get("summary", {}).get("best_params", {})
+        for run_id, data in runs_data.items()
+    }
+    all_params = sorted(set().union(*bests.values()) - exclude_keys)
 
     if not all_params:
         st.info("Aucun paramètre à comparer")
         return
 
-    # Créer le tableau
-    param_data = []
-
-    for param in sorted(all_params):
-        row = {"Paramètre": param.replace("_", " ").title()}
-
-        for run_id, data in runs_data.items():
-            best = data.get("summary", {}).get("best_params", {})
-            value = best.get(param, "-")
-            row[run_id[:20]] = value
+    # Créer le tableau colonne par colonne
+    columns = {"Paramètre": [param.replace("_", " ").title() for param in all_params]}
+    for run_id, best in bests.items():
+        columns[run_id[:20]] = [best.get(param, "-") for param in all_params]
 
-        param_data.append(row)
+    df = pd.DataFrame(columns)
 
-    df = pd.DataFrame(param_data)
-
-    st.dataframe(df, hide_index=True, use_container_width=True)
+    st.dataframe(_shrink(df), hide_index=True, use_container_width=True)
 
 
 def display_detailed_results_table(results_df: pd.DataFrame, max_rows: int = 100):
@@ -265,36 +346,44 @@ def display_detailed_results_table(results_df: pd.DataFrame, max_rows: int = 100
         "Ordre", options=["Décroissant", "Croissant"], horizontal=True
     )
 
-    # Trier
-    ascending = sort_order == "Croissant"
-    sorted_df = results_df.sort_values(sort_by, ascending=ascending)
-
-    # Limiter
-    display_df = sorted_df.head(max_rows).copy()
+    # Trier et limiter (NaN en fin de tableau: nsmallest/nlargest les
+    # écarteraient)
+    display_df = (
+        results_df.sort_values(
+            sort_by, ascending=(sort_order == "Croissant"), na_position="last"
+        )
+        .head(max_rows)
+        .copy()
+    )
 
     # Formater
     for col in ["sharpe", "return", "drawdown", "win_rate"]:
         if col in display_df.columns:
             display_df[col] = display_df[col].round(2)
 
-    # Afficher
-    st.dataframe(display_df, hide_index=True, use_container_width=True, height=400)
+    # Afficher (colonnes numériques réduites)
+    st.dataframe(
+        _shrink(display_df), hide_index=True, use_container_width=True, height=400
+    )
 
     # Stats
     with st.expander("📈 Statistiques"):
+        # Toutes les statistiques en un seul appel
+        stats = results_df[["sharpe", "return", "drawdown"]].agg(["max", "mean", "min"])
+
         col1, col2, col3 = st.columns(3)
 
         with col1:
-            st.metric("Meilleur Sharpe", f"{results_df['sharpe'].max():.2f}")
-            st.metric("Sharpe Moyen", f"{results_df['sharpe'].mean():.2f}")
+            st.metric("Meilleur Sharpe", f"{stats.at['max', 'sharpe']:.2f}")
+            st.metric("Sharpe Moyen", f"{stats.at['mean', 'sharpe']:.2f}")
 
         with col2:
-            st.metric("Meilleur Return", f"{results_df['return'].max():.2f}%")
-            st.metric("Return Moyen", f"{results_df['return'].mean():.2f}%")
+            st.metric("Meilleur Return", f"{stats.at['max', 'return']:.2f}%")
+            st.metric("Return Moyen", f"{stats.at['mean', 'return']:.2f}%")
 
         with col3:
-            st.metric("Pire Drawdown", f"{results_df['drawdown'].min():.2f}%")
-            st.metric("Drawdown Moyen", f"{results_df['drawdown'].mean():.2f}%")
+            st.metric("Pire Drawdown", f"{stats.at['min', 'drawdown']:.2f}%")
+            st.metric("Drawdown Moyen", f"{stats.at['mean', 'drawdown']:.2f}%")
 
 
 def create_filterable_table(runs: List[Dict]) -> pd.DataFrame:
@@ -310,7 +399,7 @@ def create_filterable_table(runs: List[Dict]) -> pd.DataFrame:
     if not runs:
         return pd.DataFrame()
 
-    df = pd.DataFrame(runs)
+    df = _runs_frame(runs)
 
     st.markdown("### 🔍 Filtres")
 
@@ -9,17 +9,23 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-import streamlit as st
+import queue
+import threading
 import time
+import traceback
+from typing import Dict
+
+import streamlit as st
 from optimization.optimizer import UnifiedOptimizer
-from optimization.results_storage import ResultsStorage
 from dashboard.components.optimizer_form import create_optimization_form
+from dashboard.components.results_table import clear_runs_cache
+from dashboard.components.optuna_components import _importance_df
 from dashboard.components.metrics import (
     display_metric_cards,
     display_detailed_metrics,
     display_parameters_card,
 )
-from dashboard.utils.session_state import init_session_state
+from dashboard.utils.session_state import init_session_state, set_active_run
 
 # Configuration
 st.set_page_config(page_title="Run Optimization", page_icon="🚀", layout="wide")
@@ -52,201 +58,222 @@ with col1:
 with col2:
     if st.session_state.get("optimization_running", False):
         if st.button("⏹️ Annuler", use_container_width=True):
+            # Arrêter réellement l'optimisation qui tourne encore en arrière-plan
+            active_optimizer = st.session_state.get("active_optimizer")
+            if active_optimizer is not None:
+                active_optimizer.stop()
+            st.session_state.active_optimizer = None
+            st.session_state.optimization_job = None
             st.session_state.optimization_running = False
             st.warning("⚠️ Optimisation annulée")
             st.rerun()
 
+
+def _start_optimization(strategy_class, config, opt_type) -> Dict:
+    """
+    Lance l'optimisation dans un thread d'arrière-plan
+
+    Le script Streamlit n'est pas bloqué: la progression est lue par un
+    fragment et le résultat déposé dans une queue.
+
+    Returns:
+        État du job (stocké dans st.session_state.optimization_job)
+    """
+    # Optuna: pas de threads (n_jobs) avec Streamlit, la parallélisation
+    # passe par les process workers (config["optuna"]["n_workers"])
+    use_parallel = False if opt_type == "optuna" else True
+
+    # Créer l'optimiseur
+    optimizer = UnifiedOptimizer(
+        strategy_class=strategy_class,
+        config=config,
+        optimization_type=opt_type,
+        verbose=False,
+        use_parallel=use_parallel,  # ✅ Conditionnel
+    )
+
+    # État partagé pour progression (thread-safe)
+    job = {
+        "opt_type": opt_type,
+        "lock": threading.Lock(),
+        "progress": 0.0,
+        "eta": 0,
+        "last_update": time.time(),
+        "results": queue.Queue(maxsize=1),
+    }
+
+    # Callback thread-safe avec throttling
+    def progress_callback(progress, eta_seconds):
+        """Callback qui met à jour l'état sans toucher directement Streamlit"""
+        with job["lock"]:
+            current_time = time.time()
+
+            # Throttle: max 2 updates/seconde
+            if current_time - job["last_update"] < 0.5:
+                return
+
+            job["progress"] = min(progress, 1.0)
+            job["eta"] = max(eta_seconds, 0)
+            job["last_update"] = current_time
+
+    # Fonction d'optimisation dans thread
+    def run_optimization():
+        try:
+            job["results"].put(
+                ("ok", optimizer.run(progress_callback=progress_callback))
+            )
+        except Exception as e:
+            job["results"].put(("error", (e, traceback.format_exc())))
+
+    threading.Thread(target=run_optimization, daemon=True).start()
+
+    st.session_state.current_run_id = optimizer.run_id
+    st.session_state.active_optimizer = optimizer
+    return job
+
+
+@st.fragment(run_every=0.5)
+def _display_progress(job: Dict):
+    """Progression du job, rafraîchie seule sans relancer toute la page"""
+    # Terminé: relancer la page complète pour afficher les résultats
+    if not job["results"].empty():
+        st.rerun()
+
+    with job["lock"]:
+        current_progress = job["progress"]
+        current_eta = job["eta"]
+
+    st.progress(current_progress)
+
+    # Formater et afficher le statut
+    if current_eta > 0:
+        eta_minutes = current_eta // 60
+        eta_seconds = current_eta % 60
+        st.text(
+            f"⏳ Progression: {current_progress*100:.1f}% - "
+            f"Reste: {int(eta_minutes)}m {int(eta_seconds)}s"
+        )
+    else:
+        st.text(f"⏳ Progression: {current_progress*100:.1f}%")
+
+
+def _display_results(results: Dict, opt_type: str):
+    """Affiche les résultats d'une optimisation terminée"""
+    st.success("✅ Optimisation terminée avec succès !")
+
+    # Métriques principales
+    st.divider()
+    st.markdown("### 🏆 Meilleurs Résultats")
+    display_metric_cards(results["best"])
+
+    # Paramètres optimaux
+    st.divider()
+    st.markdown("### 🎯 Paramètres Optimaux")
+    display_parameters_card(results["best"])
+
+    # Métriques détaillées
+    st.divider()
+    st.markdown("### 📊 Analyse Détaillée")
+    display_detailed_metrics(results["best"])
+
+    # Évaluation Sharpe
+    sharpe = results["best"].get("sharpe", 0)
+    st.divider()
+    st.markdown("### 📈 Évaluation de la Performance")
+
+    if sharpe > 2.5:
+        st.success("⭐⭐⭐⭐⭐ EXCELLENTE performance ! Stratégie très prometteuse.")
+    elif sharpe > 2.0:
+        st.success("⭐⭐⭐⭐ TRÈS BONNE performance. Stratégie solide.")
+    elif sharpe > 1.5:
+        st.info("⭐⭐⭐ BONNE performance. Stratégie acceptable.")
+    elif sharpe > 1:
+        st.warning("⭐⭐ Performance MOYENNE. À améliorer.")
+    else:
+        st.error("⭐ Performance FAIBLE. Revoir la stratégie.")
+
+    # Importance des paramètres (Optuna uniquement)
+    if opt_type == "optuna" and "param_importance" in results:
+        st.divider()
+        st.markdown("### 🔍 Importance des Paramètres")
+
+        importance = results["param_importance"]
+        if importance:
+            # Tri décroissant: le paramètre le plus important en premier
+            df = _importance_df(tuple(importance.items())).iloc[::-1]
+
+            st.dataframe(df, hide_index=True, use_container_width=True)
+
+            st.info(
+                "💡 Les paramètres avec une importance élevée ont le plus d'impact sur la performance."
+            )
+
+    # Lien vers l'analyse du run qui vient de se terminer
+    st.divider()
+    st.page_link("pages/4_Analyze_Strategy.py", label="Analyser ce run", icon="🔬")
+
+
 # Lancer l'optimisation
 if run_button and strategy_class and config and opt_type:
+    try:
+        st.session_state.optimization_job = _start_optimization(
+            strategy_class, config, opt_type
+        )
+        st.session_state.optimization_running = True
+        # Rerun: bouton Lancer désactivé, bouton Annuler affiché
+        st.rerun()
 
-    st.session_state.optimization_running = True
+    except Exception as e:
+        st.error(f"❌ Erreur pendant l'optimisation: {str(e)}")
+        st.session_state.optimization_running = False
 
-    # Zone de progression
+        # Afficher le traceback pour debug
+        with st.expander("🔍 Détails de l'erreur"):
+            st.code(traceback.format_exc())
+
+# Suivi du job en cours (la page reste interactive pendant l'optimisation)
+job = st.session_state.get("optimization_job")
+
+if job is not None and job["results"].empty():
     st.markdown("---")
     st.markdown("### 📊 Optimisation en cours...")
 
     # Avertissement pour Optuna
-    if opt_type == "optuna":
+    if job["opt_type"] == "optuna":
         st.info(
-            "ℹ️ Optuna: Mode séquentiel activé pour compatibilité avec Streamlit. "
-            "Pour parallélisation complète, utilisez le script CLI."
+            "ℹ️ Optuna: les trials sont répartis entre des process workers "
+            "qui partagent l'étude via le storage (réglable dans les options avancées)."
         )
 
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    eta_text = st.empty()
+    _display_progress(job)
 
-    try:
-        # CORRECTION: Désactiver parallélisation pour Optuna avec Streamlit
-        use_parallel = False if opt_type == "optuna" else True
-
-        # Créer l'optimiseur
-        optimizer = UnifiedOptimizer(
-            strategy_class=strategy_class,
-            config=config,
-            optimization_type=opt_type,
-            verbose=False,
-            use_parallel=use_parallel,  # ✅ Conditionnel
-        )
+elif job is not None:
+    # Job terminé: récupérer le résultat déposé par le thread
+    status, payload = job["results"].get_nowait()
+    st.session_state.optimization_job = None
+    st.session_state.active_optimizer = None
+    st.session_state.optimization_running = False
+    # Le run vient d'être enregistré: rafraîchir Historique et Accueil
+    clear_runs_cache()
 
-        st.session_state.current_run_id = optimizer.run_id
-
-        # État partagé pour progression (thread-safe)
-        import threading
-
-        progress_lock = threading.Lock()
-        progress_state = {"progress": 0.0, "eta": 0, "last_update": time.time()}
-
-        # Callback thread-safe avec throttling
-        def progress_callback(progress, eta_seconds):
-            """Callback qui met à jour l'état sans toucher directement Streamlit"""
-            with progress_lock:
-                current_time = time.time()
-
-                # Throttle: max 2 updates/seconde
-                if current_time - progress_state["last_update"] < 0.5:
-                    return
-
-                progress_state["progress"] = min(progress, 1.0)
-                progress_state["eta"] = max(eta_seconds, 0)
-                progress_state["last_update"] = current_time
-
-        # Container pour résultats
-        results_container = {"results": None, "error": None, "done": False}
-
-        # Fonction d'optimisation dans thread
-        def run_optimization():
-            try:
-                results_container["results"] = optimizer.run(
-                    progress_callback=progress_callback
-                )
-            except Exception as e:
-                results_container["error"] = e
-            finally:
-                results_container["done"] = True
-
-        # Lancer dans un thread
-        opt_thread = threading.Thread(target=run_optimization, daemon=True)
-        opt_thread.start()
-
-        # Boucle de mise à jour de l'UI (thread principal)
-        max_wait = 7200  # 2 heures max
-        start_time = time.time()
-
-        while not results_container["done"] and (time.time() - start_time) < max_wait:
-            # Lire l'état de progression
-            with progress_lock:
-                current_progress = progress_state["progress"]
-                current_eta = progress_state["eta"]
-
-            # Mettre à jour l'UI (safe, on est dans le thread principal)
-            progress_bar.progress(current_progress)
-
-            # Formater et afficher le statut
-            if current_eta > 0:
-                eta_minutes = current_eta // 60
-                eta_seconds = current_eta % 60
-                status_text.text(
-                    f"⏳ Progression: {current_progress*100:.1f}% - "
-                    f"Reste: {int(eta_minutes)}m {int(eta_seconds)}s"
-                )
-            else:
-                status_text.text(f"⏳ Progression: {current_progress*100:.1f}%")
-
-            # Petit sleep pour ne pas spammer
-            time.sleep(0.5)
-
-        # Attendre la fin du thread
-        opt_thread.join(timeout=5)
-
-        # Vérifier les erreurs
-        if results_container["error"]:
-            raise results_container["error"]
-
-        results = results_container["results"]
-
-        # Succès
-        if results and "best" in results:
-            progress_bar.progress(1.0)
-            status_text.empty()
-            eta_text.empty()
-
-            st.success("✅ Optimisation terminée avec succès !")
-
-            # Métriques principales
-            st.divider()
-            st.markdown("### 🏆 Meilleurs Résultats")
-            display_metric_cards(results["best"])
-
-            # Paramètres optimaux
-            st.divider()
-            st.markdown("### 🎯 Paramètres Optimaux")
-            display_parameters_card(results["best"])
-
-            # Métriques détaillées
-            st.divider()
-            st.markdown("### 📊 Analyse Détaillée")
-            display_detailed_metrics(results["best"])
-
-            # Évaluation Sharpe
-            sharpe = results["best"].get("sharpe", 0)
-            st.divider()
-            st.markdown("### 📈 Évaluation de la Performance")
-
-            if sharpe > 2.5:
-                st.success(
-                    "⭐⭐⭐⭐⭐ EXCELLENTE performance ! Stratégie très prometteuse."
-                )
-            elif sharpe > 2.0:
-                st.success("⭐⭐⭐⭐ TRÈS BONNE performance. Stratégie solide.")
-            elif sharpe > 1.5:
-                st.info("⭐⭐⭐ BONNE performance. Stratégie acceptable.")
-            elif sharpe > 1:
-                st.warning("⭐⭐ Performance MOYENNE. À améliorer.")
-            else:
-                st.error("⭐ Performance FAIBLE. Revoir la stratégie.")
-
-            # Importance des paramètres (Optuna uniquement)
-            if opt_type == "optuna" and "param_importance" in results:
-                st.divider()
-                st.markdown("### 🔍 Importance des Paramètres")
-
-                import pandas as pd
-
-                importance = results["param_importance"]
-                if importance:
-                    df = pd.DataFrame(
-                        [
-                            {"Paramètre": k, "Importance": v}
-                            for k, v in sorted(
-                                importance.items(), key=lambda x: x[1], reverse=True
-                            )
-                        ]
-                    )
-
-                    st.dataframe(df, use_container_width=True)
-
-                    st.info(
-                        "💡 Les paramètres avec une importance élevée ont le plus d'impact sur la performance."
-                    )
-
-            # Sauvegarder dans session state
-            st.session_state.last_optimization_results = results
-            st.session_state.optimization_running = False
-
-        else:
-            st.error("❌ Échec de l'optimisation - Aucun résultat valide")
-            st.session_state.optimization_running = False
-
-    except Exception as e:
-        st.error(f"❌ Erreur pendant l'optimisation: {str(e)}")
-        st.session_state.optimization_running = False
+    if status == "error":
+        error, error_traceback = payload
+        st.error(f"❌ Erreur pendant l'optimisation: {str(error)}")
 
         # Afficher le traceback pour debug
         with st.expander("🔍 Détails de l'erreur"):
-            import traceback
+            st.code(error_traceback)
 
-            st.code(traceback.format_exc())
+    elif payload and "best" in payload:
+        # Run à analyser par défaut (défini une fois, à la fin du run)
+        set_active_run(st.session_state.get("current_run_id"))
+        _display_results(payload, job["opt_type"])
+
+        # Sauvegarder dans session state
+        st.session_state.last_optimization_results = payload
+
+    else:
+        st.error("❌ Échec de l'optimisation - Aucun résultat valide")
 
 # Aide
 with st.expander("ℹ️ Comment ça marche ?"):
@@ -267,8 +294,8 @@ with st.expander("ℹ️ Comment ça marche ?"):
     
     ### ⚠️ Note pour Optuna + Streamlit
     
-    Optuna est exécuté en mode séquentiel dans le dashboard pour compatibilité.
-    Pour la parallélisation complète, utilisez:
+    L'optimisation tourne en arrière-plan: la page reste utilisable et le
+    bouton Annuler arrête l'étude. Pour les runs très longs, utilisez:
     ```bash
     python quick_optimize.py
     ```
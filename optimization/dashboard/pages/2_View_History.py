@@ -10,11 +10,14 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 import streamlit as st
 import pandas as pd
-from optimization.results_storage import ResultsStorage
 from dashboard.components.results_table import (
     display_runs_table,
     create_filterable_table,
     display_detailed_results_table,
+    get_results_storage,
+    load_runs,
+    load_statistics,
+    clear_runs_cache,
 )
 from dashboard.utils.session_state import init_session_state
 
@@ -24,6 +27,18 @@ st.set_page_config(page_title="View History", page_icon="📋", layout="wide")
 # Initialiser le state
 init_session_state()
 
+
+@st.cache_data(show_spinner=False)
+def _to_csv(run_ids: tuple, _df: pd.DataFrame) -> bytes:
+    """
+    Export CSV, recalculé uniquement quand les runs filtrés changent
+
+    Clé de cache: les run_ids (la colonne symbols contient des listes, non
+    hachables par Streamlit)
+    """
+    return _df.to_csv(index=False).encode("utf-8")
+
+
 # Header
 st.title("📋 Historique des Optimisations")
 st.markdown("Consultez, filtrez et gérez tous vos runs d'optimisation")
@@ -31,8 +46,8 @@ st.markdown("Consultez, filtrez et gérez tous vos runs d'optimisation")
 st.divider()
 
 # Charger les données
-storage = ResultsStorage()
-all_runs = storage.list_runs()
+storage = get_results_storage()
+all_runs = load_runs()
 
 if not all_runs:
     st.info("📭 Aucune optimisation dans l'historique. Lancez-en une !")
@@ -45,7 +60,7 @@ if not all_runs:
 # Statistiques rapides
 st.markdown("## 📊 Statistiques Globales")
 
-stats = storage.get_statistics()
+stats = load_statistics()
 
 col1, col2, col3, col4 = st.columns(4)
 
@@ -104,44 +119,54 @@ col1, col2 = st.columns(2)
 with col1:
     st.markdown("### 📈 Meilleur Sharpe Ratio")
 
-    top_sharpe = filtered_df.nlargest(5, "best_sharpe")
-
-    for i, row in top_sharpe.iterrows():
-        with st.container():
-            col_a, col_b, col_c = st.columns([2, 1, 1])
-
-            with col_a:
-                st.markdown(f"**{row['strategy']}**")
-                st.caption(f"{row['run_id'][:30]}...")
-
-            with col_b:
-                st.metric("Sharpe", f"{row['best_sharpe']:.2f}")
+    top_sharpe = filtered_df.nlargest(5, "best_sharpe")[
+        ["strategy", "run_id", "best_sharpe"]
+    ]
 
-            with col_c:
-                if st.button("🔬", key=f"analyze_sharpe_{i}", help="Analyser"):
-                    st.session_state.active_run = row["run_id"]
-                    st.switch_page("pages/4_🔬_Analyze_Strategy.py")
+    st.dataframe(
+        top_sharpe,
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "strategy": "Stratégie",
+            "run_id": "Run ID",
+            "best_sharpe": st.column_config.NumberColumn("Sharpe", format="%.2f"),
+        },
+    )
 
 with col2:
     st.markdown("### 💰 Meilleur Rendement")
 
-    top_return = filtered_df.nlargest(5, "best_return")
+    top_return = filtered_df.nlargest(5, "best_return")[
+        ["strategy", "run_id", "best_return"]
+    ]
 
-    for i, row in top_return.iterrows():
-        with st.container():
-            col_a, col_b, col_c = st.columns([2, 1, 1])
+    st.dataframe(
+        top_return,
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "strategy": "Stratégie",
+            "run_id": "Run ID",
+            "best_return": st.column_config.NumberColumn("Return (%)", format="%.2f"),
+        },
+    )
 
-            with col_a:
-                st.markdown(f"**{row['strategy']}**")
-                st.caption(f"{row['run_id'][:30]}...")
+# Une seule action d'analyse pour les deux classements
+col1, col2 = st.columns([3, 1])
 
-            with col_b:
-                st.metric("Return", f"{row['best_return']:.2f}%")
+with col1:
+    top_run = st.selectbox(
+        "Analyser un run",
+        options=list(dict.fromkeys([*top_sharpe["run_id"], *top_return["run_id"]])),
+        format_func=lambda x: x[:40] + "..." if len(x) > 40 else x,
+        key="top_run_select",
+    )
 
-            with col_c:
-                if st.button("🔬", key=f"analyze_return_{i}", help="Analyser"):
-                    st.session_state.active_run = row["run_id"]
-                    st.switch_page("pages/4_🔬_Analyze_Strategy.py")
+with col2:
+    if st.button("🔬 Analyser", key="analyze_top", use_container_width=True):
+        st.session_state.active_run = top_run
+        st.switch_page("pages/4_Analyze_Strategy.py")
 
 st.divider()
 
@@ -154,8 +179,7 @@ with col1:
     st.markdown("### 📤 Export")
 
     # Préparer le CSV
-    export_df = filtered_df.copy()
-    csv = export_df.to_csv(index=False)
+    csv = _to_csv(tuple(filtered_df["run_id"]), filtered_df)
 
     st.download_button(
         label="📥 Télécharger CSV",
@@ -169,6 +193,7 @@ with col2:
     st.markdown("### 🔄 Rafraîchir")
 
     if st.button("🔄 Actualiser les données", use_container_width=True):
+        clear_runs_cache()
         st.rerun()
 
 with col3:
@@ -188,6 +213,7 @@ with col3:
             if st.button(f"🗑️ Supprimer {len(runs_to_delete)} run(s)", type="primary"):
                 for run_id in runs_to_delete:
                     storage.delete_run(run_id)
+                clear_runs_cache()
 
                 st.success(f"✅ {len(runs_to_delete)} run(s) supprimé(s)")
                 st.rerun()
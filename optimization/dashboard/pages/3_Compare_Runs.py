@@ -10,10 +10,10 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 import streamlit as st
 import pandas as pd
-from optimization.results_storage import ResultsStorage
 from dashboard.components.results_table import (
     display_comparison_table,
     display_parameters_comparison,
+    get_results_storage,
 )
 from dashboard.components.charts import create_comparison_chart, create_scatter_plot
 from dashboard.components.metrics import display_performance_badge
@@ -32,7 +32,7 @@ st.markdown("Comparez plusieurs optimisations côte à côte")
 st.divider()
 
 # Charger les données
-storage = ResultsStorage()
+storage = get_results_storage()
 all_runs = storage.list_runs()
 
 if not all_runs:
@@ -10,7 +10,6 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 import streamlit as st
 import pandas as pd
-from optimization.results_storage import ResultsStorage
 from dashboard.components.metrics import (
     display_metric_cards,
     display_detailed_metrics,
@@ -26,6 +25,7 @@ from dashboard.components.charts import (
     create_walk_forward_analysis,
     create_parameter_impact_chart,
 )
+from dashboard.components.results_table import get_results_storage
 from dashboard.utils.session_state import init_session_state
 
 # Configuration
@@ -41,7 +41,7 @@ st.markdown("Analyse approfondie d'un run d'optimisation")
 st.divider()
 
 # Sélection du run
-storage = ResultsStorage()
+storage = get_results_storage()
 all_runs = storage.list_runs()
 
 if not all_runs:
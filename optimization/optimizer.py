@@ -35,7 +35,11 @@ from optimization.results_storage import ResultsStorage
 from optimization.optuna_optimizer import OptunaOptimizer
 
 # Import des workers (doivent être au niveau module pour pickling)
-from optimization.optimizer_worker import run_backtest_worker
+from optimization.optimizer_worker import (
+    run_backtest_task,
+    optuna_objective_worker,
+    is_int_param,
+)
 from utils.metrics_validator import safe_calculate_return, MetricsValidator
 
 logger = setup_logger("optimizer")
@@ -98,6 +102,12 @@ class UnifiedOptimizer:
         self._data_cache = None
         self._cache_loaded = False
 
+        # Optimiseurs imbriqués actifs (Optuna, In-Sample du Walk-Forward)
+        # et arrêt demandé (voir stop())
+        self._optuna_opt = None
+        self._inner_opt = None
+        self._stop_requested = False
+
         # Générer un ID unique pour ce run
         self.strategy_name = strategy_class.__name__
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -191,6 +201,21 @@ class UnifiedOptimizer:
 
         return results
 
+    def stop(self):
+        """
+        Demande l'arrêt de l'optimisation en cours
+
+        Appelable depuis un autre thread. Vérifié entre deux combinaisons
+        (Grid Search), deux périodes (Walk-Forward) ou deux trials (Optuna):
+        le calcul en cours se termine, puis l'optimisation retourne les
+        meilleurs résultats obtenus jusque-là.
+        """
+        self._stop_requested = True
+        if self._optuna_opt is not None:
+            self._optuna_opt.stop()
+        if self._inner_opt is not None:
+            self._inner_opt.stop()
+
     def _grid_search_parallel(
         self, progress_callback: Optional[Callable] = None
     ) -> Dict:
@@ -238,10 +263,8 @@ class UnifiedOptimizer:
         try:
             # Utiliser multiprocessing.Pool
             with Pool(processes=n_workers) as pool:
-                # starmap pour passer plusieurs arguments
-                # On utilise aussi imap pour avoir un itérateur et suivre la progression
-
-                # Option 2: Avec progression fluide
+                # imap: résultats reçus au fil de l'eau (progression fluide,
+                # arrêt possible entre deux combinaisons)
                 results_raw = []
 
                 # Créer un itérateur avec chunksize pour optimiser
@@ -251,10 +274,17 @@ class UnifiedOptimizer:
                 start_time = time.time()
 
                 for i, result in enumerate(
-                    pool.starmap(run_backtest_worker, tasks, chunksize=chunksize), 1
+                    pool.imap(run_backtest_task, tasks, chunksize=chunksize), 1
                 ):
                     results_raw.append(result)
 
+                    # Arrêt demandé: la sortie du bloc with termine le pool
+                    if self._stop_requested:
+                        logger.warning(
+                            f"⏹️ Arrêt demandé après {i}/{total} combinaisons"
+                        )
+                        break
+
                     # Callback progression BEAUCOUP PLUS FRÉQUENT (à chaque itération)
                     if progress_callback:
                         progress_pct = i / total if total > 0 else 1.0
@@ -334,6 +364,10 @@ class UnifiedOptimizer:
         start_time = time.time()  # ✅ Pour estimation du temps restant (ETA)
 
         for i, combo in enumerate(combinations, 1):
+            if self._stop_requested:
+                logger.warning(f"⏹️ Arrêt demandé après {i - 1}/{total} combinaisons")
+                break
+
             params = dict(zip(param_names, combo))
 
             if self.verbose:
@@ -463,15 +497,11 @@ class UnifiedOptimizer:
 
     def _convert_params(self, params: Dict) -> Dict:
         """Convertit les paramètres au bon type"""
-        converted = {}
-        for key, value in params.items():
-            if any(
-                word in key.lower() for word in ["period", "window", "length", "days"]
-            ):
-                converted[key] = int(value)
-            else:
-                converted[key] = value
-        return converted
+        # is_int_param est mis en cache par nom de clé
+        return {
+            key: int(value) if is_int_param(key) else value
+            for key, value in params.items()
+        }
 
     def _walk_forward(self, progress_callback: Optional[Callable] = None) -> Dict:
         """Walk-Forward Analysis (utilise Grid Search parallèle pour In-Sample)"""
@@ -496,6 +526,10 @@ class UnifiedOptimizer:
         walk_forward_results = []
 
         for i, period in enumerate(periods, 1):
+            if self._stop_requested:
+                logger.warning(f"⏹️ Arrêt demandé après {i - 1}/{total_steps} périodes")
+                break
+
             in_start, in_end = period["in_sample"]
             out_start, out_end = period["out_sample"]
 
@@ -519,7 +553,16 @@ class UnifiedOptimizer:
                 use_parallel=self.use_parallel,  # Utiliser la même config
             )
 
+            self._inner_opt = in_sample_optimizer
+            if self._stop_requested:
+                break
             in_sample_results = in_sample_optimizer.run()
+            self._inner_opt = None
+
+            # Période interrompue: ses résultats In-Sample sont partiels
+            if self._stop_requested:
+                logger.warning(f"⏹️ Arrêt demandé pendant la période {i}")
+                break
 
             if not in_sample_results or "best" not in in_sample_results:
                 logger.warning(f"Période {i}: Pas de résultats In-Sample")
@@ -852,12 +895,28 @@ class UnifiedOptimizer:
         optuna_config = self.config.get("optuna", {})
         n_trials = optuna_config.get("n_trials", 100)
 
+        # Parallélisation par process (n_jobs d'Optuna = threads, bridés par
+        # le GIL sur un backtest CPU-bound)
+        n_workers = optuna_config.get(
+            "n_workers", cpu_count() if self.use_parallel else 1
+        )
+
         # Fonction objectif
-        def objective_function(params: Dict) -> float:
-            result = self._run_single_backtest(params)
-            if result is None:
-                return float("-inf")
-            return result.get("sharpe", 0)
+        if n_workers > 1:
+            # Sérialisable: envoyée aux workers avec les données pré-chargées
+            objective_function = partial(
+                optuna_objective_worker,
+                preloaded_data=self._data_cache,
+                strategy_class=self.strategy_class,
+                config=self.config,
+            )
+        else:
+
+            def objective_function(params: Dict) -> float:
+                result = self._run_single_backtest(params)
+                if result is None:
+                    return float("-inf")
+                return result.get("sharpe", 0)
 
         # Créer et lancer l'optimiseur
         optuna_opt = OptunaOptimizer(
@@ -866,10 +925,18 @@ class UnifiedOptimizer:
             n_trials=n_trials,
             direction="maximize",
             study_name=f"{self.strategy_name}_{self.run_id}",
-            n_jobs=cpu_count() if self.use_parallel else 1,
+            storage=optuna_config.get("storage"),
+            # Sans effet ici: l'objectif (un backtest) ne rapporte qu'un score
+            # final, aucune valeur intermédiaire à comparer pour le pruner
+            pruner_type=optuna_config.get("pruner", "median"),
+            n_jobs=1,
+            n_workers=n_workers,
             logger=logger,
         )
 
+        self._optuna_opt = optuna_opt
+        if self._stop_requested:
+            optuna_opt.stop()
         optuna_results = optuna_opt.optimize(progress_callback=progress_callback)
 
         # Récupérer les résultats
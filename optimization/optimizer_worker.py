@@ -6,6 +6,9 @@ Ces fonctions doivent être au niveau module (pas dans une classe)
 pour être sérialisables par multiprocessing (pickle).
 """
 
+import re
+from functools import lru_cache
+
 import backtrader as bt
 import pandas as pd
 from typing import Dict, Optional
@@ -14,6 +17,15 @@ from config import settings
 from data.data_fetcher import create_data_feed
 from utils.metrics_validator import safe_calculate_return, MetricsValidator
 
+# Paramètres à convertir en int ('period', 'window', 'length', 'days')
+INT_PARAM_RE = re.compile(r"period|window|length|days", re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def is_int_param(key: str) -> bool:
+    """Indique si le paramètre doit être converti en int (résultat mis en cache)"""
+    return INT_PARAM_RE.search(key) is not None
+
 
 def run_backtest_worker(
     params: Dict, preloaded_data: Dict[str, pd.DataFrame], strategy_class, config: Dict
@@ -109,6 +121,30 @@ def run_backtest_worker(
         return None
 
 
+def run_backtest_task(task: tuple) -> Optional[Dict]:
+    """
+    run_backtest_worker sur un tuple (params, données, classe, config)
+
+    Forme à un argument pour Pool.imap (résultats reçus au fil de l'eau)
+    """
+    return run_backtest_worker(*task)
+
+
+def optuna_objective_worker(
+    params: Dict, preloaded_data: Dict[str, pd.DataFrame], strategy_class, config: Dict
+) -> float:
+    """
+    Fonction objectif Optuna sérialisable (workers process)
+
+    Returns:
+        Sharpe du backtest, -inf si le backtest échoue
+    """
+    result = run_backtest_worker(params, preloaded_data, strategy_class, config)
+    if result is None:
+        return float("-inf")
+    return result.get("sharpe", 0)
+
+
 def _convert_params(params: Dict) -> Dict:
     """
     Convertit les paramètres au bon type
@@ -120,14 +156,9 @@ def _convert_params(params: Dict) -> Dict:
     Returns:
         Paramètres convertis
     """
-    converted = {}
-    for key, value in params.items():
-        # Si le paramètre contient 'period', 'window', 'length' → convertir en int
-        if any(word in key.lower() for word in ["period", "window", "length", "days"]):
-            converted[key] = int(value)
-        else:
-            converted[key] = value
-    return converted
+    return {
+        key: int(value) if is_int_param(key) else value for key, value in params.items()
+    }
 
 
 def run_backtest_worker_with_dates(
@@ -13,6 +13,11 @@ Intégration complète avec UnifiedOptimizer
 - Persistence des résultats dans une DB
 """
 
+import inspect
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+
 import optuna
 from optuna.pruners import MedianPruner, SuccessiveHalvingPruner
 from optuna.samplers import TPESampler, RandomSampler
@@ -25,6 +30,65 @@ from datetime import datetime
 # Désactiver les logs Optuna verbeux
 optuna.logging.set_verbosity(optuna.logging.WARNING)
 
+# Attente max (s) sur un verrou SQLite quand plusieurs process écrivent
+# dans la même étude (défaut sqlite3: 5s, trop court sous charge)
+SQLITE_TIMEOUT = 30
+
+# Attribut d'étude signalant un arrêt demandé aux workers process
+_STOP_ATTR = "stop_requested"
+
+
+def _create_storage(url: str):
+    """
+    Crée le storage Optuna à partir d'une URL
+
+    Pour SQLite, passe le `timeout` de connexion au driver afin que les
+    workers concurrents attendent le verrou au lieu d'échouer
+    ("database is locked").
+    """
+    if url.startswith("sqlite"):
+        return optuna.storages.RDBStorage(
+            url, engine_kwargs={"connect_args": {"timeout": SQLITE_TIMEOUT}}
+        )
+    return url
+
+
+def _ensure_sqlite_dir(url: str):
+    """
+    Crée le dossier parent d'une base SQLite (sqlite:///chemin/vers/db)
+
+    SQLite crée le fichier mais pas les dossiers: sans cela, une URL fournie
+    par l'utilisateur échoue sur une installation neuve
+    ("unable to open database file").
+    """
+    prefix = "sqlite:///"
+    if url.startswith(prefix) and url[len(prefix) :] not in ("", ":memory:"):
+        Path(url[len(prefix) :]).parent.mkdir(parents=True, exist_ok=True)
+
+
+def _run_study_worker(n_trials: int, seed: int, **optimizer_kwargs) -> List[Dict]:
+    """
+    Worker process: charge l'étude partagée et exécute sa part des trials
+
+    Appelle directement study.optimize (jamais optimize()): n_workers ne sert
+    ici qu'à configurer le storage pour l'accès concurrent.
+
+    Doit rester au niveau module pour être sérialisable (pickle).
+
+    Returns:
+        Historique des trials exécutés par ce worker
+    """
+    worker = OptunaOptimizer(
+        n_trials=n_trials, seed=seed, n_jobs=1, show_progress=False, **optimizer_kwargs
+    )
+    worker.study.optimize(
+        worker._objective_wrapper,
+        n_trials=n_trials,
+        timeout=worker.timeout,
+        callbacks=[worker._stop_callback],
+    )
+    return worker.optimization_history
+
 
 class OptunaOptimizer:
     """
@@ -52,6 +116,8 @@ class OptunaOptimizer:
         sampler_type: str = "tpe",
         pruner_type: str = "median",
         n_jobs: int = -1,
+        n_workers: int = 1,
+        seed: int = 42,
         show_progress: bool = True,
         logger: Optional[logging.Logger] = None,
     ):
@@ -59,7 +125,10 @@ class OptunaOptimizer:
         Initialise l'optimiseur Optuna
 
         Args:
-            objective_func: Fonction à optimiser (retourne un score)
+            objective_func: Fonction à optimiser. Retourne un score, ou
+                produit (yield) des valeurs intermédiaires dont la dernière
+                est le score: seules ces dernières sont élaguables par le
+                pruner (un score unique n'offre rien à comparer)
             param_grid: Dictionnaire des paramètres à optimiser
             n_trials: Nombre d'essais maximum
             timeout: Timeout en secondes (None = pas de limite)
@@ -67,8 +136,13 @@ class OptunaOptimizer:
             study_name: Nom de l'étude (pour persistence)
             storage: URL de stockage (ex: 'sqlite:///optuna.db')
             sampler_type: 'tpe', 'random', 'cmaes'
-            pruner_type: 'median', 'successive_halving', 'none'
-            n_jobs: Nombre de workers parallèles (-1 = tous les CPUs)
+            pruner_type: 'median', 'successive_halving', 'asha', 'none'
+            n_jobs: Nombre de threads Optuna (-1 = tous les CPUs). Limité par
+                le GIL: sans effet sur un objectif CPU-bound en Python
+            n_workers: Nombre de process partageant l'étude via le storage
+                (> 1: objective_func doit être sérialisable par pickle, et
+                SQLite est ouvert avec un timeout de verrou)
+            seed: Graine du sampler
             show_progress: Afficher la barre de progression
             logger: Logger personnalisé
         """
@@ -78,6 +152,8 @@ class OptunaOptimizer:
         self.timeout = timeout
         self.direction = direction
         self.n_jobs = n_jobs
+        self.n_workers = max(1, n_workers)
+        self.seed = seed
         self.show_progress = show_progress
         self.logger = logger
 
@@ -92,18 +168,22 @@ class OptunaOptimizer:
             storage_dir = Path("results/optuna_studies")
             storage_dir.mkdir(parents=True, exist_ok=True)
             storage = f"sqlite:///{storage_dir / 'optuna.db'}"
+        else:
+            _ensure_sqlite_dir(storage)
         self.storage = storage
 
         # Configurer le sampler
+        self.sampler_type = sampler_type
         self.sampler = self._create_sampler(sampler_type)
 
         # Configurer le pruner
+        self.pruner_type = pruner_type
         self.pruner = self._create_pruner(pruner_type)
 
         # Créer l'étude
         self.study = optuna.create_study(
             study_name=study_name,
-            storage=storage,
+            storage=_create_storage(storage) if self.n_workers > 1 else storage,
             direction=direction,
             sampler=self.sampler,
             pruner=self.pruner,
@@ -115,11 +195,14 @@ class OptunaOptimizer:
         self.best_value = None
         self.optimization_history = []
 
+        # Arrêt demandé depuis un autre thread (voir stop())
+        self._stop_event = threading.Event()
+
     def _create_sampler(self, sampler_type: str):
         """Crée le sampler approprié"""
         samplers = {
-            "tpe": TPESampler(seed=42, n_startup_trials=10),
-            "random": RandomSampler(seed=42),
+            "tpe": TPESampler(seed=self.seed, n_startup_trials=10),
+            "random": RandomSampler(seed=self.seed),
             # 'cmaes': CmaEsSampler(seed=42)  # Nécessite cma package
         }
 
@@ -139,6 +222,9 @@ class OptunaOptimizer:
                 n_startup_trials=10, n_warmup_steps=5, interval_steps=1
             ),
             "successive_halving": SuccessiveHalvingPruner(),
+            # Le SuccessiveHalvingPruner d'Optuna est l'ASHA (asynchrone,
+            # sans synchronisation entre workers): alias conservé
+            "asha": SuccessiveHalvingPruner(),
             "none": optuna.pruners.NopPruner(),
         }
 
@@ -262,6 +348,27 @@ class OptunaOptimizer:
         step = self._detect_step(values)
         return step is not None
 
+    @staticmethod
+    def _report_steps(trial: optuna.Trial, steps) -> float:
+        """
+        Rapporte les valeurs intermédiaires d'un objectif générateur
+
+        Chaque valeur produite est transmise au pruner (trial.report); le
+        trial est élagué dès que should_prune() le demande.
+
+        Returns:
+            Dernière valeur produite (score final du trial)
+        """
+        score = None
+        for step, score in enumerate(steps):
+            trial.report(score, step)
+            if trial.should_prune():
+                steps.close()
+                raise optuna.TrialPruned(f"élagué à l'étape {step}")
+        if score is None:
+            raise ValueError("objectif générateur sans valeur")
+        return score
+
     def _objective_wrapper(self, trial: optuna.Trial) -> float:
         """
         Wrapper de la fonction objectif pour Optuna
@@ -272,6 +379,8 @@ class OptunaOptimizer:
         # Exécuter la fonction objectif
         try:
             score = self.objective_func(params)
+            if inspect.isgenerator(score):
+                score = self._report_steps(trial, score)
 
             # Enregistrer dans l'historique
             self.optimization_history.append(
@@ -280,6 +389,8 @@ class OptunaOptimizer:
 
             return score
 
+        except optuna.TrialPruned:
+            raise
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Erreur trial {trial.number}: {e}")
@@ -306,7 +417,10 @@ class OptunaOptimizer:
             self.logger.info(f"Direction: {self.direction}")
             self.logger.info(f"Sampler: {type(self.sampler).__name__}")
             self.logger.info(f"Pruner: {type(self.pruner).__name__}")
-            self.logger.info(f"Parallel jobs: {self.n_jobs}")
+            if self.n_workers > 1:
+                self.logger.info(f"Worker processes: {self.n_workers}")
+            else:
+                self.logger.info(f"Parallel jobs: {self.n_jobs}")
             self.logger.info(f"Storage: {self.storage}\n")
 
         # Callback personnalisé pour la progression
@@ -324,14 +438,21 @@ class OptunaOptimizer:
 
         # Lancer l'optimisation
         try:
-            self.study.optimize(
-                self._objective_wrapper,
-                n_trials=self.n_trials,
-                timeout=self.timeout,
-                n_jobs=self.n_jobs,
-                show_progress_bar=self.show_progress,
-                callbacks=[_progress_callback] if progress_callback else None,
-            )
+            if self.n_workers > 1:
+                self._optimize_processes(progress_callback)
+            else:
+                self.study.optimize(
+                    self._objective_wrapper,
+                    n_trials=self.n_trials,
+                    timeout=self.timeout,
+                    n_jobs=self.n_jobs,
+                    show_progress_bar=self.show_progress,
+                    callbacks=(
+                        [_progress_callback, self._stop_callback]
+                        if progress_callback
+                        else [self._stop_callback]
+                    ),
+                )
 
             # Récupérer les meilleurs résultats
             self.best_params = self.study.best_params
@@ -379,6 +500,82 @@ class OptunaOptimizer:
                 "interrupted": True,
             }
 
+    def stop(self):
+        """
+        Demande l'arrêt de l'optimisation en cours (appelable depuis un autre
+        thread): les trials en cours se terminent, aucun nouveau n'est lancé
+        """
+        self._stop_event.set()
+        if self.n_workers > 1:
+            # Les workers process lisent le drapeau dans l'étude partagée
+            self.study.set_user_attr(_STOP_ATTR, True)
+
+    def _stop_callback(self, study, trial):
+        """Callback Optuna: arrête l'étude si un arrêt a été demandé"""
+        if self._stop_event.is_set() or (
+            self.n_workers > 1 and study.user_attrs.get(_STOP_ATTR)
+        ):
+            study.stop()
+
+    def _optimize_processes(
+        self, progress_callback: Optional[Callable[[float, int], None]] = None
+    ):
+        """
+        Répartit les trials entre n_workers process partageant l'étude
+
+        Chaque process charge l'étude depuis le storage et y enregistre ses
+        trials: le sampler de chaque worker voit les résultats des autres.
+        """
+        base, extra = divmod(self.n_trials, self.n_workers)
+        shares = [base + (i < extra) for i in range(self.n_workers)]
+        shares = [n for n in shares if n > 0]
+
+        worker_kwargs = {
+            "objective_func": self.objective_func,
+            "param_grid": self.param_grid,
+            "timeout": self.timeout,
+            "direction": self.direction,
+            "study_name": self.study_name,
+            "storage": self.storage,
+            "sampler_type": self.sampler_type,
+            "pruner_type": self.pruner_type,
+            "n_workers": len(shares),
+        }
+
+        finished = (
+            optuna.trial.TrialState.COMPLETE,
+            optuna.trial.TrialState.PRUNED,
+            optuna.trial.TrialState.FAIL,
+        )
+        n_before = len(self.study.get_trials(deepcopy=False, states=finished))
+        self.study.set_user_attr(_STOP_ATTR, self._stop_event.is_set())
+        start_time = time.time()
+
+        with ProcessPoolExecutor(max_workers=len(shares)) as executor:
+            # Graine distincte par worker: sinon tous tirent les mêmes points
+            futures = [
+                executor.submit(_run_study_worker, n, self.seed + i, **worker_kwargs)
+                for i, n in enumerate(shares)
+            ]
+
+            pending = futures
+            while pending:
+                _, pending = wait(pending, timeout=1.0)
+
+                if progress_callback:
+                    done = (
+                        len(self.study.get_trials(deepcopy=False, states=finished))
+                        - n_before
+                    )
+                    eta = 0
+                    if done > 0:
+                        elapsed = time.time() - start_time
+                        eta = elapsed / done * max(self.n_trials - done, 0)
+                    progress_callback(min(done / self.n_trials, 1.0), int(eta))
+
+        for future in futures:
+            self.optimization_history.extend(future.result())
+
     def get_importance(self) -> Dict[str, float]:
         """Retourne l'importance des paramètres"""
         try:
@@ -11,6 +11,11 @@ from monitoring.logger import setup_logger
 
 logger = setup_logger("results_storage")
 
+# Résultats détaillés: Parquet (colonnes relisibles séparément), CSV pour
+# les runs enregistrés avant le passage au Parquet
+RESULTS_PARQUET = "results.parquet"
+RESULTS_CSV = "results.csv"
+
 
 class ResultsStorage:
     """Gère le stockage et l'historique des résultats d'optimisation"""
@@ -87,12 +92,13 @@ class ResultsStorage:
             with open(config_file, "w", encoding="utf-8") as f:
                 json.dump(config, f, indent=2, ensure_ascii=False)
 
-            # Sauvegarder les résultats détaillés en CSV
+            # Sauvegarder les résultats détaillés en Parquet
             if "all_results" in results and results["all_results"]:
-                results_df = pd.DataFrame(results["all_results"])
-                results_csv = run_dir / "results.csv"
-                results_df.to_csv(results_csv, index=False)
-                logger.info(f"  ✓ {len(results_df)} résultats sauvegardés en CSV")
+                results_df = self._to_storable(pd.DataFrame(results["all_results"]))
+                results_df.to_parquet(
+                    run_dir / RESULTS_PARQUET, index=False, compression="zstd"
+                )
+                logger.info(f"  ✓ {len(results_df)} résultats sauvegardés en Parquet")
 
             # Créer un résumé
             summary = self._create_summary(config, results, optimization_type)
@@ -208,11 +214,8 @@ class ResultsStorage:
             with open(run_dir / "summary.json", "r", encoding="utf-8") as f:
                 summary = json.load(f)
 
-            # Charger results CSV si existe
-            results_csv = run_dir / "results.csv"
-            results_df = None
-            if results_csv.exists():
-                results_df = pd.read_csv(results_csv)
+            # Charger les résultats détaillés si existants
+            results_df = self.load_results(run_id)
 
             data = {
                 "run_id": run_id,
@@ -229,7 +232,52 @@ class ResultsStorage:
             logger.error(f"Erreur lors du chargement du run: {e}")
             return None
 
-    def list_runs(self, filters: Optional[Dict] = None) -> List[Dict]:
+    def load_results(
+        self, run_id: str, columns: Optional[List[str]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Charge les résultats détaillés d'un run
+
+        Args:
+            run_id: ID du run
+            columns: Colonnes à charger (None = toutes). Avec le Parquet,
+                seules ces colonnes sont lues sur disque
+
+        Returns:
+            DataFrame des résultats ou None si le run n'en a pas
+        """
+        run_dir = self.details_dir / run_id
+
+        results_parquet = run_dir / RESULTS_PARQUET
+        if results_parquet.exists():
+            return pd.read_parquet(results_parquet, columns=columns)
+
+        results_csv = run_dir / RESULTS_CSV
+        if results_csv.exists():
+            return pd.read_csv(results_csv, usecols=columns)
+
+        return None
+
+    @staticmethod
+    def _to_storable(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convertit en texte les valeurs imbriquées (dict, list), comme le
+        faisait l'export CSV: la relecture reste identique
+        """
+        nested = (dict, list, tuple)
+        converted = {
+            col: df[col].map(lambda v: str(v) if isinstance(v, nested) else v)
+            for col in df.columns[df.dtypes == object]
+            if df[col].map(lambda v: isinstance(v, nested)).any()
+        }
+        return df.assign(**converted) if converted else df
+
+    def list_runs(
+        self,
+        filters: Optional[Dict] = None,
+        limit: Optional[int] = None,
+        order: str = "asc",
+    ) -> List[Dict]:
         """
         Liste tous les runs avec filtres optionnels
 
@@ -242,10 +290,15 @@ class ResultsStorage:
                 - start_date: str (YYYY-MM-DD)
                 - end_date: str (YYYY-MM-DD)
                 - type: str (grid_search, walk_forward, etc.)
+            limit: Nombre maximum de runs retournés (None = tous)
+            order: 'asc' (plus anciens d'abord) ou 'desc' (plus récents d'abord)
 
         Returns:
             Liste de runs filtrés
         """
+        if order not in ("asc", "desc"):
+            raise ValueError(f"order invalide: {order!r} (attendu 'asc' ou 'desc')")
+
         try:
             with open(self.history_file, "r", encoding="utf-8") as f:
                 history = json.load(f)
@@ -253,7 +306,7 @@ class ResultsStorage:
             runs = history.get("runs", [])
 
             if not filters:
-                return runs
+                return self._slice_runs(runs, limit, order)
 
             # Appliquer les filtres
             filtered = runs
@@ -311,12 +364,21 @@ class ResultsStorage:
                 ]
 
             logger.info(f"Runs listés: {len(filtered)}/{len(runs)} (avec filtres)")
-            return filtered
+            return self._slice_runs(filtered, limit, order)
 
         except Exception as e:
             logger.error(f"Erreur lors du listing: {e}")
             return []
 
+    @staticmethod
+    def _slice_runs(runs: List[Dict], limit: Optional[int], order: str) -> List[Dict]:
+        """Applique l'ordre et la limite (l'historique est stocké par ordre d'ajout)"""
+        if order == "desc":
+            if limit is None:
+                return runs[::-1]
+            return runs[: -limit - 1 : -1] if limit > 0 else []
+        return runs if limit is None else runs[:limit]
+
     def compare_runs(self, run_ids: List[str]) -> Optional[pd.DataFrame]:
         """
         Compare plusieurs runs
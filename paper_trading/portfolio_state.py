@@ -9,6 +9,7 @@ from pathlib import Path
 from datetime import datetime
 import threading
 import time
+from config.settings import ensure_dir
 from monitoring.logger import setup_logger
 
 logger = setup_logger("portfolio_state")
@@ -28,8 +29,8 @@ class PortfolioStateManager:
             config: Configuration du paper trading
         """
         self.config = config["portfolio_state"]
+        # Création paresseuse du dossier à la première sauvegarde
         self.backup_dir = Path(self.config["backup_dir"])
-        self.backup_dir.mkdir(parents=True, exist_ok=True)
 
         # État actuel
         self.current_state = {
@@ -105,6 +106,8 @@ class PortfolioStateManager:
         """Sauvegarde l'état actuel"""
         try:
             with self._lock:
+                ensure_dir(self.backup_dir)
+
                 # Créer le nom de fichier
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"portfolio_state_{timestamp}.json"
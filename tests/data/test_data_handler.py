@@ -3,7 +3,9 @@ import sys
 from pathlib import Path
 import pytest
 import pandas as pd
+import os
 import pickle
+from collections import OrderedDict
 from unittest.mock import patch, MagicMock, mock_open
 
 # Add the project root to the Python path to allow for absolute imports
@@ -223,16 +225,18 @@ class TestDataHandler:
             "Impossible de sauvegarder le cache: Disk full"
         )
 
-    def test_load_from_cache_exception_error(self, mocker, mock_logger_autouse):
+    def test_load_from_cache_exception_error(
+        self, mocker, mock_logger_autouse, tmp_path
+    ):
         """Test error case when loading a corrupted cache file."""
-        mocker.patch("pathlib.Path.exists", return_value=True)
         mocker.patch(
             "data.data_handler.pickle.load",
             side_effect=pickle.UnpicklingError("Corrupted file"),
         )
-        mocker.patch("builtins.open", mock_open(read_data=b"corrupted"))
 
         handler = DataHandler()
+        handler.cache_dir = tmp_path
+        (tmp_path / "CORRUPT_2023-01-01_2023-01-03_1d.pkl").write_bytes(b"corrupted")
         result = handler._load_from_cache("CORRUPT", "2023-01-01", "2023-01-03", "1d")
 
         assert result is None
@@ -240,6 +244,81 @@ class TestDataHandler:
             "Cache non disponible: Corrupted file"
         )
 
+    def test_load_from_cache_memory_hit(self, mocker, standardized_df, tmp_path):
+        """Test that saved data is served from memory without reading the file."""
+        handler = DataHandler()
+        handler.cache_dir = tmp_path
+        handler._save_to_cache(standardized_df, "MEM", "2023-01-01", "2023-01-03", "1d")
+
+        mock_load = mocker.patch("data.data_handler.pickle.load")
+        other = DataHandler()
+        other.cache_dir = tmp_path
+        result = other._load_from_cache("MEM", "2023-01-01", "2023-01-03", "1d")
+
+        mock_load.assert_not_called()
+        pd.testing.assert_frame_equal(result, standardized_df)
+        assert result is not standardized_df
+
+    def test_memory_cache_evicts_least_recently_used(
+        self, mocker, standardized_df, tmp_path
+    ):
+        """Test that the memory cache is bounded and evicts the LRU entry."""
+        mocker.patch.object(DataHandler, "MEMORY_CACHE_MAX_ENTRIES", 2)
+        mocker.patch.object(DataHandler, "_memory_cache", OrderedDict())
+
+        handler = DataHandler()
+        handler.cache_dir = tmp_path
+        handler._save_to_cache(standardized_df, "A", "2023-01-01", "2023-01-03", "1d")
+        handler._save_to_cache(standardized_df, "B", "2023-01-01", "2023-01-03", "1d")
+        # Reading A again makes B the least recently used entry
+        handler._load_from_cache("A", "2023-01-01", "2023-01-03", "1d")
+        handler._save_to_cache(standardized_df, "C", "2023-01-01", "2023-01-03", "1d")
+
+        cached = [path.name for path in DataHandler._memory_cache]
+        assert cached == [
+            "A_2023-01-01_2023-01-03_1d.pkl",
+            "C_2023-01-01_2023-01-03_1d.pkl",
+        ]
+
+    def test_load_from_cache_memory_stale_after_rewrite(
+        self, standardized_df, tmp_path
+    ):
+        """Test that a cache file rewritten on disk is read again."""
+        handler = DataHandler()
+        handler.cache_dir = tmp_path
+        handler._save_to_cache(standardized_df, "NEW", "2023-01-01", "2023-01-03", "1d")
+
+        cache_file = handler._get_cache_filename(
+            "NEW", "2023-01-01", "2023-01-03", "1d"
+        )
+        rewritten = standardized_df * 2
+        with open(cache_file, "wb") as f:
+            pickle.dump(rewritten, f)
+        stat = cache_file.stat()
+        os.utime(cache_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        result = handler._load_from_cache("NEW", "2023-01-01", "2023-01-03", "1d")
+
+        pd.testing.assert_frame_equal(result, rewritten)
+
+    def test_load_from_cache_memory_evicted_when_file_removed(
+        self, standardized_df, tmp_path
+    ):
+        """Test that a removed cache file is not served from memory."""
+        handler = DataHandler()
+        handler.cache_dir = tmp_path
+        handler._save_to_cache(standardized_df, "DEL", "2023-01-01", "2023-01-03", "1d")
+
+        cache_file = handler._get_cache_filename(
+            "DEL", "2023-01-01", "2023-01-03", "1d"
+        )
+        cache_file.unlink()
+
+        result = handler._load_from_cache("DEL", "2023-01-01", "2023-01-03", "1d")
+
+        assert result is None
+        assert cache_file not in DataHandler._memory_cache
+
     def test_fetch_multiple_nominal(self, mocker, standardized_df, mock_logger_autouse):
         """Test nominal case for fetching multiple symbols."""
         handler = DataHandler(cache_enabled=False)
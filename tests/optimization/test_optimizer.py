@@ -455,7 +455,7 @@ class TestGridSearch:
         # Mock Pool
         mock_pool = mocker.MagicMock()
         mock_pool.__enter__.return_value = mock_pool
-        mock_pool.starmap.return_value = [mock_backtest_result] * 9  # 3x3 grid
+        mock_pool.imap.return_value = [mock_backtest_result] * 9  # 3x3 grid
         mocker.patch("optimization.optimizer.Pool", return_value=mock_pool)
         mocker.patch("optimization.optimizer.cpu_count", return_value=4)
 
@@ -465,6 +465,55 @@ class TestGridSearch:
         assert result is not None
         assert "best" in result
 
+    def test_grid_search_stops_when_requested(self, optimizer, mocker):
+        """Test l'arrêt du grid search séquentiel après stop()."""
+        mock_backtest_result = {"period": 20, "sharpe": 1.5, "return": 10.0}
+
+        def backtest_then_stop(params):
+            optimizer.stop()
+            return mock_backtest_result
+
+        run_mock = mocker.patch.object(
+            optimizer, "_run_single_backtest", side_effect=backtest_then_stop
+        )
+        mocker.patch.object(optimizer, "_preload_data", return_value={})
+        mocker.patch.object(
+            optimizer, "_analyze_results", return_value={"best": mock_backtest_result}
+        )
+        mocker.patch.object(optimizer, "_save_results")
+
+        optimizer._grid_search()
+
+        assert run_mock.call_count == 1
+
+    def test_grid_search_parallel_stops_when_requested(self, optimizer, mocker):
+        """Test l'arrêt du grid search parallèle après stop()."""
+        mock_backtest_result = {"period": 20, "sharpe": 1.5, "return": 10.0}
+
+        def results():
+            for _ in range(9):
+                yield mock_backtest_result
+                optimizer.stop()
+
+        mocker.patch.object(
+            optimizer, "_preload_data", return_value={"AAPL": pd.DataFrame()}
+        )
+        mocker.patch.object(
+            optimizer, "_analyze_results", return_value={"best": mock_backtest_result}
+        )
+        mocker.patch.object(optimizer, "_save_results")
+
+        mock_pool = mocker.MagicMock()
+        mock_pool.__enter__.return_value = mock_pool
+        mock_pool.imap.return_value = results()
+        mocker.patch("optimization.optimizer.Pool", return_value=mock_pool)
+        mocker.patch("optimization.optimizer.cpu_count", return_value=4)
+
+        optimizer._grid_search_parallel()
+
+        # Le 2e résultat reçu après stop() est gardé, les suivants ignorés
+        assert len(optimizer.results) == 2
+
     def test_grid_search_parallel_with_exception(self, optimizer, mocker):
         """Test le grid search parallèle avec exception (fallback séquentiel)."""
         mocker.patch.object(optimizer, "_preload_data", return_value={})
@@ -542,6 +591,36 @@ class TestWalkForward:
         assert result is not None
 
 
+    def test_walk_forward_stop_forwards_to_in_sample(self, optimizer, mocker):
+        """Test que stop() arrête l'optimiseur In-Sample et les périodes suivantes."""
+        period = {
+            "in_sample": ("2020-01-01", "2020-06-30"),
+            "out_sample": ("2020-07-01", "2020-09-30"),
+        }
+        mocker.patch.object(
+            optimizer, "_generate_walk_forward_periods", return_value=[period] * 3
+        )
+
+        mock_in_sample_opt = mocker.MagicMock()
+        mock_in_sample_opt.run.side_effect = lambda: optimizer.stop()
+        mocker.patch(
+            "optimization.optimizer.UnifiedOptimizer", return_value=mock_in_sample_opt
+        )
+        mocker.patch.object(
+            optimizer, "_analyze_walk_forward_results", return_value={"best": {}}
+        )
+
+        optimizer.config["walk_forward"] = {
+            "in_sample_months": 6,
+            "out_sample_months": 3,
+        }
+
+        optimizer._walk_forward()
+
+        mock_in_sample_opt.stop.assert_called_once()
+        assert mock_in_sample_opt.run.call_count == 1
+
+
 class TestOptunaOptimization:
     """Tests pour l'optimisation Optuna."""
 
@@ -9,6 +9,17 @@ from datetime import datetime
 from optimization.optuna_optimizer import OptunaOptimizer, create_optuna_optimizer
 
 
+def _quadratic_objective(params):
+    """Objectif sérialisable (niveau module) pour les workers process"""
+    return -((params["param1"] - 20) ** 2)
+
+
+def _stepwise_objective(params):
+    """Objectif à valeurs intermédiaires (une par étape), élaguable"""
+    for step in range(10):
+        yield params["param1"] * (step + 1)
+
+
 @pytest.fixture
 def mock_objective_func():
     """Fixture pour une fonction objectif mock"""
@@ -135,6 +146,25 @@ class TestOptunaOptimizer:
             mock_storage_dir.mkdir.assert_called_once_with(parents=True, exist_ok=True)
             mock_storage_dir.__truediv__.assert_called_once_with("optuna.db")
 
+    def test_init_creates_custom_sqlite_directory(
+        self, mock_objective_func, simple_param_grid, tmp_path
+    ):
+        """Test que le dossier d'une URL SQLite fournie est créé"""
+        db_path = tmp_path / "studies" / "nested" / "optuna.db"
+
+        with patch(
+            "optimization.optuna_optimizer.optuna.create_study"
+        ) as mock_create_study:
+            mock_create_study.return_value = Mock()
+
+            OptunaOptimizer(
+                objective_func=mock_objective_func,
+                param_grid=simple_param_grid,
+                storage=f"sqlite:///{db_path}",
+            )
+
+        assert db_path.parent.is_dir()
+
     def test_create_sampler_tpe(self):
         """Test la création d'un sampler TPE"""
         with patch("optimization.optuna_optimizer.optuna.create_study"):
@@ -194,6 +224,31 @@ class TestOptunaOptimizer:
 
             assert isinstance(optimizer.pruner, SuccessiveHalvingPruner)
 
+    def test_asha_pruner_prunes_stepwise_trials(self, tmp_path):
+        """Test que 'asha' (SuccessiveHalving) élague réellement des trials"""
+        optimizer = OptunaOptimizer(
+            objective_func=_stepwise_objective,
+            param_grid={"param1": list(range(1, 21))},
+            n_trials=30,
+            storage=f"sqlite:///{tmp_path / 'optuna.db'}",
+            pruner_type="asha",
+            n_jobs=1,
+            show_progress=False,
+        )
+
+        from optuna.pruners import SuccessiveHalvingPruner
+
+        assert isinstance(optimizer.pruner, SuccessiveHalvingPruner)
+
+        result = optimizer.optimize()
+
+        states = [trial.state for trial in optimizer.study.trials]
+        n_pruned = states.count(optuna.trial.TrialState.PRUNED)
+        assert n_pruned > 0
+        # Seuls les trials menés à terme sont dans l'historique
+        assert len(result["optimization_history"]) == len(states) - n_pruned
+        assert result["best_params"]["param1"] == 20
+
     def test_create_pruner_none(self):
         """Test la création d'un pruner None"""
         with patch("optimization.optuna_optimizer.optuna.create_study"):
@@ -613,6 +668,44 @@ class TestOptunaOptimizer:
             assert result["interrupted"] is True
             mock_logger.warning.assert_called_once()
 
+    def test_optimize_with_worker_processes(self, simple_param_grid, tmp_path):
+        """Test l'optimisation répartie entre plusieurs process"""
+        optimizer = OptunaOptimizer(
+            objective_func=_quadratic_objective,
+            param_grid=simple_param_grid,
+            n_trials=6,
+            storage=f"sqlite:///{tmp_path / 'optuna.db'}",
+            n_workers=2,
+            show_progress=False,
+        )
+        mock_callback = Mock()
+
+        result = optimizer.optimize(progress_callback=mock_callback)
+
+        # Les trials des deux workers sont dans l'étude partagée
+        assert result["n_trials"] == 6
+        assert len(result["optimization_history"]) == 6
+        assert result["best_params"]["param1"] in simple_param_grid["param1"]
+        assert mock_callback.call_args[0][0] == 1.0
+
+    def test_stop_ends_optimization_after_running_trial(
+        self, simple_param_grid, tmp_path
+    ):
+        """Test l'arrêt demandé via stop(): plus aucun nouveau trial"""
+        optimizer = OptunaOptimizer(
+            objective_func=_quadratic_objective,
+            param_grid=simple_param_grid,
+            n_trials=10,
+            storage=f"sqlite:///{tmp_path / 'optuna.db'}",
+            n_jobs=1,
+            show_progress=False,
+        )
+
+        optimizer.stop()
+        result = optimizer.optimize()
+
+        assert result["n_trials"] == 1
+
     def test_optimize_with_empty_trials_after_interrupt(
         self, mock_objective_func, simple_param_grid
     ):
@@ -0,0 +1,99 @@
+# test_fix.py
+"""
+Le kernel Numba du diagnostic RSI doit reproduire bt.indicators.RSI
+"""
+
+import backtrader as bt
+import numpy as np
+import pandas as pd
+import pytest
+
+import fix
+
+RSI_PERIOD = 10
+RSI_OVERSOLD = 40
+RSI_OVERBOUGHT = 60
+
+
+@pytest.fixture
+def price_df():
+    """Marche aléatoire fixe (seed) avec des phases haussières et baissières"""
+    rng = np.random.default_rng(42)
+    dates = pd.date_range(start="2024-01-01", periods=200)
+    prices = 100 + np.cumsum(rng.normal(0, 1.5, size=200))
+    df = pd.DataFrame(
+        {
+            "open": prices,
+            "high": prices + 0.5,
+            "low": prices - 0.5,
+            "close": prices,
+            "volume": 100000,
+        },
+        index=dates,
+    )
+    df.index.name = "datetime"
+    return df
+
+
+@pytest.fixture
+def backtrader_diagnostic(price_df):
+    """RSIDiagnostic exécuté par Cerebro sur price_df (référence backtrader)"""
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.adddata(bt.feeds.PandasData(dataname=price_df))
+    cerebro.addstrategy(
+        fix.RSIDiagnostic,
+        rsi_period=RSI_PERIOD,
+        rsi_oversold=RSI_OVERSOLD,
+        rsi_overbought=RSI_OVERBOUGHT,
+        report=False,
+    )
+    return cerebro.run()[0]
+
+
+def test_rsi_kernel_matches_backtrader(price_df, backtrader_diagnostic):
+    strat = backtrader_diagnostic
+    close = price_df["close"].to_numpy(dtype=np.float64)
+
+    rsi, oversold_days, overbought_days, _ = fix._rsi_kernel(RSI_PERIOD)(
+        close,
+        np.array([RSI_OVERSOLD], dtype=np.float64),
+        np.array([RSI_OVERBOUGHT], dtype=np.float64),
+        fix.RSI_BINS,
+    )
+
+    # Chauffe: pas de RSI avant l'indice `period`
+    assert np.isnan(rsi[:RSI_PERIOD]).all()
+    rsi_values = rsi[RSI_PERIOD:]
+
+    assert len(rsi_values) == strat.total_days == strat.rsi_ready_days
+    np.testing.assert_allclose(
+        rsi_values, strat.rsi_history[: strat._rsi_idx], rtol=1e-9
+    )
+    assert oversold_days[0] == strat.oversold_days > 0
+    assert overbought_days[0] == strat.overbought_days > 0
+
+
+def test_diagnose_rsi_reports_backtrader_counts(
+    mocker, price_df, backtrader_diagnostic
+):
+    strat = backtrader_diagnostic
+    mocker.patch("data.data_handler.DataHandler.__init__", return_value=None)
+    mocker.patch("data.data_handler.DataHandler.fetch_data", return_value=price_df)
+    report = mocker.patch("fix.print_diagnostic_report")
+
+    fix.diagnose_rsi(
+        rsi_period=RSI_PERIOD,
+        rsi_oversold=RSI_OVERSOLD,
+        rsi_overbought=RSI_OVERBOUGHT,
+    )
+
+    total_days, rsi_values, oversold_days, overbought_days, buy_signals, *_ = (
+        report.call_args[0]
+    )
+    assert total_days == strat.total_days
+    np.testing.assert_allclose(
+        rsi_values, strat.rsi_history[: strat._rsi_idx], rtol=1e-9
+    )
+    assert oversold_days == strat.oversold_days
+    assert overbought_days == strat.overbought_days
+    assert buy_signals == strat.buy_signals
@@ -0,0 +1,46 @@
+# test_main.py
+
+import pytest
+from main import parse_symbol_weights
+
+
+@pytest.mark.parametrize(
+    "weights_str, expected",
+    [
+        ("AAPL:0.4,MSFT:0.6", {"AAPL": 0.4, "MSFT": 0.6}),
+        (" AAPL : 0.4 , MSFT:0.6 ", {"AAPL": 0.4, "MSFT": 0.6}),
+        ("AAPL:1e-1,MSFT:0.9", {"AAPL": 0.1, "MSFT": 0.9}),
+        ("^GSPC:0.5,EURUSD=X:0.5", {"^GSPC": 0.5, "EURUSD=X": 0.5}),
+        ("AAPL:0,MSFT:1", {"AAPL": 0.0, "MSFT": 1.0}),
+    ],
+)
+def test_parse_symbol_weights_nominal(weights_str, expected):
+    assert parse_symbol_weights(weights_str) == pytest.approx(expected)
+
+
+def test_parse_symbol_weights_normalizes_to_one():
+    weights = parse_symbol_weights("AAPL:1,MSFT:3")
+    assert weights == pytest.approx({"AAPL": 0.25, "MSFT": 0.75})
+
+
+@pytest.mark.parametrize("weights_str", ["", None])
+def test_parse_symbol_weights_empty_returns_none(weights_str):
+    assert parse_symbol_weights(weights_str) is None
+
+
+@pytest.mark.parametrize(
+    "weights_str, message",
+    [
+        ("AAPL,MSFT:1", "mal formé"),
+        (":0.5,MSFT:0.5", "mal formé"),
+        ("AAPL:0.4x,MSFT:0.6", "invalide"),
+        ("AAPL:-0.5,MSFT:1.5", "invalide"),
+        ("AAPL:nan,MSFT:0.5", "invalide"),
+        ("AAPL:inf", "invalide"),
+        ("AAPL:0.5,AAPL:0.5", "répété"),
+        ("AAPL:0,MSFT:0", "somme"),
+    ],
+)
+def test_parse_symbol_weights_invalid_raises(weights_str, message):
+    with pytest.raises(ValueError, match=message):
+        parse_symbol_weights(weights_str)